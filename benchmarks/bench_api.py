@@ -0,0 +1,401 @@
+"""Throughput and latency of the API hot paths on a reproducible dataset.
+
+Seeds the configured database with the seeders (the data of the seeded tables
+is replaced), then drives the application in-process through AsyncTestClient
+with concurrent clients and reports requests per second and p50/p95/p99
+latency of every scenario:
+
+- list: events list, following next_cursor page after page
+- detail: details of events picked across the dataset
+- search: events search by city, category and price range, sorted by date or price
+- registration: registrations of profiles for open events they are not registered for
+
+The dataset depends only on --scale and --seed, with dates relative to the
+start of the day of the run so that events stay upcoming, and the requests
+are drawn from --seed, so two runs issue the same requests against the same
+rows. List and detail go through the
+event response cache like in production. Results are written as JSON; pass
+--baseline with the results of another branch to compare, the run fails when
+a p95 latency regressed by more than --threshold.
+
+Run from the repository root against a migrated database:
+
+    python -m benchmarks.bench_api --scale 0.5 --requests 500 --concurrency 8
+    python -m benchmarks.bench_api --skip-seed --baseline benchmarks/results/main.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+from collections import Counter
+from collections.abc import Callable
+from dataclasses import asdict, dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any, Final
+
+from litestar.testing import AsyncTestClient
+from sqlalchemy import select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.infrastructure.database.config import get_engine, get_sqlalchemy_config
+from src.infrastructure.database.models import (
+    Category,
+    Event,
+    EventRegistration,
+    Location,
+    Profile,
+    User,
+)
+from src.infrastructure.database.models.event_model import event_registration_open
+from src.infrastructure.database.seeders.base_seeder import SeedOptions
+from src.infrastructure.database.seeders.run_seeder import run as run_seeders
+from src.infrastructure.dependencies.dependencies import event_cache, token_service
+from src.main import app
+
+API: Final[str] = "/api/v1"
+RESULTS_DIR: Final[Path] = Path(__file__).parent / "results"
+SCENARIOS: Final[tuple[str, ...]] = ("list", "detail", "search", "registration")
+PERCENTILES: Final[tuple[int, ...]] = (50, 95, 99)
+
+Request = tuple[str, str, dict[str, str]]
+
+
+@dataclass
+class ScenarioResult:
+    """Measurements of a scenario.
+
+    Attributes:
+        requests: Measured requests, warm-up excluded
+        concurrency: Concurrent clients
+        seconds: Wall time of the measured requests
+        throughput: Requests per second
+        latency_ms: Mean, max and percentiles of the latency, in milliseconds
+        statuses: Responses by status code
+
+    """
+
+    requests: int
+    concurrency: int
+    seconds: float
+    throughput: float
+    latency_ms: dict[str, float]
+    statuses: dict[str, int] = field(default_factory=dict)
+
+
+def percentile(values: list[float], rank: float) -> float:
+    """Return the nearest-rank percentile of sorted values."""
+    index = max(int(len(values) * rank / 100 + 0.5) - 1, 0)
+    return values[min(index, len(values) - 1)]
+
+
+def summarize(latencies: list[float]) -> dict[str, float]:
+    """Return the mean, max and percentiles of latencies in seconds, in milliseconds."""
+    values = sorted(latencies)
+    summary = {f"p{rank}": percentile(values, rank) for rank in PERCENTILES}
+    summary["mean"] = sum(values) / len(values)
+    summary["max"] = values[-1]
+    return {key: round(value * 1000, 3) for key, value in summary.items()}
+
+
+async def seed(scale: float, seed_value: int) -> dict[str, int]:
+    """Seed the dataset and return the loaded rows by table."""
+    # Seeded dates are relative to this time, the same for all runs of a day.
+    now = datetime.now(UTC).replace(tzinfo=None, hour=0, minute=0, second=0, microsecond=0)
+    results = await run_seeders(SeedOptions(scale=scale, seed=seed_value, now=now))
+    return {result.table: result.rows for result in results}
+
+
+async def build_requests(
+    session: AsyncSession, rng: random.Random, count: int
+) -> dict[str, Callable[[int], Request]]:
+    """Build the request factory of every scenario from the seeded rows.
+
+    Args:
+        session: Session of the benchmarked database
+        rng: Source of the drawn ids and filters
+        count: Requests per scenario, warm-up included
+
+    Returns:
+        Factories of the method, URL and headers of the n-th request, by scenario
+
+    """
+    event_ids = list(await session.scalars(select(Event.id).order_by(Event.id)))
+    cities = list(await session.scalars(select(Location.city).distinct().order_by(Location.city)))
+    category_ids = list(await session.scalars(select(Category.id).order_by(Category.id)))
+    if not event_ids:
+        raise SystemExit("The database has no events, run without --skip-seed.")
+
+    detail_ids = [rng.choice(event_ids) for _ in range(count)]
+    searches = []
+    for _ in range(count):
+        params = rng.choice(
+            [
+                {"city": rng.choice(cities)},
+                {"category_id": str(rng.choice(category_ids))},
+                {"min_price": "10", "max_price": str(rng.randrange(20, 200))},
+            ]
+        )
+        params["sort"] = rng.choice(["start_date", "price"])
+        searches.append("&".join(f"{key}={value}" for key, value in params.items()))
+
+    registrations = await draw_registrations(session, rng, count)
+
+    def registration(n: int) -> Request:
+        user, event_id = registrations[n % len(registrations)]
+        headers = {"Authorization": f"Bearer {token_service.issue(user)}"}
+        return "POST", f"{API}/events/{event_id}/registrations", headers
+
+    return {
+        "detail": lambda n: ("GET", f"{API}/events/{detail_ids[n]}", {}),
+        "search": lambda n: ("GET", f"{API}/events/search?limit=20&{searches[n]}", {}),
+        "registration": registration,
+    }
+
+
+async def draw_registrations(
+    session: AsyncSession, rng: random.Random, count: int
+) -> list[tuple[User, int]]:
+    """Draw distinct pairs of a user with a profile and an open event it is not registered for."""
+    open_event_ids = list(
+        await session.scalars(select(Event.id).where(event_registration_open).order_by(Event.id))
+    )
+    profiles = (
+        await session.execute(
+            select(Profile.id, User)
+            .join(User, Profile.user_id == User.id)
+            .where(User.is_active)
+            .order_by(Profile.id)
+        )
+    ).all()
+    if not open_event_ids or not profiles:
+        raise SystemExit("The dataset has no open event or no active profile to register.")
+
+    candidates = {
+        (rng.randrange(len(profiles)), rng.choice(open_event_ids)) for _ in range(count * 4)
+    }
+    pairs = sorted((profiles[index][0], event_id) for index, event_id in candidates)
+    registered = set(
+        (
+            await session.execute(
+                select(EventRegistration.profile_id, EventRegistration.event_id).where(
+                    tuple_(EventRegistration.profile_id, EventRegistration.event_id).in_(pairs)
+                )
+            )
+        ).all()
+    )
+    users = {profile_id: user for profile_id, user in profiles}
+    free = [
+        (users[profile_id], event_id)
+        for profile_id, event_id in pairs
+        if (profile_id, event_id) not in registered
+    ]
+    rng.shuffle(free)
+    return free[:count]
+
+
+async def run_scenario(
+    client: AsyncTestClient,
+    next_request: Callable[[int], Request],
+    requests: int,
+    warmup: int,
+    concurrency: int,
+) -> ScenarioResult:
+    """Send the warm-up then the measured requests with concurrent clients.
+
+    Args:
+        client: Client of the application
+        next_request: Factory of the method, URL and headers of the n-th request
+        requests: Measured requests
+        warmup: Requests sent before measuring, to fill caches and pools
+        concurrency: Concurrent clients
+
+    Returns:
+        Throughput, latency and statuses of the measured requests
+
+    """
+    latencies: list[float] = []
+    statuses: Counter[str] = Counter()
+    counter = iter(range(warmup + requests))
+
+    async def worker() -> None:
+        for n in counter:
+            method, url, headers = next_request(n)
+            started = time.perf_counter()
+            response = await client.request(method, url, headers=headers)
+            elapsed = time.perf_counter() - started
+            if n >= warmup:
+                latencies.append(elapsed)
+                statuses[str(response.status_code)] += 1
+
+    for _ in range(warmup):
+        method, url, headers = next_request(next(counter))
+        await client.request(method, url, headers=headers)
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    seconds = time.perf_counter() - started
+    return ScenarioResult(
+        requests=requests,
+        concurrency=concurrency,
+        seconds=round(seconds, 3),
+        throughput=round(requests / seconds, 1),
+        latency_ms=summarize(latencies),
+        statuses=dict(sorted(statuses.items())),
+    )
+
+
+async def walk_pages(client: AsyncTestClient, count: int) -> list[str]:
+    """Return the URLs of the first pages of the events list, back to the first page at the end.
+
+    Pages are requested to get their cursors, the cached lists are then dropped
+    so that the scenario reads them from the database.
+    """
+    urls: list[str] = []
+    cursor: str | None = None
+    while len(urls) < count:
+        url = f"{API}/events?limit=20" + (f"&cursor={cursor}" if cursor else "")
+        urls.append(url)
+        cursor = (await client.get(url)).json().get("next_cursor")
+    await event_cache.invalidate(())
+    return urls
+
+
+def git_revision() -> dict[str, Any]:
+    """Return the commit, branch and dirtiness of the working tree, empty outside git."""
+
+    def git(*args: str) -> str:
+        return subprocess.run(  # noqa: S603
+            ["git", *args],  # noqa: S607
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+
+    try:
+        return {
+            "commit": git("rev-parse", "HEAD"),
+            "branch": git("rev-parse", "--abbrev-ref", "HEAD"),
+            "dirty": bool(git("status", "--porcelain", "--untracked-files=no")),
+        }
+    except (OSError, subprocess.CalledProcessError):
+        return {}
+
+
+def compare(results: dict[str, Any], baseline: dict[str, Any], threshold: float) -> list[str]:
+    """Print the change of every scenario against the baseline and return the regressed ones."""
+    regressed = []
+    print(f"Against {baseline.get('git', {}).get('commit', 'baseline')[:12]}:")
+    for name, result in results["scenarios"].items():
+        if (base := baseline["scenarios"].get(name)) is None:
+            continue
+        throughput = result["throughput"] / base["throughput"] - 1
+        p95 = result["latency_ms"]["p95"] / base["latency_ms"]["p95"] - 1
+        flag = ""
+        if p95 > threshold:
+            regressed.append(name)
+            flag = "  REGRESSION"
+        print(f"  {name:<14}throughput {throughput:+7.1%}  p95 {p95:+7.1%}{flag}")
+    return regressed
+
+
+async def benchmark(args: argparse.Namespace) -> dict[str, Any]:
+    """Seed the dataset, run the scenarios and return the results."""
+    dataset = {} if args.skip_seed else await seed(args.scale, args.seed)
+    rng = random.Random(args.seed)  # noqa: S311
+    total = args.warmup + args.requests
+    async with get_sqlalchemy_config().create_session_maker()() as session:
+        factories = await build_requests(session, rng, total)
+    # The client runs the app on its own event loop, connections can not be shared with it.
+    await get_engine().dispose()
+
+    scenarios: dict[str, ScenarioResult] = {}
+    async with AsyncTestClient(app) as client:
+        if "list" in args.scenarios:
+            pages = await walk_pages(client, total)
+            factories["list"] = lambda n: ("GET", pages[n], {})
+        for name in args.scenarios:
+            result = await run_scenario(
+                client, factories[name], args.requests, args.warmup, args.concurrency
+            )
+            scenarios[name] = result
+            print(
+                f"{name:<14}{result.throughput:>10.1f} req/s  "
+                + "  ".join(
+                    f"p{rank} {result.latency_ms[f'p{rank}']:>8.2f}ms" for rank in PERCENTILES
+                )
+                + f"  {result.statuses}"
+            )
+
+    return {
+        "benchmark": "api",
+        "created_at": datetime.now(UTC).isoformat(timespec="seconds"),
+        "git": git_revision(),
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpus": os.cpu_count(),
+        },
+        "options": {
+            "scale": args.scale,
+            "seed": args.seed,
+            "requests": args.requests,
+            "warmup": args.warmup,
+            "concurrency": args.concurrency,
+            "skip_seed": args.skip_seed,
+        },
+        "dataset": dataset,
+        "scenarios": {name: asdict(result) for name, result in scenarios.items()},
+    }
+
+
+def main() -> None:
+    """Run the benchmark, write the results and compare them to the baseline."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scale", type=float, default=0.5, help="Seeding scale factor")
+    parser.add_argument("--seed", type=int, default=1, help="Seed of the dataset and requests")
+    parser.add_argument("--requests", type=int, default=500, help="Measured requests per scenario")
+    parser.add_argument("--warmup", type=int, default=50, help="Requests before measuring")
+    parser.add_argument("--concurrency", type=int, default=8, help="Concurrent clients")
+    parser.add_argument(
+        "--scenarios",
+        nargs="+",
+        choices=SCENARIOS,
+        default=list(SCENARIOS),
+        help="Scenarios to run",
+    )
+    parser.add_argument(
+        "--skip-seed", action="store_true", help="Reuse the data in the database, e.g. a seeded run"
+    )
+    parser.add_argument(
+        "--output", type=Path, help="Results file, in benchmarks/results by default"
+    )
+    parser.add_argument("--baseline", type=Path, help="Results of another run to compare with")
+    parser.add_argument(
+        "--threshold", type=float, default=0.1, help="Tolerated p95 regression, 0.1 is 10%%"
+    )
+    args = parser.parse_args()
+
+    results = asyncio.run(benchmark(args))
+    output = args.output or RESULTS_DIR / (
+        f"api-{results['git'].get('commit', 'nogit')[:12]}-{datetime.now(UTC):%Y%m%dT%H%M%S}.json"
+    )
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(results, indent=2) + "\n")
+    print(f"Results written to {output}")
+
+    if args.baseline is not None:
+        regressed = compare(results, json.loads(args.baseline.read_text()), args.threshold)
+        if regressed:
+            sys.exit(
+                f"p95 latency regressed by more than {args.threshold:.0%}: {', '.join(regressed)}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""Throughput of the events list response, Pydantic versus msgspec read models.
+
+Serializes a page of 1,000 in-memory events with two organizers each, so only
+the serialization differs between the paths, and reports both the bare
+encoding time and requests per second through a Litestar app:
+
+- pydantic-dto: ReadEventDTO, as the events list was served before
+- pydantic: ReadEventSchema validated from the ORM rows and dumped to JSON
+- msgspec: EventStruct converted from the ORM rows and encoded
+
+Run from the repository root:
+
+    python -m benchmarks.bench_event_serialization --events 1000 --requests 200
+"""
+
+import argparse
+import time
+from collections.abc import Callable
+from datetime import datetime, timedelta
+from decimal import Decimal
+from functools import partial
+
+import msgspec
+from litestar import Litestar, MediaType, Response, get
+from litestar.testing import TestClient
+from pydantic import TypeAdapter
+
+from src.infrastructure.database.models import Event, Organizer
+from src.infrastructure.database.models.enums import Currency, EventFormat, EventStatus
+from src.infrastructure.repositories.pagination import CursorPage
+from src.interfaces.api.dto import ReadEventDTO
+from src.interfaces.api.schemas import ReadEventSchema
+from src.interfaces.api.structs import to_event_page
+
+
+def make_events(count: int) -> list[Event]:
+    """Build transient events shaped like the LIST loader profile output."""
+    organizers = [
+        Organizer(id=i, name=f"Organizer {i}", logo_url=f"https://example.com/{i}.png")
+        for i in range(1, 11)
+    ]
+    start = datetime(2025, 1, 1, 18, 0)
+    events = []
+    for i in range(1, count + 1):
+        event = Event(
+            id=i,
+            name=f"Python meetup #{i}",
+            description="Talks, pizza and networking. " * 30,
+            organizer_id=organizers[i % 10].id,
+            location_id=i % 50 + 1,
+            category_id=i % 8 + 1,
+            format=EventFormat.OFFLINE,
+            status=EventStatus.PLANNED,
+            currency=Currency.USD,
+            is_published=True,
+            is_online=False,
+            is_verify=True,
+            pub_date=start - timedelta(days=30),
+            event_start_date=start + timedelta(days=i),
+            event_end_date=start + timedelta(days=i, hours=3),
+            registration_deadline=start + timedelta(days=i - 1),
+            meeting_link=None,
+            timezone="UTC",
+            max_participants=100,
+            current_participants=42,
+            registered_count=40,
+            confirmed_count=2,
+            waitlisted_count=0,
+            attended_count=0,
+            price=Decimal("15.00"),
+            updated_at=start,
+        )
+        event.organizers = [organizers[i % 10], organizers[(i + 1) % 10]]
+        events.append(event)
+    return events
+
+
+def build_app(page: CursorPage[Event]) -> Litestar:
+    """Build an app serving the same page through every serialization path."""
+    adapter = TypeAdapter(list[ReadEventSchema])
+
+    @get("/pydantic-dto", dto=ReadEventDTO, sync_to_thread=False)
+    def pydantic_dto() -> CursorPage[ReadEventSchema]:
+        return page  # type: ignore[return-value]
+
+    @get("/pydantic", sync_to_thread=False)
+    def pydantic() -> Response[bytes]:
+        items = adapter.dump_json(adapter.validate_python(page.items))
+        return Response(items, media_type=MediaType.JSON)
+
+    @get("/msgspec", sync_to_thread=False)
+    def msgspec_struct() -> Response[bytes]:
+        return Response(msgspec.json.encode(to_event_page(page)), media_type=MediaType.JSON)
+
+    return Litestar(route_handlers=[pydantic_dto, pydantic, msgspec_struct])
+
+
+def measure(func: Callable[[], object], repeat: int) -> float:
+    """Return calls per second of the function."""
+    func()
+    started = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return repeat / (time.perf_counter() - started)
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--events", type=int, default=1000, help="Events in the page")
+    parser.add_argument("--requests", type=int, default=200, help="Requests per path")
+    args = parser.parse_args()
+
+    page = CursorPage(items=make_events(args.events), limit=args.events)
+    adapter = TypeAdapter(list[ReadEventSchema])
+    encoders = {
+        "pydantic": lambda: adapter.dump_json(adapter.validate_python(page.items)),
+        "msgspec": lambda: msgspec.json.encode(to_event_page(page)),
+    }
+    print(f"Encoding a page of {args.events} events, pages/s:")
+    for name, encode in encoders.items():
+        print(f"  {name:<14}{measure(encode, args.requests):>10.1f}")
+
+    print(f"GET of a page of {args.events} events, requests/s:")
+    results = {}
+    with TestClient(build_app(page)) as client:
+        for path in ("pydantic-dto", "pydantic", "msgspec"):
+            results[path] = measure(partial(client.get, f"/{path}"), args.requests)
+            print(f"  {path:<14}{results[path]:>10.1f}")
+    for path in ("pydantic-dto", "pydantic"):
+        print(f"msgspec speedup over {path}: x{results['msgspec'] / results[path]:.1f}")
+
+
+if __name__ == "__main__":
+    main()
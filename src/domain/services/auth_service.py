@@ -1,6 +1,50 @@
-from src.domain.services.user_service import UserService
+from src.domain.services.password_service import PasswordHasher
+from src.infrastructure.database.models import User
+from src.infrastructure.repositories.user import UserRepository
 
 
 class AuthService:
-    def __init__(self, user_service: UserService) -> None:
-        """Докстринг."""
+    """Authentication of users by password."""
+
+    def __init__(self, user_repo: UserRepository, password_hasher: PasswordHasher) -> None:
+        """Initialize service.
+
+        Args:
+            user_repo: Repository of users
+            password_hasher: Hasher of the passwords
+
+        """
+        self.user_repo = user_repo
+        self.password_hasher = password_hasher
+
+    async def authenticate(self, login: str, password: str) -> User | None:
+        """Check the credentials of an active user.
+
+        Hashes made with another cost than the current one are replaced on the
+        fly, so changing the cost migrates users as they log in.
+
+        Args:
+            login: Username or email
+            password: Plain password
+
+        Returns:
+            Authenticated user, None if the credentials are wrong or the user is inactive
+
+        Raises:
+            PasswordHasherBusyError: If the password hasher queue is full
+
+        """
+        user = await self.user_repo.get_by_login(login)
+        if user is None:
+            # Unknown logins take as long as wrong passwords, not revealing which users exist.
+            await self.password_hasher.verify_dummy(password)
+            return None
+        valid, new_hash = await self.password_hasher.verify_and_update(
+            password, user.hashed_password
+        )
+        if not valid or not user.is_active:
+            return None
+        if new_hash is not None:
+            user.hashed_password = new_hash
+            await self.user_repo.update(user, auto_commit=True)
+        return user
@@ -0,0 +1,202 @@
+import asyncio
+import time
+from collections.abc import Callable
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Final, Literal, TypeVar
+
+import bcrypt
+
+T = TypeVar("T")
+
+# bcrypt only uses the first 72 bytes of a password, bcrypt 5 rejects longer ones.
+BCRYPT_MAX_PASSWORD_BYTES: Final[int] = 72
+
+
+class PasswordHasherBusyError(Exception):
+    """Raised when the queue of the password hasher is full."""
+
+
+@dataclass
+class PasswordHashStats:
+    """Counters and queue depth of the password hasher, per process.
+
+    Attributes:
+        hashes: Passwords hashed
+        verifications: Passwords checked against a hash
+        rehashes: Hashes replaced after a change of the cost
+        rejected: Requests rejected because the queue was full
+        in_flight: Requests being hashed or checked by the workers
+        waiting: Requests waiting for a worker
+        max_waiting: Highest number of requests waiting for a worker
+        seconds_total: Time spent by the workers
+
+    """
+
+    hashes: int = 0
+    verifications: int = 0
+    rehashes: int = 0
+    rejected: int = 0
+    in_flight: int = 0
+    waiting: int = 0
+    max_waiting: int = 0
+    seconds_total: float = 0.0
+
+    @property
+    def seconds_avg(self) -> float:
+        """Average time of a hash or check."""
+        operations = self.hashes + self.verifications
+        return self.seconds_total / operations if operations else 0.0
+
+
+def _password_bytes(password: str) -> bytes:
+    """Encode the password as bcrypt sees it."""
+    return password.encode("utf-8")[:BCRYPT_MAX_PASSWORD_BYTES]
+
+
+def _hash(password: str, rounds: int) -> str:
+    """Hash the password, runs in a worker."""
+    return bcrypt.hashpw(_password_bytes(password), bcrypt.gensalt(rounds)).decode("utf-8")
+
+
+def _verify(password: str, hashed: str) -> bool:
+    """Check the password against the hash, runs in a worker."""
+    try:
+        return bcrypt.checkpw(_password_bytes(password), hashed.encode("utf-8"))
+    except ValueError:
+        # Malformed hash.
+        return False
+
+
+def hash_rounds(hashed: str) -> int | None:
+    """Return the cost of a bcrypt hash, None if it is not a bcrypt hash."""
+    parts = hashed.split("$")
+    if len(parts) != 4 or not parts[2].isdigit():
+        return None
+    return int(parts[2])
+
+
+class PasswordHasher:
+    """bcrypt hashing off the event loop, on a bounded pool of workers.
+
+    bcrypt takes about 250ms at cost 12. Hashes run on a thread pool, bcrypt
+    releases the GIL, or on a process pool. At most one request per worker is
+    handed to the pool, the others wait on a semaphore so the queue depth can be
+    measured, and requests beyond max_queue fail fast instead of piling up.
+    """
+
+    def __init__(
+        self,
+        rounds: int = 12,
+        workers: int = 4,
+        max_queue: int = 64,
+        executor: Literal["thread", "process"] = "thread",
+    ) -> None:
+        """Initialize hasher.
+
+        Args:
+            rounds: bcrypt cost of new hashes, log2 of the iterations
+            workers: Hashes computed in parallel
+            max_queue: Requests allowed to wait for a worker
+            executor: Pool of "thread" or "process" workers
+
+        """
+        self.rounds = rounds
+        self.workers = workers
+        self.max_queue = max_queue
+        self.stats = PasswordHashStats()
+        self._executor: Executor = (
+            ThreadPoolExecutor(max_workers=workers, thread_name_prefix="password-hasher")
+            if executor == "thread"
+            else ProcessPoolExecutor(max_workers=workers)
+        )
+        self._semaphore = asyncio.Semaphore(workers)
+        self._dummy_hash: str | None = None
+
+    async def hash(self, password: str) -> str:
+        """Hash the password with the current cost.
+
+        Raises:
+            PasswordHasherBusyError: If the queue is full
+
+        """
+        hashed = await self._run(_hash, password, self.rounds)
+        self.stats.hashes += 1
+        return hashed
+
+    async def verify(self, password: str, hashed: str) -> bool:
+        """Check the password against the hash.
+
+        Raises:
+            PasswordHasherBusyError: If the queue is full
+
+        """
+        valid = await self._run(_verify, password, hashed)
+        self.stats.verifications += 1
+        return valid
+
+    async def verify_dummy(self, password: str) -> bool:
+        """Check the password against a hash of nothing, taking the time of a real check.
+
+        Returns:
+            False
+
+        Raises:
+            PasswordHasherBusyError: If the queue is full
+
+        """
+        if self._dummy_hash is None or self.needs_rehash(self._dummy_hash):
+            self._dummy_hash = await self._run(_hash, "", self.rounds)
+        await self.verify(password, self._dummy_hash)
+        return False
+
+    def needs_rehash(self, hashed: str) -> bool:
+        """Check whether the hash was made with another cost than the current one."""
+        return hash_rounds(hashed) != self.rounds
+
+    async def verify_and_update(self, password: str, hashed: str) -> tuple[bool, str | None]:
+        """Check the password, and hash it again if the cost of its hash changed.
+
+        Args:
+            password: Password to check
+            hashed: Stored hash of the password
+
+        Returns:
+            Whether the password is valid, and the new hash to store or None
+
+        Raises:
+            PasswordHasherBusyError: If the queue is full
+
+        """
+        if not await self.verify(password, hashed):
+            return False, None
+        if not self.needs_rehash(hashed):
+            return True, None
+        new_hash = await self.hash(password)
+        self.stats.rehashes += 1
+        return True, new_hash
+
+    async def _run(self, function: Callable[..., T], *args: object) -> T:
+        """Run the function on the pool once a worker is free."""
+        if self.stats.waiting >= self.max_queue:
+            self.stats.rejected += 1
+            raise PasswordHasherBusyError("Too many password hashing requests.")
+        self.stats.waiting += 1
+        self.stats.max_waiting = max(self.stats.max_waiting, self.stats.waiting)
+        try:
+            await self._semaphore.acquire()
+        finally:
+            self.stats.waiting -= 1
+        self.stats.in_flight += 1
+        started = time.perf_counter()
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, function, *args)
+        finally:
+            self.stats.seconds_total += time.perf_counter() - started
+            self.stats.in_flight -= 1
+            self._semaphore.release()
+
+    def close(self) -> None:
+        """Shut the pool down, waiting for running hashes."""
+        self._executor.shutdown()
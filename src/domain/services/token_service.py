@@ -0,0 +1,228 @@
+import asyncio
+import base64
+import binascii
+import contextlib
+import hashlib
+import hmac
+import time
+from collections.abc import Callable
+from logging import getLogger
+from typing import Final
+
+import msgspec
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.infrastructure.cache.events import CacheStats
+from src.infrastructure.cache.lru import LRUCache
+from src.infrastructure.database.models import User
+
+logger = getLogger("src.auth")
+
+# Longer tokens are refused before any decoding, bounding the work of a request.
+MAX_TOKEN_LENGTH: Final[int] = 2048
+
+
+class TokenError(Exception):
+    """Raised when an access token is malformed, forged, expired or from another issuer."""
+
+
+class TokenClaims(msgspec.Struct):
+    """Claims of an access token.
+
+    Attributes:
+        sub: Id of the user, as a string like JWT requires
+        username: Username of the user
+        iss: Issuer of the token
+        iat: Issue time, seconds since the epoch
+        exp: Expiration time, seconds since the epoch
+
+    """
+
+    sub: str
+    username: str
+    iss: str
+    iat: int
+    exp: int
+
+    @property
+    def user_id(self) -> int:
+        """Id of the user."""
+        return int(self.sub)
+
+
+def _b64encode(data: bytes) -> bytes:
+    """Encode base64url without padding, as JWT segments are."""
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+
+def _b64decode(segment: bytes) -> bytes:
+    """Decode an unpadded base64url segment.
+
+    The decoder skips characters outside the alphabet and ignores the unused
+    bits of the last one, so segments are refused unless they are the only
+    encoding of their bytes: a token has a single valid spelling.
+
+    Raises:
+        binascii.Error: If the segment is not canonical base64url
+
+    """
+    data = base64.urlsafe_b64decode(segment + b"=" * (-len(segment) % 4))
+    if _b64encode(data) != segment:
+        raise binascii.Error("Non-canonical base64url segment.")
+    return data
+
+
+class TokenService:
+    """Issues and verifies short-lived access tokens, HS256 JSON Web Tokens.
+
+    The key is prepared once: the HMAC keyed with the secret is copied for every
+    token instead of being keyed again. Verified tokens are kept in an LRU until
+    they expire, so a client sending the same token skips the signature check.
+    Entries are keyed by the whole token, as a cached signature alone would
+    vouch for any payload sent along with it.
+    """
+
+    def __init__(self, secret: str, issuer: str, ttl: int, cache_size: int = 4096) -> None:
+        """Initialize service.
+
+        Args:
+            secret: Signing key shared by all processes
+            issuer: Issuer of the tokens, checked on verification
+            ttl: Lifetime of an access token in seconds
+            cache_size: Verified tokens kept
+
+        """
+        self.issuer = issuer
+        self.ttl = ttl
+        self.stats = CacheStats()
+        self._mac = hmac.new(secret.encode("utf-8"), digestmod=hashlib.sha256)
+        self._header = _b64encode(msgspec.json.encode({"alg": "HS256", "typ": "JWT"}))
+        self._verified: LRUCache[str, TokenClaims] = LRUCache(maxsize=cache_size)
+
+    def _sign(self, signing_input: bytes) -> bytes:
+        """Compute the signature of the header and payload segments."""
+        mac = self._mac.copy()
+        mac.update(signing_input)
+        return mac.digest()
+
+    def issue(self, user: User) -> str:
+        """Issue an access token of the user.
+
+        Args:
+            user: Authenticated user
+        Returns:
+            Signed token
+
+        """
+        now = int(time.time())
+        claims = TokenClaims(
+            sub=str(user.id), username=user.username, iss=self.issuer, iat=now, exp=now + self.ttl
+        )
+        signing_input = self._header + b"." + _b64encode(msgspec.json.encode(claims))
+        return (signing_input + b"." + _b64encode(self._sign(signing_input))).decode("ascii")
+
+    def verify(self, token: str) -> TokenClaims:
+        """Verify the token and return its claims.
+
+        Args:
+            token: Token from the Authorization header
+        Returns:
+            Claims of the token
+
+        Raises:
+            TokenError: If the token is malformed, too long, forged, expired or from another issuer
+
+        """
+        if len(token) > MAX_TOKEN_LENGTH:
+            raise TokenError("Token too long.")
+        now = time.time()
+        claims = self._verified.get(token)
+        if claims is not None:
+            self.stats.hits += 1
+            return claims
+        self.stats.misses += 1
+
+        try:
+            signing_input, signature = token.encode("ascii").rsplit(b".", 1)
+            header, payload = signing_input.split(b".")
+            valid = header == self._header and hmac.compare_digest(
+                self._sign(signing_input), _b64decode(signature)
+            )
+        except (UnicodeEncodeError, ValueError, binascii.Error) as e:
+            raise TokenError("Malformed token.") from e
+        if not valid:
+            raise TokenError("Invalid token signature.")
+        try:
+            claims = msgspec.json.decode(_b64decode(payload), type=TokenClaims)
+        except (binascii.Error, msgspec.DecodeError) as e:
+            raise TokenError("Malformed token claims.") from e
+        if claims.iss != self.issuer:
+            raise TokenError("Token from another issuer.")
+        if claims.exp <= now:
+            raise TokenError("Token expired.")
+
+        self._verified.set(token, claims, ttl=claims.exp - now)
+        return claims
+
+
+class DenyList:
+    """Ids of inactive users, whose tokens are refused until they expire.
+
+    Tokens are verified without a database lookup, so deactivation reaches the
+    other processes through a periodic sync of the ids of all inactive users,
+    a small set next to the users. A process deactivating a user adds it at once.
+    """
+
+    def __init__(self, session_maker: Callable[[], AsyncSession], interval: float = 30.0) -> None:
+        """Initialize deny-list.
+
+        Args:
+            session_maker: Factory of database sessions
+            interval: Seconds between syncs
+
+        """
+        self.session_maker = session_maker
+        self.interval = interval
+        self._user_ids: frozenset[int] = frozenset()
+        self._sync_task: asyncio.Task[None] | None = None
+
+    def __contains__(self, user_id: int) -> bool:
+        """Check whether the user is inactive."""
+        return user_id in self._user_ids
+
+    def __len__(self) -> int:
+        """Return the number of inactive users."""
+        return len(self._user_ids)
+
+    def add(self, user_id: int) -> None:
+        """Refuse the tokens of the user from now on, in this process."""
+        self._user_ids |= {user_id}
+
+    async def sync(self) -> None:
+        """Replace the ids by the ones of the inactive users in the database."""
+        async with self.session_maker() as session:
+            result = await session.execute(select(User.id).where(User.is_active.is_(False)))
+            self._user_ids = frozenset(result.scalars())
+
+    async def _sync_forever(self) -> None:
+        """Sync the ids every interval, keeping the last ids when a sync fails."""
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await self.sync()
+            except Exception:
+                logger.exception("Deny-list sync failed")
+
+    async def start(self) -> None:
+        """Sync the ids and start the periodic syncs."""
+        await self.sync()
+        self._sync_task = asyncio.create_task(self._sync_forever())
+
+    async def stop(self) -> None:
+        """Stop the periodic syncs."""
+        if self._sync_task is not None:
+            self._sync_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._sync_task
+            self._sync_task = None
@@ -1,2 +1,37 @@
+from src.domain.services.password_service import PasswordHasher
+from src.infrastructure.database.models import User
+from src.infrastructure.repositories.user import UserRepository
+
+
 class UserService:
-    """Some docs."""
+    """Registration and management of users."""
+
+    def __init__(self, user_repo: UserRepository, password_hasher: PasswordHasher) -> None:
+        """Initialize service.
+
+        Args:
+            user_repo: Repository of users
+            password_hasher: Hasher of the passwords
+
+        """
+        self.user_repo = user_repo
+        self.password_hasher = password_hasher
+
+    async def register(self, username: str, email: str, password: str) -> User:
+        """Create a user, hashing the password off the event loop.
+
+        Args:
+            username: Unique username
+            email: Unique email
+            password: Plain password
+
+        Returns:
+            Created user
+
+        Raises:
+            PasswordHasherBusyError: If the password hasher queue is full
+
+        """
+        hashed_password = await self.password_hasher.hash(password)
+        user = User(username=username, email=email, hashed_password=hashed_password)
+        return await self.user_repo.add(user, auto_commit=True)
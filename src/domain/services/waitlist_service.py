@@ -0,0 +1,102 @@
+import asyncio
+import contextlib
+from collections.abc import Callable
+from logging import getLogger
+from typing import TYPE_CHECKING, Final
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.infrastructure.cache.events import EventResponseCache
+from src.infrastructure.repositories.registration import RegistrationRepository
+
+if TYPE_CHECKING:
+    from litestar import Litestar
+
+logger = getLogger("src.events")
+
+# Event emitted for every promoted registration, with its registration, profile and event ids.
+REGISTRATION_PROMOTED: Final[str] = "registration_promoted"
+
+
+class WaitlistPromoter:
+    """Background worker promoting waitlisted registrations into freed seats.
+
+    Runs every interval, and right after a cancellation in this process. Each
+    batch is one transaction over events locked with SKIP LOCKED, so every
+    instance of the app can run a promoter. Promotions are emitted as
+    application events once committed, for notifications.
+    """
+
+    def __init__(
+        self,
+        session_maker: Callable[[], AsyncSession],
+        interval: float = 10.0,
+        batch_size: int = 100,
+        cache: EventResponseCache | None = None,
+    ) -> None:
+        """Initialize promoter.
+
+        Args:
+            session_maker: Factory of database sessions
+            interval: Seconds between runs
+            batch_size: Events locked, and registrations promoted, per batch
+            cache: Response cache of the events to invalidate on promotions
+
+        """
+        self.session_maker = session_maker
+        self.interval = interval
+        self.batch_size = batch_size
+        self.cache = cache
+        self.promoted = 0
+        self._emit: Callable[..., None] | None = None
+        self._wake = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+
+    def notify(self) -> None:
+        """Run the promoter now, e.g. after a cancellation freed a seat."""
+        self._wake.set()
+
+    async def promote(self) -> int:
+        """Promote batches until no event with free seats has a waitlist.
+
+        Returns:
+            Number of promoted registrations
+
+        """
+        total = 0
+        while True:
+            async with self.session_maker() as session:
+                repo = RegistrationRepository(session=session, cache=self.cache)
+                rows = await repo.promote_waitlisted(self.batch_size, auto_commit=True)
+            if not rows:
+                return total
+            total += len(rows)
+            self.promoted += len(rows)
+            if self._emit is not None:
+                for registration_id, profile_id, event_id in rows:
+                    self._emit(REGISTRATION_PROMOTED, registration_id, profile_id, event_id)
+
+    async def _run_forever(self) -> None:
+        """Promote every interval or when notified, logging failed runs."""
+        while True:
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._wake.wait(), self.interval)
+            self._wake.clear()
+            try:
+                if promoted := await self.promote():
+                    logger.info("Promoted %d waitlisted registrations", promoted)
+            except Exception:
+                logger.exception("Waitlist promotion failed")
+
+    async def start(self, app: "Litestar") -> None:
+        """Start promoting in the background, emitting promotions through the app."""
+        self._emit = app.emit
+        self._task = asyncio.create_task(self._run_forever())
+
+    async def stop(self) -> None:
+        """Stop promoting."""
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
@@ -0,0 +1,187 @@
+from abc import ABC, abstractmethod
+from typing import Protocol
+
+from src.infrastructure.cache.lru import LRUCache
+
+
+class CacheBackend(ABC):
+    """Storage of cached payloads, shared by all cache users of the process."""
+
+    @abstractmethod
+    async def get(self, key: str) -> bytes | None:
+        """Return payload of the key, None if missing or expired."""
+
+    @abstractmethod
+    async def set(self, key: str, value: bytes, ttl: int | None = None) -> None:
+        """Store payload of the key.
+
+        Args:
+            key: Cache key
+            value: Payload to store
+            ttl: Lifetime of the entry in seconds, None for the backend default
+
+        """
+
+    @abstractmethod
+    async def delete(self, *keys: str) -> None:
+        """Remove the keys, missing keys are ignored."""
+
+    @abstractmethod
+    async def incr(self, key: str, amount: int = 1) -> int:
+        """Increment the counter of the key, starting from 0.
+
+        Counters are never evicted, an amount of 0 reads the current value.
+
+        Args:
+            key: Counter key
+            amount: Value to add
+
+        Returns:
+            Value of the counter after the increment
+
+        """
+
+    async def close(self) -> None:  # noqa: B027
+        """Release connections of the backend."""
+
+
+class MemoryCacheBackend(CacheBackend):
+    """Per process backend on top of the LRU cache with entry expiration."""
+
+    def __init__(self, maxsize: int, ttl: int | None = None) -> None:
+        """Initialize backend.
+
+        Args:
+            maxsize: Maximal number of payloads
+            ttl: Default lifetime of a payload in seconds
+
+        """
+        self._entries: LRUCache[str, bytes] = LRUCache(maxsize=maxsize, ttl=ttl)
+        self._counters: dict[str, int] = {}
+
+    async def get(self, key: str) -> bytes | None:
+        """Return payload of the key, None if missing or expired."""
+        return self._entries.get(key)
+
+    async def set(self, key: str, value: bytes, ttl: int | None = None) -> None:
+        """Store payload of the key."""
+        self._entries.set(key, value, ttl=ttl)
+
+    async def delete(self, *keys: str) -> None:
+        """Remove the keys, missing keys are ignored."""
+        for key in keys:
+            self._entries.delete(key)
+
+    async def incr(self, key: str, amount: int = 1) -> int:
+        """Increment the counter of the key, starting from 0."""
+        value = self._counters.get(key, 0) + amount
+        self._counters[key] = value
+        return value
+
+
+class NullCacheBackend(CacheBackend):
+    """Backend that stores nothing, every read is a miss."""
+
+    async def get(self, key: str) -> bytes | None:
+        """Return None, nothing is stored."""
+        return None
+
+    async def set(self, key: str, value: bytes, ttl: int | None = None) -> None:
+        """Drop the payload."""
+
+    async def delete(self, *keys: str) -> None:
+        """Do nothing, nothing is stored."""
+
+    async def incr(self, key: str, amount: int = 1) -> int:
+        """Return 0, counters only version entries that are never stored."""
+        return 0
+
+
+class RedisClient(Protocol):
+    """Subset of the redis.asyncio.Redis client used by the Redis backend."""
+
+    async def get(self, name: str) -> bytes | None: ...  # noqa: D102
+
+    async def set(self, name: str, value: bytes, ex: int | None = None) -> object: ...  # noqa: D102
+
+    async def delete(self, *names: str) -> int: ...  # noqa: D102
+
+    async def incrby(self, name: str, amount: int = 1) -> int: ...  # noqa: D102
+
+    async def aclose(self) -> None: ...  # noqa: D102
+
+
+class RedisCacheBackend(CacheBackend):
+    """Backend shared by all processes, on any Redis-compatible async client.
+
+    Takes the client instead of a URL, so tests can pass a local stand-in
+    such as fakeredis.
+    """
+
+    def __init__(
+        self, client: RedisClient, prefix: str = "devevents:", ttl: int | None = None
+    ) -> None:
+        """Initialize backend.
+
+        Args:
+            client: Redis-compatible async client
+            prefix: Prefix of all keys, to share the database with other users
+            ttl: Default lifetime of a payload in seconds
+
+        """
+        self.client = client
+        self.prefix = prefix
+        self.ttl = ttl
+
+    async def get(self, key: str) -> bytes | None:
+        """Return payload of the key, None if missing or expired."""
+        return await self.client.get(self.prefix + key)
+
+    async def set(self, key: str, value: bytes, ttl: int | None = None) -> None:
+        """Store payload of the key."""
+        await self.client.set(self.prefix + key, value, ex=self.ttl if ttl is None else ttl)
+
+    async def delete(self, *keys: str) -> None:
+        """Remove the keys, missing keys are ignored."""
+        if keys:
+            await self.client.delete(*(self.prefix + key for key in keys))
+
+    async def incr(self, key: str, amount: int = 1) -> int:
+        """Increment the counter of the key, starting from 0."""
+        return await self.client.incrby(self.prefix + key, amount)
+
+    async def close(self) -> None:
+        """Close the client connections."""
+        await self.client.aclose()
+
+
+def create_cache_backend(
+    backend: str, maxsize: int, ttl: int | None = None, redis_url: str | None = None
+) -> CacheBackend:
+    """Create the cache backend by name.
+
+    Args:
+        backend: "memory", "redis" or "none" to cache nothing
+        maxsize: Maximal number of payloads of the memory backend
+        ttl: Default lifetime of a payload in seconds
+        redis_url: Connection URL of the redis backend
+
+    Returns:
+        CacheBackend instance
+
+    Raises:
+        ValueError: If the backend is unknown or the redis URL is missing
+
+    """
+    if backend == "none":
+        return NullCacheBackend()
+    if backend == "memory":
+        return MemoryCacheBackend(maxsize=maxsize, ttl=ttl)
+    if backend == "redis":
+        if redis_url is None:
+            raise ValueError("REDIS_URL is required by the redis cache backend.")
+        # Optional dependency, only needed when the redis backend is selected.
+        from redis.asyncio import Redis
+
+        return RedisCacheBackend(Redis.from_url(redis_url), ttl=ttl)
+    raise ValueError(f"Unknown cache backend {backend!r}.")
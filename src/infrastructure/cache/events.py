@@ -0,0 +1,114 @@
+import hashlib
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Final
+
+import msgspec
+
+from src.infrastructure.cache.backends import CacheBackend
+
+# Counter of list responses, bumped by every event write.
+LIST_GENERATION_KEY: Final[str] = "events:list:generation"
+
+
+@dataclass
+class CacheStats:
+    """Hit and miss counters of a cache, per process.
+
+    Attributes:
+        hits: Lookups served from the cache
+        misses: Lookups that fell through to the database
+        invalidations: Writes that invalidated cached responses
+
+    """
+
+    hits: int = 0
+    misses: int = 0
+    invalidations: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        """Share of lookups served from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class CachedResponse(msgspec.Struct):
+    """Encoded response body with its validators.
+
+    Attributes:
+        body: JSON body of the response
+        etag: Entity tag of the body
+        last_modified: Last modification time of the data in the body, naive UTC
+
+    """
+
+    body: bytes
+    etag: str
+    last_modified: datetime | None = None
+
+
+class EventResponseCache:
+    """Cache of encoded responses of the read-only event endpoints, with their validators.
+
+    Single events are keyed by id and deleted when the event is written.
+    List responses are keyed by the signature of their query and a generation
+    counter: any event write bumps the generation, so all cached lists become
+    unreachable at once and expire on their own. Entries cached by a read
+    racing with a write live at most ttl seconds.
+    """
+
+    def __init__(self, backend: CacheBackend, ttl: int | None = None) -> None:
+        """Initialize cache.
+
+        Args:
+            backend: Storage of the payloads
+            ttl: Lifetime of a cached response in seconds
+
+        """
+        self.backend = backend
+        self.ttl = ttl
+        self.stats = CacheStats()
+
+    @staticmethod
+    def detail_key(event_id: int) -> str:
+        """Build the key of a single event response."""
+        return f"events:detail:{event_id}"
+
+    async def list_key(self, signature: str) -> str:
+        """Build the key of a list response in the current generation.
+
+        Args:
+            signature: Canonical form of the list query, e.g. its parameters
+        Returns:
+            Cache key
+
+        """
+        generation = await self.backend.incr(LIST_GENERATION_KEY, 0)
+        digest = hashlib.sha256(signature.encode()).hexdigest()
+        return f"events:list:{generation}:{digest}"
+
+    async def get(self, key: str) -> CachedResponse | None:
+        """Return the cached response of the key, counting the hit or miss."""
+        payload = await self.backend.get(key)
+        if payload is None:
+            self.stats.misses += 1
+            return None
+        self.stats.hits += 1
+        return msgspec.msgpack.decode(payload, type=CachedResponse)
+
+    async def set(self, key: str, response: CachedResponse) -> None:
+        """Cache the response of the key."""
+        await self.backend.set(key, msgspec.msgpack.encode(response), ttl=self.ttl)
+
+    async def invalidate(self, event_ids: Iterable[int]) -> None:
+        """Drop cached responses of the written events and all list responses.
+
+        Args:
+            event_ids: Ids of created, updated or deleted events
+
+        """
+        await self.backend.delete(*(self.detail_key(event_id) for event_id in event_ids))
+        await self.backend.incr(LIST_GENERATION_KEY)
+        self.stats.invalidations += 1
@@ -1,6 +1,7 @@
 from datetime import datetime
 from typing import Annotated
 
+from advanced_alchemy.base import BasicAttributes
 from sqlalchemy import Boolean, Integer, MetaData, String, func
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
@@ -18,12 +19,13 @@ class BaseModel(DeclarativeBase):
     )
 
 
-class Base(BaseModel):
+class Base(BasicAttributes, BaseModel):
     """Base class for models.
 
     Contains for all models
     - id
     - created_at
+    - to_dict, used by the bulk updates and upserts of the repositories
     """
 
     __abstract__ = True
@@ -52,3 +54,5 @@ BoolFalse = Annotated[bool, mapped_column(Boolean, default=False)]
 BoolTrue = Annotated[bool, mapped_column(Boolean, default=True)]
 # Basic integer var with nullable=True.
 BasicNullInteger = Annotated[int, mapped_column(Integer, nullable=True)]
+# Counter starting at zero, also for rows written outside the ORM.
+CountInteger = Annotated[int, mapped_column(Integer, default=0, server_default="0")]
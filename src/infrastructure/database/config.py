@@ -1,16 +1,99 @@
+from functools import lru_cache
+from logging import getLogger
+from typing import Any
+
 from litestar.contrib.sqlalchemy.plugins import SQLAlchemyAsyncConfig, SQLAlchemyPlugin
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
 
 from src.infrastructure.database.base import Base
+from src.infrastructure.database.pool import (
+    InstrumentedAsyncQueuePool,
+    unique_prepared_statement_name,
+    warm_up,
+)
+from src.infrastructure.database.profiling import instrument_engine
+from src.infrastructure.database.replicas import ReplicaRouter
 from src.infrastructure.database.settings import settings
 
+logger = getLogger("src.database")
+
+
+def create_engine(url: str) -> AsyncEngine:
+    """Create an engine with the connection pool and statement caches of the settings.
+
+    Its statements are counted and timed per request, see QueryTimingMiddleware.
+
+    Args:
+        url: Database URL
+    Returns:
+        AsyncEngine instance
+
+    """
+    connect_args: dict[str, Any] = {
+        "statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+        "prepared_statement_cache_size": settings.DB_PREPARED_STATEMENT_CACHE_SIZE,
+    }
+    if settings.DB_PGBOUNCER:
+        connect_args = {
+            "statement_cache_size": 0,
+            "prepared_statement_cache_size": 0,
+            "prepared_statement_name_func": unique_prepared_statement_name,
+        }
+    engine = create_async_engine(
+        url,
+        poolclass=InstrumentedAsyncQueuePool,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_pre_ping=settings.DB_POOL_PRE_PING,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        connect_args=connect_args,
+    )
+    instrument_engine(engine)
+    return engine
+
 
+@lru_cache(maxsize=1)
+def get_engine() -> AsyncEngine:
+    """Get the engine of the primary, shared by the plugin and the admin so they use one pool."""
+    return create_engine(settings.database_url)
+
+
+@lru_cache(maxsize=1)
+def get_replica_router() -> ReplicaRouter:
+    """Get the router of reads over the replicas of the settings."""
+    return ReplicaRouter(
+        [create_engine(url) for url in settings.DATABASE_REPLICA_URLS],
+        health_interval=settings.DB_REPLICA_HEALTH_INTERVAL,
+    )
+
+
+@lru_cache(maxsize=1)
 def get_sqlalchemy_config() -> SQLAlchemyAsyncConfig:
-    """Get SQLAlchemy config."""
+    """Get SQLAlchemy config of the primary, shared by the plugin and the session provider."""
     return SQLAlchemyAsyncConfig(
-        connection_string=settings.database_url, create_all=True, metadata=Base.metadata
+        engine_instance=get_engine(),
+        create_all=True,
+        metadata=Base.metadata,
     )
 
 
 def get_sqlalchemy_plugin() -> SQLAlchemyPlugin:
     """Get SQLAlchemy plugin."""
     return SQLAlchemyPlugin(config=get_sqlalchemy_config())
+
+
+async def warm_up_pools() -> None:
+    """Open DB_POOL_SIZE connections to the primary and every replica, before serving traffic.
+
+    Requests then find open connections instead of paying the connection setup.
+    A replica failing is only logged, it is marked unhealthy by its health checks.
+    """
+    if not settings.DB_POOL_WARM_UP:
+        return
+    await warm_up(get_engine(), settings.DB_POOL_SIZE)
+    for replica in get_replica_router().replicas:
+        try:
+            await warm_up(replica.engine, settings.DB_POOL_SIZE)
+        except Exception:  # noqa: BLE001
+            logger.warning("Could not warm up the pool of replica %s", replica.name, exc_info=True)
@@ -4,3 +4,14 @@ MAX_BASIC_LENGTH: Final[int] = 255
 MIN_BASIC_LENGTH: Final[int] = 2
 MAX_DESCRIPTION_LENGTH: Final[int] = 1000
 PASSWORD_MIN_LENGTH: Final[int] = 8
+
+# Keyset pagination
+DEFAULT_PAGE_SIZE: Final[int] = 20
+MAX_PAGE_SIZE: Final[int] = 100
+
+# Autocomplete
+DEFAULT_SUGGESTIONS: Final[int] = 10
+MAX_SUGGESTIONS: Final[int] = 20
+
+# Bulk registration and check-in
+MAX_BULK_REGISTRATIONS: Final[int] = 1000
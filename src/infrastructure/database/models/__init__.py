@@ -1,3 +1,5 @@
+# Registers functions and triggers created along with the tables.
+from src.infrastructure.database import triggers  # noqa: F401
 from src.infrastructure.database.models.associations_model import EventRegistration
 from src.infrastructure.database.models.category_model import Category
 from src.infrastructure.database.models.event_model import Event
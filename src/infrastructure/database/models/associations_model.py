@@ -1,4 +1,4 @@
-from sqlalchemy import ForeignKey
+from sqlalchemy import ForeignKey, Index, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column
 
 from src.infrastructure.database.base import Base
@@ -19,6 +19,10 @@ class EventRegistration(Base):
     """
 
     __tablename__ = "event_registrations"
+    __table_args__ = (
+        # One registration per profile and event, duplicates abort the registration.
+        UniqueConstraint("profile_id", "event_id"),
+    )
 
     profile_id: Mapped[int] = mapped_column(
         ForeignKey("profiles.id", use_alter=True, ondelete="CASCADE"),
@@ -31,6 +35,22 @@ class EventRegistration(Base):
     status: Mapped[ParticipantStatus] = mapped_column(default=ParticipantStatus.REGISTERED)
 
 
+# Waitlist of every event in promotion order, first come first served.
+Index(
+    "ix_event_registrations_waitlist",
+    EventRegistration.event_id,
+    EventRegistration.created_at,
+    EventRegistration.id,
+    postgresql_where=EventRegistration.status == ParticipantStatus.WAITLISTED,
+)
+# Registrations of an event by status, read by the reconciliation of the event counters.
+Index(
+    "ix_event_registrations_event_id_status",
+    EventRegistration.event_id,
+    EventRegistration.status,
+)
+
+
 class EventOrganizers(Base):
     """Model representing relationship between events and their organizer_model.py.
 
@@ -22,4 +22,4 @@ class Category(Base):
     description: Mapped[DescriptionString]
 
     # Relationships
-    events = relationship("Event", back_populates="category")
+    events = relationship("Event", back_populates="category", lazy="raise")
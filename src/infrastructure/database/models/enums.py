@@ -80,3 +80,20 @@ class Gender(str, Enum):
 
     MALE = "male"
     FEMALE = "female"
+
+
+class SuggestionKind(str, Enum):
+    """Enum for autocomplete suggestion sources.
+
+    Attributes:
+        EVENT: Event name
+        LOCATION: Location name
+        CITY: Location city
+        ORGANIZER: Organizer name
+
+    """
+
+    EVENT = "event"
+    LOCATION = "location"
+    CITY = "city"
+    ORGANIZER = "organizer"
@@ -2,7 +2,8 @@ from datetime import datetime
 from decimal import Decimal
 from typing import TYPE_CHECKING
 
-from sqlalchemy import ForeignKey, Numeric
+from sqlalchemy import ForeignKey, Index, Numeric, func, literal_column, or_
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.infrastructure.database.base import (
@@ -11,6 +12,7 @@ from src.infrastructure.database.base import (
     BasicNullString,
     BasicString,
     BoolFalse,
+    CountInteger,
     DescriptionString,
     IndexedString,
 )
@@ -30,6 +32,26 @@ class Event(Base):
     """
 
     __tablename__ = "events"
+    __table_args__ = (
+        # Keyset pagination order of the events listing.
+        Index("ix_events_event_start_date_id", "event_start_date", "id"),
+        # Equality filter + start date order of the events search.
+        Index("ix_events_category_id_event_start_date", "category_id", "event_start_date", "id"),
+        Index("ix_events_location_id_event_start_date", "location_id", "event_start_date", "id"),
+        Index("ix_events_status_event_start_date", "status", "event_start_date", "id"),
+        Index("ix_events_format_event_start_date", "format", "event_start_date", "id"),
+        # Version of the events list.
+        Index("ix_events_updated_at", "updated_at"),
+        # Full-text search over the search document.
+        Index("ix_events_search_vector", "search_vector", postgresql_using="gin"),
+        # Fuzzy autocomplete.
+        Index(
+            "ix_events_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ),
+    )
 
     # Basic fields
     name: Mapped[IndexedString]
@@ -45,16 +67,20 @@ class Event(Base):
     )
 
     # Relationships
+    # Loaded only on request, see the loader profiles of EventRepository.
     organizers: Mapped[list["Organizer"]] = relationship(
         "Organizer",
         secondary="event_organizers",
         back_populates="events",
-        lazy="select",
+        lazy="raise",
     )
-    location: Mapped["Location"] = relationship("Location", back_populates="events")
-    category: Mapped["Category"] = relationship("Category", back_populates="events")
+    location: Mapped["Location"] = relationship("Location", back_populates="events", lazy="raise")
+    category: Mapped["Category"] = relationship("Category", back_populates="events", lazy="raise")
     registered_profiles: Mapped[list["Profile"]] = relationship(
-        "Profile", secondary="event_registrations", back_populates="registered_events"
+        "Profile",
+        secondary="event_registrations",
+        back_populates="registered_events",
+        lazy="raise",
     )
 
     # Enum fields
@@ -76,6 +102,12 @@ class Event(Base):
     event_start_date: Mapped[datetime]
     event_end_date: Mapped[datetime]
     registration_deadline: Mapped[datetime] = mapped_column(nullable=True)
+    # Naive UTC whatever the time zone of the session, like the Last-Modified it is sent as.
+    # Also moved by the events_related_version_update triggers, when the location,
+    # category or organizers served with the event change.
+    updated_at: Mapped[datetime] = mapped_column(
+        default=func.timezone("utc", func.now()), onupdate=func.timezone("utc", func.now())
+    )
 
     # String fields
     meeting_link: Mapped[BasicNullString]
@@ -85,3 +117,45 @@ class Event(Base):
     max_participants: Mapped[BasicNullInteger]
     price: Mapped[Decimal] = mapped_column(Numeric(10, 2), nullable=True)
     current_participants: Mapped[BasicNullInteger]
+    # Registrations by status, maintained by the event_registrations_count_update
+    # triggers and rebuilt by the reconciliation job.
+    registered_count: Mapped[CountInteger]
+    confirmed_count: Mapped[CountInteger]
+    waitlisted_count: Mapped[CountInteger]
+    attended_count: Mapped[CountInteger]
+
+    # Search fields
+    # Weighted document of name, category, organizer and description,
+    # maintained by the events_search_vector_update trigger.
+    search_vector: Mapped[str] = mapped_column(TSVECTOR, nullable=True, deferred=True)
+
+
+# Sort key of the price ordering: free events (NULL price) sort as zero-priced.
+# The literal 0 keeps the query expression identical to the indexed one.
+event_price_sort_key = func.coalesce(Event.price, literal_column("0"))
+# Published and planned events. Not applied by default: the list and search return
+# every event unless filtered with is_published and status; scopes registrations.
+event_is_upcoming = Event.is_published & (Event.status == EventStatus.PLANNED)
+# Events accepting registrations. The deadline is naive UTC, compared with the time
+# in UTC so the result does not depend on the time zone of the session.
+event_registration_open = event_is_upcoming & or_(
+    Event.registration_deadline.is_(None),
+    Event.registration_deadline > func.timezone("utc", func.now()),
+)
+
+# Price order of the events search.
+Index("ix_events_price_sort_key", event_price_sort_key, Event.id)
+Index("ix_events_category_id_price_sort_key", Event.category_id, event_price_sort_key, Event.id)
+# Partial indexes for the published and planned events, the bulk of the search traffic.
+Index(
+    "ix_events_upcoming_event_start_date",
+    Event.event_start_date,
+    Event.id,
+    postgresql_where=event_is_upcoming,
+)
+Index(
+    "ix_events_upcoming_price_sort_key",
+    event_price_sort_key,
+    Event.id,
+    postgresql_where=event_is_upcoming,
+)
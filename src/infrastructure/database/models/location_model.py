@@ -1,5 +1,6 @@
 from typing import TYPE_CHECKING
 
+from sqlalchemy import Index
 from sqlalchemy.orm import Mapped, relationship
 
 from src.infrastructure.database.base import Base, BasicString, IndexedString
@@ -15,6 +16,21 @@ class Location(Base):
     """
 
     __tablename__ = "locations"
+    __table_args__ = (
+        # Fuzzy autocomplete.
+        Index(
+            "ix_locations_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_locations_city_trgm",
+            "city",
+            postgresql_using="gin",
+            postgresql_ops={"city": "gin_trgm_ops"},
+        ),
+    )
 
     # String fields
     name: Mapped[BasicString]
@@ -24,5 +40,5 @@ class Location(Base):
 
     # Relationships
     events: Mapped["Event"] = relationship(
-        "Event", back_populates="location", cascade="all, delete-orphan"
+        "Event", back_populates="location", cascade="all, delete-orphan", lazy="raise"
     )
@@ -1,6 +1,6 @@
 from typing import TYPE_CHECKING
 
-from sqlalchemy import CheckConstraint, ForeignKey, Numeric
+from sqlalchemy import CheckConstraint, ForeignKey, Index, Numeric
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.infrastructure.database.base import (
@@ -23,6 +23,15 @@ class Organizer(Base):
     """
 
     __tablename__ = "organizers"
+    __table_args__ = (
+        # Fuzzy autocomplete.
+        Index(
+            "ix_organizers_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ),
+    )
 
     # Foreign Keys
     user_id: Mapped[int] = mapped_column(
@@ -33,12 +42,12 @@ class Organizer(Base):
     events: Mapped[list["Event"]] = relationship(
         "Event",
         secondary="event_organizers",
-        lazy="selectin",
+        lazy="raise",
         back_populates="organizers",
     )
     user: Mapped["User"] = relationship(
         "User",
-        lazy="joined",
+        lazy="raise",
         back_populates="organizer_profile",
         uselist=False,
     )
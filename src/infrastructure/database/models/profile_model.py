@@ -29,14 +29,14 @@ class Profile(Base):
     user: Mapped["User"] = relationship(
         "User",
         back_populates="profile",
-        lazy="joined",
+        lazy="raise",
         uselist=False,
     )
     registered_events: Mapped[list["Event"]] = relationship(
         "Event",
         secondary="event_registrations",
         back_populates="registered_profiles",
-        lazy="selectin",
+        lazy="raise",
     )
 
     # Boolean fields
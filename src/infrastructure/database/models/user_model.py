@@ -35,12 +35,12 @@ class User(Base):
 
     # Relationships
     profile: Mapped["Profile"] = relationship(
-        "Profile", back_populates="user", uselist=False, lazy="joined", cascade="all, delete-orphan"
+        "Profile", back_populates="user", uselist=False, lazy="raise", cascade="all, delete-orphan"
     )
     organizer_profile: Mapped["Organizer"] = relationship(
         "Organizer",
         back_populates="user",
         uselist=False,
-        lazy="joined",
+        lazy="raise",
         cascade="all, delete-orphan",
     )
@@ -0,0 +1,91 @@
+import asyncio
+import time
+from dataclasses import dataclass
+from uuid import uuid4
+
+from sqlalchemy import exc
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry, Pool
+
+
+@dataclass
+class PoolMetrics:
+    """Checkout counters of a connection pool, per process.
+
+    Wait time is the time to obtain a connection from the pool, including
+    opening a new one when the pool is not full yet.
+
+    Attributes:
+        checkouts: Connections handed out
+        timeouts: Checkouts that gave up after the pool timeout
+        wait_seconds_total: Sum of the wait time of all checkouts
+        wait_seconds_max: Longest wait time of a checkout
+
+    """
+
+    checkouts: int = 0
+    timeouts: int = 0
+    wait_seconds_total: float = 0.0
+    wait_seconds_max: float = 0.0
+
+    @property
+    def wait_seconds_avg(self) -> float:
+        """Average wait time of a checkout."""
+        return self.wait_seconds_total / self.checkouts if self.checkouts else 0.0
+
+    def record_wait(self, seconds: float) -> None:
+        """Record the wait time of a successful checkout."""
+        self.checkouts += 1
+        self.wait_seconds_total += seconds
+        self.wait_seconds_max = max(self.wait_seconds_max, seconds)
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """Queue pool of the async engine recording checkout wait times."""
+
+    def __init__(self, *args: object, **kwargs: object) -> None:
+        """Initialize pool, arguments are the ones of AsyncAdaptedQueuePool."""
+        super().__init__(*args, **kwargs)  # type: ignore[arg-type]
+        self.metrics = PoolMetrics()
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        """Check out a connection, timing the wait for a free one."""
+        started = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except exc.TimeoutError:
+            self.metrics.timeouts += 1
+            raise
+        self.metrics.record_wait(time.perf_counter() - started)
+        return connection
+
+
+def pool_metrics(pool: Pool) -> PoolMetrics | None:
+    """Return checkout metrics of the pool, None if the pool is not instrumented."""
+    return pool.metrics if isinstance(pool, InstrumentedAsyncQueuePool) else None
+
+
+def unique_prepared_statement_name() -> str:
+    """Name prepared statements uniquely, PgBouncer may run them on another server connection."""
+    return f"__asyncpg_{uuid4()}__"
+
+
+async def warm_up(engine: AsyncEngine, connections: int) -> None:
+    """Open connections of the engine pool at once, then return them to the pool idle.
+
+    Args:
+        engine: Engine of the pool
+        connections: Connections to open, at most the pool size stay open
+
+    """
+    opened = await asyncio.gather(
+        *(engine.connect().start() for _ in range(connections)), return_exceptions=True
+    )
+    try:
+        for result in opened:
+            if isinstance(result, BaseException):
+                raise result
+    finally:
+        await asyncio.gather(
+            *(conn.close() for conn in opened if isinstance(conn, AsyncConnection))
+        )
@@ -0,0 +1,124 @@
+import logging
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Final
+
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, ExecutionContext
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+# Statements that have a plan, others like transaction control or DDL are not explained.
+EXPLAINABLE_PREFIXES: Final[tuple[str, ...]] = (
+    "select",
+    "insert",
+    "update",
+    "delete",
+    "with",
+    "values",
+)
+logger = logging.getLogger("src.queries")
+
+# Key of the start times of the running statements in Connection.info.
+QUERY_STARTED_KEY: Final[str] = "query_started"
+
+
+@dataclass
+class QueryStats:
+    """Statements executed on behalf of one request, on any engine.
+
+    Attributes:
+        count: Statements executed
+        seconds_total: Time spent executing them, fetching included for buffered results
+        slowest_seconds: Time of the slowest statement
+        slowest_statement: SQL of the slowest statement, with placeholders
+        slowest_parameters: Parameters of the slowest statement, None for executemany
+        slowest_engine: Engine the slowest statement ran on, to explain it
+
+    """
+
+    count: int = 0
+    seconds_total: float = 0.0
+    slowest_seconds: float = 0.0
+    slowest_statement: str | None = None
+    slowest_parameters: Any = None
+    slowest_engine: AsyncEngine | None = None
+
+    def record(
+        self,
+        seconds: float,
+        statement: str,
+        parameters: Any,  # noqa: ANN401
+        engine: AsyncEngine,
+    ) -> None:
+        """Record an executed statement."""
+        self.count += 1
+        self.seconds_total += seconds
+        if seconds >= self.slowest_seconds:
+            self.slowest_seconds = seconds
+            self.slowest_statement = statement
+            self.slowest_parameters = parameters
+            self.slowest_engine = engine
+
+
+# Stats of the current request, set by the query timing middleware, None outside requests.
+query_stats: ContextVar[QueryStats | None] = ContextVar("query_stats", default=None)
+
+
+def instrument_engine(engine: AsyncEngine) -> None:
+    """Time the statements of the engine into the stats of the current request.
+
+    Statements run outside a request cost a context variable lookup. Statements
+    of requests are logged at debug level with their time, without parameters.
+    """
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def before_cursor_execute(
+        conn: Connection,
+        cursor: Any,  # noqa: ANN401
+        statement: str,
+        parameters: Any,  # noqa: ANN401
+        context: ExecutionContext | None,
+        executemany: bool,  # noqa: FBT001
+    ) -> None:
+        if query_stats.get() is not None:
+            conn.info.setdefault(QUERY_STARTED_KEY, []).append(time.perf_counter())
+
+    @event.listens_for(engine.sync_engine, "after_cursor_execute")
+    def after_cursor_execute(
+        conn: Connection,
+        cursor: Any,  # noqa: ANN401
+        statement: str,
+        parameters: Any,  # noqa: ANN401
+        context: ExecutionContext | None,
+        executemany: bool,  # noqa: FBT001
+    ) -> None:
+        stats = query_stats.get()
+        started = conn.info.get(QUERY_STARTED_KEY)
+        if stats is None or not started:
+            return
+        seconds = time.perf_counter() - started.pop()
+        stats.record(seconds, statement, None if executemany else parameters, engine)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Query took %.1fms: %s", seconds * 1000, statement)
+
+
+async def explain(engine: AsyncEngine, statement: str, parameters: Any) -> str | None:  # noqa: ANN401
+    """Get the plan of a statement with its parameters, without running it.
+
+    Args:
+        engine: Engine the statement ran on
+        statement: SQL with the placeholders of the driver
+        parameters: Parameters of the driver, None for executemany
+
+    Returns:
+        Text plan, None if the statement has no plan or ran with executemany
+
+    """
+    if parameters is None or not statement.lstrip().lower().startswith(EXPLAINABLE_PREFIXES):
+        return None
+    # Not part of the stats of the request that ran the statement.
+    query_stats.set(None)
+    async with engine.connect() as conn:
+        result = await conn.exec_driver_sql(f"EXPLAIN {statement}", parameters)
+        return "\n".join(row[0] for row in result)
@@ -0,0 +1,121 @@
+import asyncio
+import logging
+import sys
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Final
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.infrastructure.cache.backends import create_cache_backend
+from src.infrastructure.cache.events import EventResponseCache
+from src.infrastructure.database.config import get_sqlalchemy_config
+from src.infrastructure.database.settings import settings
+from src.infrastructure.repositories.registration import EVENT_COUNTERS, RegistrationRepository
+
+logger = logging.getLogger("src.reconcile")
+
+# Events locked and counted per transaction.
+RECONCILE_BATCH_SIZE: Final[int] = 1000
+# Drifted events logged one by one, the others only count in the totals.
+MAX_LOGGED_DRIFTS: Final[int] = 20
+
+
+@dataclass
+class ReconcileReport:
+    """Outcome of a reconciliation of the event counters.
+
+    Attributes:
+        events: Events checked
+        drifted: Events with at least one wrong counter
+        drift: Sum of the absolute errors, by counter
+        elapsed: Duration in seconds
+
+    """
+
+    events: int = 0
+    drifted: int = 0
+    drift: dict[str, int] = field(default_factory=lambda: dict.fromkeys(EVENT_COUNTERS, 0))
+    elapsed: float = 0.0
+
+
+async def reconcile(
+    session_maker: Callable[[], AsyncSession],
+    batch_size: int = RECONCILE_BATCH_SIZE,
+    cache: EventResponseCache | None = None,
+) -> ReconcileReport:
+    """Rebuild the registration counters of all events, in batches of events.
+
+    Args:
+        session_maker: Factory of database sessions
+        batch_size: Events locked and counted per transaction
+        cache: Response cache of the events to invalidate for the drifted ones
+
+    Returns:
+        Checked and drifted events, and the drift of every counter
+
+    """
+    report = ReconcileReport()
+    started = time.perf_counter()
+    after_id = 0
+    while True:
+        async with session_maker() as session:
+            repo = RegistrationRepository(session=session, cache=cache)
+            event_ids, rows = await repo.reconcile_counts(after_id, batch_size, auto_commit=True)
+        if not event_ids:
+            break
+        after_id = event_ids[-1]
+        report.events += len(event_ids)
+        for row in rows:
+            values = row._mapping
+            if report.drifted < MAX_LOGGED_DRIFTS:
+                logger.warning(
+                    "Event %d counters drifted: %s",
+                    row.id,
+                    ", ".join(
+                        f"{counter} {values[f'stored_{counter}']} -> {values[counter]}"
+                        for counter in EVENT_COUNTERS
+                        if values[f"stored_{counter}"] != values[counter]
+                    ),
+                )
+            report.drifted += 1
+            for counter in EVENT_COUNTERS:
+                report.drift[counter] += abs(values[counter] - (values[f"stored_{counter}"] or 0))
+    report.elapsed = time.perf_counter() - started
+    logger.info(
+        "Reconciled %d events in %.2fs, %d drifted (%s)",
+        report.events,
+        report.elapsed,
+        report.drifted,
+        ", ".join(f"{counter} {drift}" for counter, drift in report.drift.items()),
+    )
+    return report
+
+
+async def run(batch_size: int = RECONCILE_BATCH_SIZE) -> ReconcileReport:
+    """Reconcile the counters of the events of the configured database.
+
+    Responses of drifted events cached in redis are dropped, the in process
+    caches of the app are out of reach and expire on their own.
+    """
+    session_maker = get_sqlalchemy_config().create_session_maker()
+    if settings.CACHE_BACKEND != "redis":
+        return await reconcile(session_maker, batch_size)
+    backend = create_cache_backend(
+        settings.CACHE_BACKEND,
+        maxsize=settings.EVENT_CACHE_SIZE,
+        ttl=settings.EVENT_CACHE_TTL,
+        redis_url=settings.REDIS_URL,
+    )
+    try:
+        cache = EventResponseCache(backend=backend, ttl=settings.EVENT_CACHE_TTL)
+        return await reconcile(session_maker, batch_size, cache)
+    finally:
+        await backend.close()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(message)s")
+    # Exits with 1 when counters had drifted, for schedulers to alert on.
+    sys.exit(1 if asyncio.run(run()).drifted else 0)
@@ -0,0 +1,162 @@
+import asyncio
+import contextlib
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
+from logging import getLogger
+from typing import Final
+
+from litestar import Request
+from litestar.datastructures import Cookie, MutableScopeHeaders
+from litestar.types import Message, Scope
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+logger = getLogger("src.database")
+
+# Cookie of clients that wrote recently, their reads go to the primary.
+PRIMARY_PIN_COOKIE: Final[str] = "read_primary"
+# Header of clients asking to read from the primary, e.g. right after a write.
+READ_PRIMARY_HEADER: Final[str] = "x-read-primary"
+# Route handler opt of handlers that must read from the primary.
+READ_PRIMARY_OPT: Final[str] = "read_primary"
+
+SAFE_METHODS: Final[frozenset[str]] = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+@dataclass
+class Replica:
+    """Read replica with the result of its last health check.
+
+    Attributes:
+        engine: Engine of the replica
+        session_maker: Factory of read sessions on the engine
+        healthy: Whether the last health check, or the last query, succeeded
+
+    """
+
+    engine: AsyncEngine
+    session_maker: async_sessionmaker[AsyncSession] = field(init=False)
+    healthy: bool = True
+
+    def __post_init__(self) -> None:
+        """Create the session maker of the engine."""
+        self.session_maker = async_sessionmaker(self.engine, expire_on_commit=False)
+
+    @property
+    def name(self) -> str:
+        """URL of the replica without the password, for logs."""
+        return self.engine.url.render_as_string(hide_password=True)
+
+
+class ReplicaRouter:
+    """Round-robin over the healthy read replicas.
+
+    A background task checks every replica each health interval. A replica
+    failing a check, or a query, is skipped until it passes a check again.
+    When no replica is healthy reads fall back to the primary.
+    """
+
+    def __init__(self, engines: Sequence[AsyncEngine], health_interval: float = 5.0) -> None:
+        """Initialize router.
+
+        Args:
+            engines: Engines of the replicas
+            health_interval: Seconds between health checks, also the timeout of a check
+
+        """
+        self.replicas = [Replica(engine=engine) for engine in engines]
+        self.health_interval = health_interval
+        self._next = 0
+        self._monitor_task: asyncio.Task[None] | None = None
+
+    def choose(self) -> Replica | None:
+        """Return the next healthy replica, None if there is none."""
+        for _ in range(len(self.replicas)):
+            replica = self.replicas[self._next]
+            self._next = (self._next + 1) % len(self.replicas)
+            if replica.healthy:
+                return replica
+        return None
+
+    def mark_down(self, replica: Replica) -> None:
+        """Skip the replica until it passes a health check."""
+        if replica.healthy:
+            logger.warning("Read replica %s is down", replica.name)
+        replica.healthy = False
+
+    async def check(self, replica: Replica) -> None:
+        """Run the health check of the replica and record its result."""
+        try:
+            async with asyncio.timeout(self.health_interval), replica.engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
+        except Exception:  # noqa: BLE001
+            self.mark_down(replica)
+            return
+        if not replica.healthy:
+            logger.info("Read replica %s is up", replica.name)
+        replica.healthy = True
+
+    async def check_all(self) -> None:
+        """Run the health checks of all replicas concurrently."""
+        await asyncio.gather(*(self.check(replica) for replica in self.replicas))
+
+    async def _monitor(self) -> None:
+        """Check the replicas every health interval."""
+        while True:
+            await asyncio.sleep(self.health_interval)
+            await self.check_all()
+
+    async def start(self) -> None:
+        """Check the replicas and start the background health checks."""
+        if self.replicas:
+            await self.check_all()
+            self._monitor_task = asyncio.create_task(self._monitor())
+
+    async def stop(self) -> None:
+        """Stop the health checks and close the replica connections."""
+        if self._monitor_task is not None:
+            self._monitor_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._monitor_task
+            self._monitor_task = None
+        for replica in self.replicas:
+            await replica.engine.dispose()
+
+
+def reads_from_primary(request: Request) -> bool:
+    """Check whether the queries of the request must run on the primary.
+
+    Unsafe requests write, and handlers may opt in with the read_primary opt.
+    Clients read their own writes through the pin cookie set after a write,
+    or by sending the X-Read-Primary header.
+    """
+    return (
+        request.method not in SAFE_METHODS
+        or bool(request.route_handler.opt.get(READ_PRIMARY_OPT))
+        or PRIMARY_PIN_COOKIE in request.cookies
+        or READ_PRIMARY_HEADER in request.headers
+    )
+
+
+def primary_pin_handler_maker(pin_seconds: int) -> Callable[[Message, Scope], None]:
+    """Build the before send hook pinning clients to the primary after a successful write.
+
+    Args:
+        pin_seconds: Lifetime of the pin cookie, an upper bound of the replication lag
+    Returns:
+        Hook setting the pin cookie on responses of unsafe requests
+
+    """
+    cookie = Cookie(key=PRIMARY_PIN_COOKIE, value="1", max_age=pin_seconds, httponly=True)
+    header = cookie.to_header(header="")
+
+    def handler(message: Message, scope: Scope) -> None:
+        """Set the pin cookie on a successful response of an unsafe request."""
+        if (
+            message["type"] == "http.response.start"
+            and scope.get("method") not in SAFE_METHODS
+            and message["status"] < 400
+        ):
+            MutableScopeHeaders.from_message(message).add("set-cookie", header)
+
+    return handler
@@ -1,35 +1,236 @@
+import asyncio
 import logging
+import random
 import sys
+import time
 from abc import ABC, abstractmethod
+from collections import deque
+from collections.abc import AsyncIterator, Callable, Iterator
+from concurrent.futures import Executor
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Any, ClassVar, cast
 
 from colorama import Fore, Style, init
 from faker import Faker
-from sqlalchemy import delete
+from sqlalchemy import Table
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import DeclarativeBase
+
+from src.infrastructure.database.base import Base
+from src.infrastructure.database.seeders.constants import BATCH_SIZE, SEED_NOW, TEXT_POOL_SIZE
+from src.infrastructure.database.seeders.loader import (
+    load_rows,
+    reset_id_sequence,
+    set_user_triggers,
+)
 
 # Init for colorama
 init()
 
 
+@dataclass(frozen=True)
+class SeedOptions:
+    """Options of a seeding run, shared by the seeders and their generation workers.
+
+    Attributes:
+        scale: Scale factor of the number of rows
+        batch_size: Rows generated and loaded at once
+        seed: Seed of the generated data, None for random data
+        now: Reference time of the generated dates, naive UTC like the database defaults.
+            Defaults to SEED_NOW with a seed, else to the current time
+
+    """
+
+    scale: float = 1.0
+    batch_size: int = BATCH_SIZE
+    seed: int | None = None
+    now: datetime | None = None
+
+    def __post_init__(self) -> None:
+        """Set the default reference time, fixed for seeded runs to reproduce their dates."""
+        if self.now is None:
+            now = SEED_NOW if self.seed is not None else datetime.now(UTC).replace(tzinfo=None)
+            object.__setattr__(self, "now", now)
+
+
+@dataclass(frozen=True)
+class SeedResult:
+    """Loaded rows and timing of a seeder.
+
+    Attributes:
+        table: Seeded table
+        rows: Loaded rows
+        started: Start of the seeder, time.perf_counter value
+        elapsed: Seconds spent generating and loading the rows
+
+    """
+
+    table: str
+    rows: int
+    started: float
+    elapsed: float
+
+    @property
+    def rows_per_second(self) -> float:
+        """Loading rate of the seeder."""
+        return self.rows / self.elapsed if self.elapsed else 0.0
+
+
 class BaseSeeder(ABC):
-    """Base class seeder, defines logging and faker."""
+    """Base class of the bulk seeders, defines batching, logging and faker.
+
+    A seeder generates the rows of its table for a number of units, e.g. users,
+    or profiles with all their registrations, proportional to the scale factor.
+    Rows are generated batch by batch, in process or in a process pool, and
+    streamed into the bulk loader in one transaction.
+
+    With a seed, Faker and the random generator of every batch are seeded from
+    it, so a seed and batch size give the same rows with any number of workers.
+    """
+
+    model: ClassVar[type[Base]]
+    columns: ClassVar[tuple[str, ...]]
+    # Seeders of the tables referenced by the rows, they run first.
+    depends_on: ClassVar[tuple[type["BaseSeeder"], ...]] = ()
+    # Load without the triggers of the table, for data they derive that is rebuilt after seeding.
+    disable_triggers: ClassVar[bool] = False
+
+    def __init__(self, session: AsyncSession | None, options: SeedOptions) -> None:
+        """Initialize seeder.
 
-    def __init__(self, session: AsyncSession) -> None:
-        """Initialize seeder with database session, faker instance and logger."""
+        Args:
+            session: Database session, None in generation workers
+            options: Options of the seeding run
+
+        """
+        # Timing includes generating the text pools.
+        self.started = time.perf_counter()
         self.session = session
+        self.options = options
+        self.scale = options.scale
+        self.batch_size = options.batch_size
+        # Always set once the options are initialized.
+        self.now = cast(datetime, options.now)
         self.faker = Faker("en-US")
+        if options.seed is not None:
+            self.faker.seed_instance(f"{options.seed}:{self.table.name}")
+        self.random = random.Random()  # noqa: S311
         self.logger = self._setup_logger()
 
+    @property
+    def table(self) -> Table:
+        """Table of the seeded model."""
+        return cast(Table, self.model.__table__)
+
     @abstractmethod
-    async def run(self) -> None:
-        """Execute seeding process.Must be implemented by derived classes."""
+    def count(self) -> int:
+        """Return the number of units to generate at the scale."""
+
+    @abstractmethod
+    def generate(self, start: int, stop: int) -> Iterator[tuple[Any, ...]]:
+        """Generate the rows of the units from start to stop, values in the order of columns.
+
+        Ids are explicit, the id of the unit at index i is i + 1, so rows of other
+        tables can reference them without reading them back.
+        """
 
-    async def clear_table(self, model: type[DeclarativeBase]) -> None:
-        """Докстринг."""
-        await self.session.execute(delete(model))
-        await self.session.commit()
-        self.log(f"Cleared {model.__tablename__}")
+    def batch(self, start: int, stop: int) -> list[tuple[Any, ...]]:
+        """Generate the rows of a batch, with the random generator seeded for the batch."""
+        self.random.seed(self._batch_seed(start))
+        return list(self.generate(start, stop))
+
+    def _batch_seed(self, start: int) -> str | None:
+        """Return the seed of the batch starting at start, None without a run seed."""
+        if self.options.seed is None:
+            return None
+        return f"{self.options.seed}:{self.table.name}:{start}"
+
+    def scaled(self, rows_per_scale: int) -> int:
+        """Return the number of rows at the scale, at least one."""
+        return max(1, round(rows_per_scale * self.scale))
+
+    def text_pool(self, make: Callable[[], str]) -> list[str]:
+        """Generate texts to pick from for every row, Faker is too slow to call per row."""
+        return [make() for _ in range(TEXT_POOL_SIZE)]
+
+    async def batches(
+        self, executor: Executor | None = None, max_pending: int = 1
+    ) -> AsyncIterator[list[tuple[Any, ...]]]:
+        """Generate the batches of rows of the table in order.
+
+        Args:
+            executor: Process pool generating the batches, None to generate them in process
+            max_pending: Batches generated ahead of the loader by the pool
+
+        Yields:
+            Rows of the next batch
+
+        """
+        total = self.count()
+        ranges = [
+            (start, min(start + self.batch_size, total))
+            for start in range(0, total, self.batch_size)
+        ]
+        if executor is None:
+            for start, stop in ranges:
+                yield self.batch(start, stop)
+            return
+
+        loop = asyncio.get_running_loop()
+        pending: deque[asyncio.Future[list[tuple[Any, ...]]]] = deque()
+        for start, stop in ranges:
+            pending.append(
+                loop.run_in_executor(
+                    executor, generate_batch, type(self), self.options, start, stop
+                )
+            )
+            if len(pending) >= max_pending:
+                yield await pending.popleft()
+        while pending:
+            yield await pending.popleft()
+
+    async def run(self, executor: Executor | None = None, max_pending: int = 1) -> SeedResult:
+        """Generate and load all rows of the table.
+
+        Args:
+            executor: Process pool generating the batches, None to generate them in process
+            max_pending: Batches generated ahead of the loader by the pool
+
+        Returns:
+            Loaded rows and timing of the seeder
+
+        """
+        session = cast(AsyncSession, self.session)
+        self.log(f"Starting {self.table.name} seeding...")
+        loaded = 0
+        try:
+            if self.disable_triggers:
+                await set_user_triggers(session, self.table, enabled=False)
+            async for rows in self.batches(executor, max_pending):
+                await load_rows(session, self.table, self.columns, rows)
+                loaded += len(rows)
+            if "id" in self.columns:
+                await reset_id_sequence(session, self.table)
+            if self.disable_triggers:
+                await set_user_triggers(session, self.table, enabled=True)
+            await session.commit()
+        except Exception as e:
+            self.log(f"Error seeding {self.table.name}: {str(e)}", level="error")
+            await session.rollback()
+            raise
+
+        result = SeedResult(
+            table=self.table.name,
+            rows=loaded,
+            started=self.started,
+            elapsed=time.perf_counter() - self.started,
+        )
+        self.log(
+            f"Loaded {loaded} rows into {self.table.name} in {result.elapsed:.2f}s "
+            f"({result.rows_per_second:,.0f} rows/s)",
+            level="success",
+        )
+        return result
 
     def _setup_logger(self) -> logging.Logger:
         """Create and configure logger instance for the seeder class."""
@@ -67,3 +268,28 @@ class BaseSeeder(ABC):
         elif level == "success":
             message = f"{Fore.GREEN}{message}{Style.RESET_ALL}"
             self.logger.info(message)
+
+
+# Seeders of a generation worker process, their text pools are generated once.
+_worker_seeders: dict[tuple[type[BaseSeeder], SeedOptions], BaseSeeder] = {}
+
+
+def generate_batch(
+    seeder_class: type[BaseSeeder], options: SeedOptions, start: int, stop: int
+) -> list[tuple[Any, ...]]:
+    """Generate the rows of a batch in a worker process of the pool.
+
+    Args:
+        seeder_class: Seeder of the table
+        options: Options of the seeding run
+        start: Index of the first unit of the batch
+        stop: Index after the last unit of the batch
+
+    Returns:
+        Rows of the batch
+
+    """
+    seeder = _worker_seeders.get((seeder_class, options))
+    if seeder is None:
+        seeder = _worker_seeders[seeder_class, options] = seeder_class(None, options)
+    return seeder.batch(start, stop)
@@ -1,3 +1,4 @@
+from datetime import datetime
 from typing import Final
 
 categories: Final[list[str]] = [
@@ -25,4 +26,20 @@ locations: Final[list[str]] = [
     "Tech Academy Hall",
 ]
 
-NUM_TEST_DATA: Final[int] = 10
+# Rows per unit of the seeding scale factor, --scale 100 builds 1M events.
+LOCATIONS_PER_SCALE: Final[int] = 100
+USERS_PER_SCALE: Final[int] = 1_000
+ORGANIZERS_PER_SCALE: Final[int] = 100
+EVENTS_PER_SCALE: Final[int] = 10_000
+# Registrations of each profile, on distinct events.
+REGISTRATIONS_PER_PROFILE: Final[int] = 20
+
+# Reference time of the dates of seeded runs, so a seed gives the same dates on any day.
+SEED_NOW: Final[datetime] = datetime(2025, 1, 1)
+
+# Rows generated and loaded at once.
+BATCH_SIZE: Final[int] = 10_000
+# Distinct generated texts, reused across rows, Faker is too slow for every row.
+TEXT_POOL_SIZE: Final[int] = 1_000
+# Password of all seeded users, hashed once.
+SEED_PASSWORD: Final[str] = "password"  # noqa: S105
@@ -1,4 +1,5 @@
-from typing import override
+from collections.abc import Iterator
+from typing import Any, override
 
 from src.infrastructure.database.models.category_model import Category
 from src.infrastructure.database.seeders.base_seeder import BaseSeeder
@@ -6,25 +7,17 @@ from src.infrastructure.database.seeders.constants import categories
 
 
 class CategorySeeder(BaseSeeder):
-    @override
-    async def run(self) -> None:
-        """Category seeder run."""
-        try:
-            self.log("Starting category seeding...")
-            await self.clear_table(Category)
-
-            for category_name in categories:
-                category = Category(
-                    name=category_name,
-                    slug=self.faker.slug(),
-                    description=self.faker.text(),
-                )
-                self.log(f"Created category - {category_name}")
-                self.session.add(category)
+    model = Category
+    columns = ("id", "created_at", "name", "slug", "description")
 
-            await self.session.commit()
-            self.log("Categories created successfully!", level="success")
+    @override
+    def count(self) -> int:
+        """Categories are fixed, whatever the scale."""
+        return len(categories)
 
-        except Exception as e:
-            self.log(f"Error creating categories: {str(e)}", level="error")
-            await self.session.rollback()
+    @override
+    def generate(self, start: int, stop: int) -> Iterator[tuple[Any, ...]]:
+        for index in range(start, stop):
+            name = categories[index]
+            slug = name.lower().replace("/", "-").replace(" ", "-")
+            yield index + 1, self.now, name, slug, self.faker.text()
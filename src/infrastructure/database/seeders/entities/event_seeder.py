@@ -1,76 +1,100 @@
+from collections.abc import Iterator
 from datetime import timedelta
-from typing import override
+from decimal import Decimal
+from typing import Any, override
 
 from src.infrastructure.database.models.enums import Currency, EventFormat, EventStatus
 from src.infrastructure.database.models.event_model import Event
 from src.infrastructure.database.seeders.base_seeder import BaseSeeder
-from src.infrastructure.database.seeders.constants import NUM_TEST_DATA
+from src.infrastructure.database.seeders.constants import (
+    EVENTS_PER_SCALE,
+    LOCATIONS_PER_SCALE,
+    ORGANIZERS_PER_SCALE,
+    categories,
+)
+from src.infrastructure.database.seeders.entities.category_seeder import CategorySeeder
+from src.infrastructure.database.seeders.entities.location_seeder import LocationSeeder
+from src.infrastructure.database.seeders.entities.organizer_seeder import OrganizerSeeder
 
 
 class EventSeeder(BaseSeeder):
-    @override
-    async def run(self) -> None:
-        try:
-            self.log("Starting events seeding...")
-            await self.clear_table(Event)
-
-            for _ in range(NUM_TEST_DATA):
-                event_name = f"{self.faker.bs().title()} {self.faker.company_suffix()} Conference"
-                is_online = self.faker.boolean()
-                pub_date = self.faker.date_between(start_date="-30d", end_date="now")
-                event_start = self.faker.date_time_between(
-                    start_date=pub_date, end_date=pub_date + timedelta(days=90)
-                )
-                event_end_date = self.faker.date_time_between(
-                    start_date=event_start, end_date=event_start + timedelta(days=7)
-                )
-                registration_deadline = self.faker.date_time_between(
-                    start_date=pub_date, end_date=event_start
-                )
-                current_participants = self.faker.random_int(min=1, max=250)
-                price = (
-                    self.faker.pydecimal(left_digits=4, right_digits=2, positive=True)
-                    if self.faker.boolean()
-                    else None
-                )
-
-                event = Event(
-                    name=event_name,
-                    description=self.faker.paragraph(nb_sentences=4),
-                    # Foreign Keys
-                    organizer_id=self.faker.random_int(min=1, max=10),
-                    location_id=self.faker.random_int(min=1, max=10),
-                    category_id=self.faker.random_int(min=1, max=10),
-                    # Enum fields
-                    format=self.faker.random_element(EventFormat),
-                    status=self.faker.random_element(EventStatus),
-                    currency=(
-                        self.faker.random_element(Currency) if price is not None else Currency.USD
-                    ),
-                    # Boolean fields
-                    is_published=self.faker.boolean(),
-                    is_online=is_online,
-                    is_verify=self.faker.boolean(),
-                    # Date fields (уже есть)
-                    pub_date=pub_date,
-                    event_start_date=event_start,
-                    event_end_date=event_end_date,
-                    registration_deadline=registration_deadline,
-                    # String fields
-                    meeting_link=self.faker.url() if is_online else None,
-                    timezone=self.faker.timezone(),
-                    # Numeric fields
-                    current_participants=current_participants,
-                    max_participants=self.faker.random_int(min=current_participants, max=500),
-                    price=price,
-                )
+    model = Event
+    depends_on = (CategorySeeder, LocationSeeder, OrganizerSeeder)
+    columns = (
+        "id",
+        "created_at",
+        "updated_at",
+        "name",
+        "description",
+        "organizer_id",
+        "location_id",
+        "category_id",
+        "format",
+        "status",
+        "currency",
+        "is_published",
+        "is_online",
+        "is_verify",
+        "pub_date",
+        "event_start_date",
+        "event_end_date",
+        "registration_deadline",
+        "meeting_link",
+        "timezone",
+        "current_participants",
+        "max_participants",
+        "price",
+    )
 
-                self.session.add(event)
-                self.log(f"Created event - {event_name}")
+    def __init__(self, *args: Any, **kwargs: Any) -> None:  # noqa: ANN401
+        """Initialize seeder and generate the texts its rows pick from."""
+        super().__init__(*args, **kwargs)
+        self.names = self.text_pool(
+            lambda: f"{self.faker.bs().title()} {self.faker.company_suffix()} Conference"
+        )
+        self.descriptions = self.text_pool(lambda: self.faker.paragraph(nb_sentences=4))
+        self.timezones = self.text_pool(self.faker.timezone)
+        self.organizers = self.scaled(ORGANIZERS_PER_SCALE)
+        self.locations = self.scaled(LOCATIONS_PER_SCALE)
 
-            await self.session.commit()
-            self.log("Events created successfully!", level="success")
+    @override
+    def count(self) -> int:
+        return self.scaled(EVENTS_PER_SCALE)
 
-        except Exception as e:
-            self.log(f"Error creating events: {str(e)}", level="error")
-            await self.session.rollback()
+    @override
+    def generate(self, start: int, stop: int) -> Iterator[tuple[Any, ...]]:
+        rng = self.random
+        formats, statuses, currencies = list(EventFormat), list(EventStatus), list(Currency)
+        for index in range(start, stop):
+            is_online = rng.random() < 0.5
+            pub_date = self.now - timedelta(days=rng.uniform(0, 30))
+            event_start = pub_date + timedelta(days=rng.uniform(0, 90))
+            event_end_date = event_start + timedelta(days=rng.uniform(0, 7))
+            registration_deadline = pub_date + (event_start - pub_date) * rng.random()
+            current_participants = rng.randint(1, 250)
+            has_price = rng.random() < 0.5
+            yield (
+                index + 1,
+                self.now,
+                self.now,
+                rng.choice(self.names),
+                rng.choice(self.descriptions),
+                rng.randint(1, self.organizers),
+                rng.randint(1, self.locations),
+                rng.randint(1, len(categories)),
+                rng.choice(formats),
+                rng.choice(statuses),
+                rng.choice(currencies) if has_price else Currency.USD,
+                rng.random() < 0.5,
+                is_online,
+                rng.random() < 0.5,
+                pub_date,
+                event_start,
+                event_end_date,
+                registration_deadline,
+                f"https://meet.example.com/{index + 1}" if is_online else None,
+                rng.choice(self.timezones),
+                current_participants,
+                rng.randint(current_participants, 500),
+                Decimal(rng.randint(100, 999_999)) / 100 if has_price else None,
+            )
@@ -1,31 +1,33 @@
-from typing import override
+from collections.abc import Iterator
+from typing import Any, override
 
 from src.infrastructure.database.models.location_model import Location
 from src.infrastructure.database.seeders.base_seeder import BaseSeeder
-from src.infrastructure.database.seeders.constants import locations
+from src.infrastructure.database.seeders.constants import LOCATIONS_PER_SCALE, locations
 
 
 class LocationSeeder(BaseSeeder):
-    @override
-    async def run(self) -> None:
-        try:
-            self.log("Starting locations seeding...")
-            await self.clear_table(Location)
-
-            for location_name in locations:
-                location = Location(
-                    name=location_name,
-                    address=self.faker.address(),
-                    city=self.faker.city(),
-                    country=self.faker.country(),
-                )
+    model = Location
+    columns = ("id", "created_at", "name", "address", "city", "country")
 
-                self.log(f"Created location - {location_name}")
-                self.session.add(location)
+    def __init__(self, *args: Any, **kwargs: Any) -> None:  # noqa: ANN401
+        """Initialize seeder and generate the texts its rows pick from."""
+        super().__init__(*args, **kwargs)
+        self.addresses = self.text_pool(self.faker.street_address)
+        self.places = [(self.faker.city(), self.faker.country()) for _ in self.addresses]
 
-            await self.session.commit()
-            self.log("Locations created successfully!", level="success")
+    @override
+    def count(self) -> int:
+        return self.scaled(LOCATIONS_PER_SCALE)
 
-        except Exception as e:
-            self.log(f"Error creating categories: {str(e)}", level="error")
-            await self.session.rollback()
+    @override
+    def generate(self, start: int, stop: int) -> Iterator[tuple[Any, ...]]:
+        for index in range(start, stop):
+            round_number, position = divmod(index, len(locations))
+            name = (
+                locations[position]
+                if round_number == 0
+                else f"{locations[position]} {round_number + 1}"
+            )
+            city, country = self.random.choice(self.places)
+            yield index + 1, self.now, name, self.random.choice(self.addresses), city, country
@@ -1,36 +1,55 @@
-from typing import override
+from collections.abc import Iterator
+from decimal import Decimal
+from typing import Any, override
 
 from src.infrastructure.database.models import Organizer
 from src.infrastructure.database.seeders.base_seeder import BaseSeeder
-from src.infrastructure.database.seeders.constants import NUM_TEST_DATA
+from src.infrastructure.database.seeders.constants import ORGANIZERS_PER_SCALE
+from src.infrastructure.database.seeders.entities.user_seeder import UserSeeder
 
 
 class OrganizerSeeder(BaseSeeder):
-    @override
-    async def run(self) -> None:
-        try:
-            self.log("Starting organizers seeding...")
-            await self.clear_table(Organizer)
-
-            for index in range(1, NUM_TEST_DATA + 1):
-                name = self.faker.company()
-                organizer = Organizer(
-                    user_id=index,
-                    verified=self.faker.boolean(),
-                    website=self.faker.url(),
-                    contact=self.faker.email(),
-                    name=name,
-                    description=self.faker.paragraph(nb_sentences=4),
-                    logo_url=self.faker.image_url(),
-                    rating=self.faker.random_int(1, 5),
-                )
+    model = Organizer
+    depends_on = (UserSeeder,)
+    columns = (
+        "id",
+        "created_at",
+        "user_id",
+        "verified",
+        "website",
+        "contact",
+        "name",
+        "description",
+        "logo_url",
+        "rating",
+    )
 
-                self.log(f"Created location - {name} ")
-                self.session.add(organizer)
+    def __init__(self, *args: Any, **kwargs: Any) -> None:  # noqa: ANN401
+        """Initialize seeder and generate the texts its rows pick from."""
+        super().__init__(*args, **kwargs)
+        self.companies = self.text_pool(self.faker.company)
+        self.descriptions = self.text_pool(lambda: self.faker.paragraph(nb_sentences=4))
 
-            await self.session.commit()
-            self.log("Organizers created successfully!", level="success")
+    @override
+    def count(self) -> int:
+        """Organizers are the first users, fewer than the users at any scale."""
+        return self.scaled(ORGANIZERS_PER_SCALE)
 
-        except Exception as e:
-            self.log(f"Error creating organizers: {str(e)}", level="error")
-            await self.session.rollback()
+    @override
+    def generate(self, start: int, stop: int) -> Iterator[tuple[Any, ...]]:
+        for index in range(start, stop):
+            name = self.random.choice(self.companies)
+            slug = name.lower().replace(" ", "-").replace(",", "")
+            yield (
+                index + 1,
+                self.now,
+                index + 1,
+                self.random.random() < 0.5,
+                f"https://{slug}.example.com",
+                f"contact@{slug}.example.com",
+                name,
+                self.random.choice(self.descriptions),
+                # Logo URLs are unique.
+                f"https://picsum.photos/seed/organizer-{index + 1}/200",
+                Decimal(self.random.randint(100, 500)) / 100,
+            )
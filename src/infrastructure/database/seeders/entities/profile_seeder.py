@@ -1,46 +1,57 @@
-import random
-from typing import override
+from collections.abc import Iterator
+from datetime import date, timedelta
+from typing import Any, override
 
-from sqlalchemy import select
-
-from src.infrastructure.database.models import Category, Profile
+from src.infrastructure.database.models import Profile
 from src.infrastructure.database.models.enums import Gender
 from src.infrastructure.database.seeders.base_seeder import BaseSeeder
-from src.infrastructure.database.seeders.constants import NUM_TEST_DATA
+from src.infrastructure.database.seeders.constants import USERS_PER_SCALE, categories
+from src.infrastructure.database.seeders.entities.user_seeder import UserSeeder
 
 
 class ProfileSeeder(BaseSeeder):
-    @override
-    async def run(self) -> None:
-        try:
-            self.log("Starting profiles seeding...")
-            await self.clear_table(Profile)
-
-            query = select(Category)
-            res = await self.session.execute(query)
-            categories = res.scalars().all()
-            category_names = [category.name for category in categories]
-
-            for index in range(NUM_TEST_DATA):
-                first_name = self.faker.first_name()
-                random_category = random.choice(category_names)  # noqa
-                profile = Profile(
-                    user_id=index,
-                    first_name=first_name,
-                    last_name=self.faker.last_name(),
-                    avatar_url=self.faker.image_url(),
-                    interested_technologies=random_category,
-                    location=self.faker.country(),
-                    birth_date=self.faker.date_of_birth(),
-                    gender=random.choice(list(Gender)),  # noqa
-                )
+    model = Profile
+    depends_on = (UserSeeder,)
+    columns = (
+        "id",
+        "created_at",
+        "user_id",
+        "notifications_enabled",
+        "first_name",
+        "last_name",
+        "avatar_url",
+        "interested_technologies",
+        "location",
+        "birth_date",
+        "gender",
+    )
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:  # noqa: ANN401
+        """Initialize seeder and generate the texts its rows pick from."""
+        super().__init__(*args, **kwargs)
+        self.first_names = self.text_pool(self.faker.first_name)
+        self.last_names = self.text_pool(self.faker.last_name)
+        self.countries = self.text_pool(self.faker.country)
 
-                self.log(f"Created profile - {first_name}")
-                self.session.add(profile)
-
-            await self.session.commit()
-            self.log("Profiles created successfully!", level="success")
+    @override
+    def count(self) -> int:
+        """One profile per user."""
+        return self.scaled(USERS_PER_SCALE)
 
-        except Exception as e:
-            self.log(f"Error creating profiles: {str(e)}", level="error")
-            await self.session.rollback()
+    @override
+    def generate(self, start: int, stop: int) -> Iterator[tuple[Any, ...]]:
+        genders = list(Gender)
+        for index in range(start, stop):
+            yield (
+                index + 1,
+                self.now,
+                index + 1,
+                True,
+                self.random.choice(self.first_names),
+                self.random.choice(self.last_names),
+                f"https://i.pravatar.cc/150?u={index + 1}",
+                self.random.choice(categories),
+                self.random.choice(self.countries),
+                date(1960, 1, 1) + timedelta(days=self.random.randrange(45 * 365)),
+                self.random.choice(genders),
+            )
@@ -1,31 +1,41 @@
-import random
-from typing import override
+from collections.abc import Iterator
+from typing import Any, override
 
-from sqlalchemy import select
-
-from src.infrastructure.database.models import Event, EventRegistration, Profile
+from src.infrastructure.database.models import EventRegistration
+from src.infrastructure.database.models.enums import ParticipantStatus
 from src.infrastructure.database.seeders.base_seeder import BaseSeeder
+from src.infrastructure.database.seeders.constants import (
+    EVENTS_PER_SCALE,
+    REGISTRATIONS_PER_PROFILE,
+    USERS_PER_SCALE,
+)
+from src.infrastructure.database.seeders.entities.event_seeder import EventSeeder
+from src.infrastructure.database.seeders.entities.profile_seeder import ProfileSeeder
 
 
 class RelationshipSeeder(BaseSeeder):
-    @override
-    async def run(self) -> None:
-        try:
-            self.log("Starting relationships seeding...")
-            await self.clear_table(EventRegistration)
-
-            profiles = (await self.session.execute(select(Profile))).scalars().all()
-
-            events = (await self.session.execute(select(Event))).scalars().all()
+    model = EventRegistration
+    depends_on = (ProfileSeeder, EventSeeder)
+    columns = ("created_at", "profile_id", "event_id", "status")
+    # Event counters are reconciled once after seeding, instead of per batch.
+    disable_triggers = True
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:  # noqa: ANN401
+        """Initialize seeder, see BaseSeeder."""
+        super().__init__(*args, **kwargs)
+        self.events = self.scaled(EVENTS_PER_SCALE)
+        self.per_profile = min(REGISTRATIONS_PER_PROFILE, self.events)
+        # Units are profiles, keep batches at about batch_size rows.
+        self.batch_size = max(1, self.batch_size // self.per_profile)
 
-            for profile in profiles:
-                num_events = random.randint(1, 3)  # noqa
-                selected_events = random.sample(events, num_events)
-                profile.registered_events.extend(selected_events)
-
-            await self.session.commit()
-            self.log("Relationships created successfully!", level="success")
+    @override
+    def count(self) -> int:
+        """Registrations of every profile."""
+        return self.scaled(USERS_PER_SCALE)
 
-        except Exception as e:
-            self.log(f"Error creating relationships: {str(e)}", level="error")
-            await self.session.rollback()
+    @override
+    def generate(self, start: int, stop: int) -> Iterator[tuple[Any, ...]]:
+        statuses = list(ParticipantStatus)
+        for index in range(start, stop):
+            for event_id in self.random.sample(range(1, self.events + 1), self.per_profile):
+                yield self.now, index + 1, event_id, self.random.choice(statuses)
@@ -1,37 +1,61 @@
-from typing import override
+import base64
+from collections.abc import Iterator
+from typing import Any, Final, override
 
 import bcrypt
 
 from src.infrastructure.database.models import User
 from src.infrastructure.database.seeders.base_seeder import BaseSeeder
-from src.infrastructure.database.seeders.constants import NUM_TEST_DATA
+from src.infrastructure.database.seeders.constants import SEED_PASSWORD, USERS_PER_SCALE
+
+# Alphabets of standard and bcrypt base64, same bit layout.
+_BASE64_TO_BCRYPT: Final[bytes] = bytes.maketrans(
+    b"ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/",
+    b"./ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789",
+)
+
+
+def bcrypt_salt(raw: bytes) -> bytes:
+    """Build a bcrypt salt from 16 bytes, like bcrypt.gensalt does from random bytes."""
+    return b"$2b$12$" + base64.b64encode(raw).translate(_BASE64_TO_BCRYPT)[:22]
 
 
 class UserSeeder(BaseSeeder):
+    model = User
+    columns = (
+        "id",
+        "created_at",
+        "username",
+        "email",
+        "hashed_password",
+        "is_verified",
+        "is_active",
+    )
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:  # noqa: ANN401
+        """Initialize seeder and generate the texts its rows pick from."""
+        super().__init__(*args, **kwargs)
+        self.usernames = self.text_pool(self.faker.user_name)
+        # Hashing is deliberately slow, all users share the password. With a seed
+        # the salt comes from Faker, so every worker computes the same hash.
+        salt = bcrypt.gensalt() if self.options.seed is None else bcrypt_salt(self.faker.binary(16))
+        self.hashed_password = bcrypt.hashpw(SEED_PASSWORD.encode("utf-8"), salt).decode("utf-8")
+
+    @override
+    def count(self) -> int:
+        return self.scaled(USERS_PER_SCALE)
+
     @override
-    async def run(self) -> None:
-        try:
-            self.log("Starting users seeding...")
-            await self.clear_table(User)
-
-            for _ in range(NUM_TEST_DATA):
-                username = self.faker.user_name()
-                password = self.faker.password()
-                hashed_password = bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt()).decode(
-                    "utf-8"
-                )
-                user = User(
-                    username=username,
-                    email=self.faker.email(),
-                    hashed_password=hashed_password,
-                )
-
-                self.log(f"Created user - {username}")
-                self.session.add(user)
-
-            await self.session.commit()
-            self.log("Users created successfully!", level="success")
-
-        except Exception as e:
-            self.log(f"Error creating users: {str(e)}", level="error")
-            await self.session.rollback()
+    def generate(self, start: int, stop: int) -> Iterator[tuple[Any, ...]]:
+        for index in range(start, stop):
+            # The id suffix keeps usernames and emails unique.
+            username = f"{self.random.choice(self.usernames)}{index + 1}"
+            yield (
+                index + 1,
+                self.now,
+                username,
+                f"{username}@example.com",
+                self.hashed_password,
+                self.random.random() < 0.5,
+                True,
+            )
@@ -0,0 +1,112 @@
+from collections.abc import Sequence
+from typing import Any
+
+from sqlalchemy import Table, delete, func, insert, select, text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+
+
+def quoted_name(connection: AsyncConnection, table: Table) -> str:
+    """Quote the name of the table for raw SQL in the dialect of the connection."""
+    # format_table() is not annotated by SQLAlchemy.
+    name: str = connection.dialect.identifier_preparer.format_table(table)  # type: ignore[no-untyped-call]
+    return name
+
+
+async def load_rows(
+    session: AsyncSession, table: Table, columns: Sequence[str], rows: Sequence[tuple[Any, ...]]
+) -> None:
+    """Load a batch of rows into the table in the transaction of the session.
+
+    On asyncpg the rows are streamed with COPY, values are converted by the bind
+    processors of the columns, e.g. enum members to their names. Other drivers
+    get a multi-row INSERT.
+
+    Args:
+        session: Database session
+        table: Target table
+        columns: Column names, in the order of the row values
+        rows: Row values
+
+    """
+    if not rows:
+        return
+    connection = await session.connection()
+    dialect = connection.dialect
+    if dialect.driver != "asyncpg":
+        await session.execute(insert(table), [dict(zip(columns, row, strict=True)) for row in rows])
+        return
+
+    processors = [
+        table.c[column].type.dialect_impl(dialect).bind_processor(dialect) for column in columns
+    ]
+    if any(processors):
+        rows = [
+            tuple(
+                value if process is None or value is None else process(value)
+                for process, value in zip(processors, row, strict=True)
+            )
+            for row in rows
+        ]
+    raw_connection = await connection.get_raw_connection()
+    await raw_connection.driver_connection.copy_records_to_table(  # type: ignore[union-attr]
+        table.name, records=rows, columns=list(columns)
+    )
+
+
+async def reset_id_sequence(session: AsyncSession, table: Table) -> None:
+    """Move the id sequence of the table past the loaded ids, on PostgreSQL.
+
+    Args:
+        session: Database session
+        table: Table loaded with explicit ids
+
+    """
+    connection = await session.connection()
+    if connection.dialect.name != "postgresql":
+        return
+    max_id = (await connection.execute(select(func.max(table.c.id)))).scalar()
+    if max_id is not None:
+        await connection.execute(
+            text("SELECT setval(pg_get_serial_sequence(:table, 'id'), :max_id)"),
+            {"table": table.name, "max_id": max_id},
+        )
+
+
+async def set_user_triggers(session: AsyncSession, table: Table, *, enabled: bool) -> None:
+    """Enable or disable the triggers of the table, not its foreign keys, on PostgreSQL.
+
+    Runs in the transaction of the session, a rollback restores the triggers.
+
+    Args:
+        session: Database session
+        table: Table of the triggers
+        enabled: Enable the triggers, else disable them
+
+    """
+    connection = await session.connection()
+    if connection.dialect.name != "postgresql":
+        return
+    name = quoted_name(connection, table)
+    action = "ENABLE" if enabled else "DISABLE"
+    await connection.execute(text(f"ALTER TABLE {name} {action} TRIGGER USER"))
+
+
+async def truncate_tables(session: AsyncSession, tables: Sequence[Table]) -> None:
+    """Delete all rows of the tables at once, restarting their id sequences.
+
+    PostgreSQL truncates them in one statement, cascading to the tables
+    referencing them. Other databases delete the rows table by table.
+
+    Args:
+        session: Database session
+        tables: Tables in dependency order, referenced tables first
+
+    """
+    connection = await session.connection()
+    if connection.dialect.name == "postgresql":
+        names = ", ".join(quoted_name(connection, t) for t in tables)
+        await connection.execute(text(f"TRUNCATE {names} RESTART IDENTITY CASCADE"))
+    else:
+        for table in reversed(tables):
+            await connection.execute(delete(table))
+    await session.commit()
@@ -1,6 +1,13 @@
 import asyncio
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+from logging import getLogger
+from typing import Final
 
 from src.infrastructure.database.config import get_sqlalchemy_config
+from src.infrastructure.database.reconcile import reconcile
+from src.infrastructure.database.seeders.base_seeder import BaseSeeder, SeedOptions, SeedResult
 from src.infrastructure.database.seeders.entities import (
     CategorySeeder,
     EventSeeder,
@@ -10,25 +17,65 @@ from src.infrastructure.database.seeders.entities import (
     RelationshipSeeder,
     UserSeeder,
 )
+from src.infrastructure.database.seeders.scheduler import SeederScheduler
 
 sqlalchemy_config = get_sqlalchemy_config()
+logger = getLogger("src.seeders")
 
 
-async def run() -> None:
-    """Run all seeders."""
+# All seeders, the scheduler orders them by their dependencies.
+SEEDERS: Final[tuple[type[BaseSeeder], ...]] = (
+    CategorySeeder,
+    LocationSeeder,
+    UserSeeder,
+    ProfileSeeder,
+    OrganizerSeeder,
+    EventSeeder,
+    RelationshipSeeder,
+)
+
+
+async def run(options: SeedOptions | None = None, workers: int = 1) -> list[SeedResult]:
+    """Run all seeders, replacing the data of their tables, then reconcile the event counters.
+
+    Args:
+        options: Scale, batch size and seed of the data
+        workers: Processes generating the rows, 1 generates them on the event loop
+
+    Returns:
+        Loaded rows and timing of every seeder
+
+    """
     session_maker = sqlalchemy_config.create_session_maker()
-    async with session_maker() as session:
-        seeders = [
-            CategorySeeder(session=session),
-            LocationSeeder(session=session),
-            UserSeeder(session=session),
-            ProfileSeeder(session=session),
-            OrganizerSeeder(session=session),
-            EventSeeder(session=session),
-            RelationshipSeeder(session=session),
-        ]
-        for seeder in seeders:
-            await seeder.run()
+    scheduler = SeederScheduler(SEEDERS, session_maker, options or SeedOptions())
+    # Spawned workers do not inherit the event loop and connections of this process.
+    executor = (
+        ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+        if workers > 1
+        else None
+    )
+    started = time.perf_counter()
+    try:
+        results = await scheduler.run(executor, max_pending=2 * workers)
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+    elapsed = time.perf_counter() - started
+
+    for result in results:
+        logger.info(
+            "%-20s %10d rows  started +%6.2fs  took %6.2fs  %10s rows/s",
+            result.table,
+            result.rows,
+            result.started - started,
+            result.elapsed,
+            f"{result.rows_per_second:,.0f}",
+        )
+    loaded = sum(result.rows for result in results)
+    logger.info("Loaded %d rows in %.2fs (%s rows/s)", loaded, elapsed, f"{loaded / elapsed:,.0f}")
+    # Seeded participant counters are random, derive them from the seeded registrations.
+    await reconcile(session_maker)
+    return results
 
 
 if __name__ == "__main__":
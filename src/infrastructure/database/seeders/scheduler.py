@@ -0,0 +1,87 @@
+import asyncio
+from collections.abc import Callable, Iterable
+from concurrent.futures import Executor
+from graphlib import TopologicalSorter
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.infrastructure.database.seeders.base_seeder import BaseSeeder, SeedOptions, SeedResult
+from src.infrastructure.database.seeders.loader import truncate_tables
+
+
+def seeding_order(seeder_classes: Iterable[type[BaseSeeder]]) -> list[type[BaseSeeder]]:
+    """Order the seeders so that every seeder comes after its dependencies.
+
+    Args:
+        seeder_classes: Seeders to run
+
+    Returns:
+        Seeders in dependency order
+
+    Raises:
+        ValueError: If a dependency is not among the seeders
+        graphlib.CycleError: If the dependencies form a cycle
+
+    """
+    graph = {seeder_class: seeder_class.depends_on for seeder_class in seeder_classes}
+    for seeder_class, dependencies in graph.items():
+        if missing := [dep.__name__ for dep in dependencies if dep not in graph]:
+            raise ValueError(f"{seeder_class.__name__} depends on missing {', '.join(missing)}.")
+    return list(TopologicalSorter(graph).static_order())
+
+
+class SeederScheduler:
+    """Runs seeders as a dependency graph, each on its own session.
+
+    A seeder starts as soon as all its dependencies are loaded, so independent
+    seeders load concurrently. The tables are truncated once up front. If a
+    seeder fails the seeders still running are cancelled.
+    """
+
+    def __init__(
+        self,
+        seeder_classes: Iterable[type[BaseSeeder]],
+        session_maker: Callable[[], AsyncSession],
+        options: SeedOptions,
+    ) -> None:
+        """Initialize scheduler.
+
+        Args:
+            seeder_classes: Seeders to run, with all their dependencies
+            session_maker: Factory of database sessions
+            options: Options of the seeding run
+
+        """
+        self.seeder_classes = seeding_order(seeder_classes)
+        self.session_maker = session_maker
+        self.options = options
+
+    async def truncate(self) -> None:
+        """Delete the rows of all seeded tables."""
+        tables = [seeder_class.model.__table__ for seeder_class in self.seeder_classes]
+        async with self.session_maker() as session:
+            await truncate_tables(session, tables)  # type: ignore[arg-type]
+
+    async def run(self, executor: Executor | None = None, max_pending: int = 1) -> list[SeedResult]:
+        """Truncate the tables and run all seeders.
+
+        Args:
+            executor: Process pool generating the batches, None to generate them in process
+            max_pending: Batches generated ahead of the loader by the pool, per seeder
+
+        Returns:
+            Results of the seeders in dependency order
+
+        """
+        await self.truncate()
+        tasks: dict[type[BaseSeeder], asyncio.Task[SeedResult]] = {}
+
+        async def run_seeder(seeder_class: type[BaseSeeder]) -> SeedResult:
+            await asyncio.gather(*(tasks[dep] for dep in seeder_class.depends_on))
+            async with self.session_maker() as session:
+                return await seeder_class(session, self.options).run(executor, max_pending)
+
+        async with asyncio.TaskGroup() as task_group:
+            for seeder_class in self.seeder_classes:
+                tasks[seeder_class] = task_group.create_task(run_seeder(seeder_class))
+        return [tasks[seeder_class].result() for seeder_class in self.seeder_classes]
@@ -1,3 +1,5 @@
+from typing import Literal
+
 from pydantic_settings import BaseSettings
 
 
@@ -8,6 +10,8 @@ class Settings(BaseSettings):
     """
 
     is_docker: bool = False
+    # Tracebacks in error responses, development only
+    DEBUG: bool = False
     DATABASE_URL: str
     POSTGRES_HOST: str
     POSTGRES_PORT: int
@@ -15,6 +19,81 @@ class Settings(BaseSettings):
     POSTGRES_PASSWORD: str
     POSTGRES_DB: str
 
+    # Connection pool of the engine, per process
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: int = 30
+    DB_POOL_PRE_PING: bool = False
+    DB_POOL_RECYCLE: int = -1
+    # Open DB_POOL_SIZE connections to the primary and replicas before serving traffic
+    DB_POOL_WARM_UP: bool = True
+    # asyncpg statement cache and SQLAlchemy prepared statement cache, per connection
+    DB_STATEMENT_CACHE_SIZE: int = 100
+    DB_PREPARED_STATEMENT_CACHE_SIZE: int = 100
+    # PgBouncer in transaction or statement pooling mode: disables both statement
+    # caches and names prepared statements uniquely
+    DB_PGBOUNCER: bool = False
+    # Read replicas, reads of safe requests are spread over them round-robin,
+    # JSON list, empty sends all queries to the primary
+    DATABASE_REPLICA_URLS: list[str] = []
+    DB_REPLICA_HEALTH_INTERVAL: float = 5.0
+    # Seconds a client reads from the primary after its last write, to read its writes
+    DB_PRIMARY_PIN_SECONDS: int = 5
+    # Slowest statement of a request logged from this duration, with its EXPLAIN plan
+    DB_SLOW_QUERY_SECONDS: float = 0.1
+    DB_EXPLAIN_SLOW_QUERIES: bool = True
+
+    # Password hashing: bcrypt cost, hashed off the event loop by a bounded pool
+    # of "thread" or "process" workers, requests beyond the queue are rejected
+    PASSWORD_BCRYPT_ROUNDS: int = 12
+    PASSWORD_HASH_EXECUTOR: Literal["thread", "process"] = "thread"  # noqa: S105
+    PASSWORD_HASH_WORKERS: int = 4
+    PASSWORD_HASH_MAX_QUEUE: int = 64
+
+    # Signed access tokens, HS256 with JWT_SECRET, shared by all processes; a random
+    # per process secret is used when empty, tokens then only work on that process
+    JWT_SECRET: str = ""
+    JWT_ISSUER: str = "devevents"
+    JWT_ACCESS_TOKEN_TTL: int = 900
+    # Verified tokens, skipped verification until they expire, per process
+    JWT_VERIFIED_CACHE_SIZE: int = 4096
+    # Seconds between syncs of the deny-list of inactive users
+    AUTH_DENY_LIST_SYNC_INTERVAL: float = 30.0
+
+    # Waitlist promotion: seconds between runs, also run right after a cancellation,
+    # and events locked per batch, each batch is one transaction
+    WAITLIST_PROMOTION_INTERVAL: float = 10.0
+    WAITLIST_PROMOTION_BATCH_SIZE: int = 100
+
+    # Autocomplete cache of recent queries, per process
+    AUTOCOMPLETE_CACHE_SIZE: int = 1024
+    AUTOCOMPLETE_CACHE_TTL: float = 30.0
+
+    # Response cache of the event endpoints, "memory" per process, "redis" shared or "none",
+    # the production server switches "memory" to "none" with several workers
+    CACHE_BACKEND: Literal["memory", "redis", "none"] = "memory"
+    REDIS_URL: str | None = None
+    EVENT_CACHE_SIZE: int = 1024
+    EVENT_CACHE_TTL: int = 60
+
+    # Production server (python -m src.server): worker processes, 0 for one per CPU,
+    # event loop and HTTP parser, "auto" uses uvloop and httptools when installed
+    SERVER_HOST: str = "0.0.0.0"  # noqa: S104
+    SERVER_PORT: int = 8000
+    SERVER_WORKERS: int = 0
+    SERVER_LOOP: Literal["auto", "uvloop", "asyncio"] = "auto"
+    SERVER_HTTP: Literal["auto", "httptools", "h11"] = "auto"
+    # Seconds idle keep-alive connections stay open, longer than the idle timeout of
+    # the load balancer in front, and connections queued by the listening socket
+    SERVER_KEEP_ALIVE: int = 75
+    SERVER_BACKLOG: int = 2048
+    # Seconds in-flight requests get to finish on shutdown before they are cancelled
+    SERVER_GRACEFUL_SHUTDOWN: int = 30
+    # Connections and requests per worker before it answers 503, None for no limit
+    SERVER_LIMIT_CONCURRENCY: int | None = None
+    # Proxies trusted for the X-Forwarded-For and X-Forwarded-Proto headers, comma separated
+    SERVER_FORWARDED_ALLOW_IPS: str = "127.0.0.1"
+
     @property
     def database_url(self) -> str:
         """Return database url."""
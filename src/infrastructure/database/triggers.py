@@ -0,0 +1,224 @@
+from typing import Final
+
+from sqlalchemy import DDL, event
+from sqlalchemy.sql.ddl import ExecutableDDLElement
+
+from src.infrastructure.database.base import Base
+
+# Text search configuration of the events search document, as used in the DDL below.
+TEXT_SEARCH_CONFIG: Final[str] = "english"
+
+# Extensions required by the indexes, created before the tables.
+EXTENSIONS_DDL: Final[tuple[str, ...]] = (
+    # Trigram GIN indexes of the autocomplete.
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+)
+
+# Functions and triggers keeping events.search_vector in sync with the event,
+# its category and its organizer. Statements are idempotent, they run after
+# every create_all on PostgreSQL, one statement per DDL for asyncpg.
+EVENT_SEARCH_VECTOR_DDL: Final[tuple[str, ...]] = (
+    """
+CREATE OR REPLACE FUNCTION events_search_document(
+    event_name text, event_description text, event_category_id integer, event_organizer_id integer
+) RETURNS tsvector LANGUAGE sql STABLE AS $$
+    SELECT
+        setweight(to_tsvector('english', coalesce(event_name, '')), 'A')
+        || setweight(to_tsvector('english', coalesce(
+            (SELECT name FROM categories WHERE id = event_category_id), ''
+        )), 'B')
+        || setweight(to_tsvector('english', coalesce(
+            (SELECT name FROM organizers WHERE id = event_organizer_id), ''
+        )), 'B')
+        || setweight(to_tsvector('english', coalesce(event_description, '')), 'C')
+$$
+""",
+    """
+CREATE OR REPLACE FUNCTION events_search_vector_update() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    NEW.search_vector := events_search_document(
+        NEW.name, NEW.description, NEW.category_id, NEW.organizer_id
+    );
+    RETURN NEW;
+END
+$$
+""",
+    """
+CREATE OR REPLACE TRIGGER events_search_vector_update
+BEFORE INSERT OR UPDATE OF name, description, category_id, organizer_id ON events
+FOR EACH ROW EXECUTE FUNCTION events_search_vector_update()
+""",
+    """
+CREATE OR REPLACE FUNCTION events_search_vector_refresh() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_TABLE_NAME = 'categories' THEN
+        UPDATE events
+        SET search_vector = events_search_document(name, description, category_id, organizer_id)
+        WHERE category_id = NEW.id;
+    ELSE
+        UPDATE events
+        SET search_vector = events_search_document(name, description, category_id, organizer_id)
+        WHERE organizer_id = NEW.id;
+    END IF;
+    RETURN NULL;
+END
+$$
+""",
+    """
+CREATE OR REPLACE TRIGGER categories_search_vector_refresh
+AFTER UPDATE OF name ON categories
+FOR EACH ROW WHEN (OLD.name IS DISTINCT FROM NEW.name)
+EXECUTE FUNCTION events_search_vector_refresh()
+""",
+    """
+CREATE OR REPLACE TRIGGER organizers_search_vector_refresh
+AFTER UPDATE OF name ON organizers
+FOR EACH ROW WHEN (OLD.name IS DISTINCT FROM NEW.name)
+EXECUTE FUNCTION events_search_vector_refresh()
+""",
+    """
+UPDATE events
+SET search_vector = events_search_document(name, description, category_id, organizer_id)
+WHERE search_vector IS NULL
+""",
+)
+
+# Function and triggers keeping the registration counters of events in sync.
+# Statement triggers read the changed rows from transition tables and apply one
+# update per event and statement, so a bulk upsert or a COPY does not update an
+# event once per registration. Transition tables allow a single event per
+# trigger, hence one trigger per operation. Enum values are stored by name.
+# Counters are served with the event, so updated_at, the validator of its
+# conditional and cached responses, moves with them.
+EVENT_REGISTRATION_COUNTS_DDL: Final[tuple[str, ...]] = (
+    """
+CREATE OR REPLACE FUNCTION event_registrations_count_update() RETURNS trigger
+LANGUAGE plpgsql AS $$
+DECLARE
+    added event_registrations[];
+    removed event_registrations[];
+BEGIN
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        SELECT array_agg(r) INTO added FROM new_rows AS r;
+    END IF;
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        SELECT array_agg(r) INTO removed FROM old_rows AS r;
+    END IF;
+    UPDATE events
+    SET registered_count = registered_count + delta.registered,
+        confirmed_count = confirmed_count + delta.confirmed,
+        waitlisted_count = waitlisted_count + delta.waitlisted,
+        attended_count = attended_count + delta.attended,
+        updated_at = timezone('utc', now())
+    FROM (
+        SELECT
+            event_id,
+            coalesce(sum(amount) FILTER (WHERE status = 'REGISTERED'), 0) AS registered,
+            coalesce(sum(amount) FILTER (WHERE status = 'CONFIRMED'), 0) AS confirmed,
+            coalesce(sum(amount) FILTER (WHERE status = 'WAITLISTED'), 0) AS waitlisted,
+            coalesce(sum(amount) FILTER (WHERE status = 'ATTENDED'), 0) AS attended
+        FROM (
+            SELECT event_id, status, 1 AS amount FROM unnest(added)
+            UNION ALL
+            SELECT event_id, status, -1 AS amount FROM unnest(removed)
+        ) AS change
+        GROUP BY event_id
+    ) AS delta
+    WHERE events.id = delta.event_id
+        AND (delta.registered, delta.confirmed, delta.waitlisted, delta.attended) <> (0, 0, 0, 0);
+    RETURN NULL;
+END
+$$
+""",
+    """
+CREATE OR REPLACE TRIGGER event_registrations_count_insert
+AFTER INSERT ON event_registrations REFERENCING NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION event_registrations_count_update()
+""",
+    """
+CREATE OR REPLACE TRIGGER event_registrations_count_update
+AFTER UPDATE ON event_registrations REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION event_registrations_count_update()
+""",
+    """
+CREATE OR REPLACE TRIGGER event_registrations_count_delete
+AFTER DELETE ON event_registrations REFERENCING OLD TABLE AS old_rows
+FOR EACH STATEMENT EXECUTE FUNCTION event_registrations_count_update()
+""",
+)
+
+
+# Function and triggers moving updated_at of events when rows served with them
+# change: their location, category and organizers, and the links to the
+# organizers. updated_at versions the conditional and cached responses of the
+# event, and through list_version those of the lists.
+EVENT_RELATED_VERSION_DDL: Final[tuple[str, ...]] = (
+    """
+CREATE OR REPLACE FUNCTION events_related_version_update() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_TABLE_NAME = 'event_organizers' THEN
+        UPDATE events SET updated_at = timezone('utc', now())
+        WHERE id IN (OLD.event_id, NEW.event_id);
+    ELSIF TG_TABLE_NAME = 'locations' THEN
+        UPDATE events SET updated_at = timezone('utc', now()) WHERE location_id = NEW.id;
+    ELSIF TG_TABLE_NAME = 'categories' THEN
+        UPDATE events SET updated_at = timezone('utc', now()) WHERE category_id = NEW.id;
+    ELSE
+        UPDATE events SET updated_at = timezone('utc', now())
+        WHERE id IN (SELECT event_id FROM event_organizers WHERE organizer_id = NEW.id);
+    END IF;
+    RETURN NULL;
+END
+$$
+""",
+    """
+CREATE OR REPLACE TRIGGER locations_events_version_update
+AFTER UPDATE OF name, address, city, country ON locations
+FOR EACH ROW WHEN (
+    (OLD.name, OLD.address, OLD.city, OLD.country)
+    IS DISTINCT FROM (NEW.name, NEW.address, NEW.city, NEW.country)
+)
+EXECUTE FUNCTION events_related_version_update()
+""",
+    """
+CREATE OR REPLACE TRIGGER categories_events_version_update
+AFTER UPDATE OF name, slug, description ON categories
+FOR EACH ROW WHEN (
+    (OLD.name, OLD.slug, OLD.description) IS DISTINCT FROM (NEW.name, NEW.slug, NEW.description)
+)
+EXECUTE FUNCTION events_related_version_update()
+""",
+    """
+CREATE OR REPLACE TRIGGER organizers_events_version_update
+AFTER UPDATE OF name, logo_url ON organizers
+FOR EACH ROW WHEN ((OLD.name, OLD.logo_url) IS DISTINCT FROM (NEW.name, NEW.logo_url))
+EXECUTE FUNCTION events_related_version_update()
+""",
+    """
+CREATE OR REPLACE TRIGGER event_organizers_events_version_update
+AFTER INSERT OR UPDATE OR DELETE ON event_organizers
+FOR EACH ROW EXECUTE FUNCTION events_related_version_update()
+""",
+)
+
+
+def postgresql_ddl(statement: str) -> ExecutableDDLElement:
+    """Build a DDL element executed on PostgreSQL only."""
+    # DDL() is not annotated by SQLAlchemy.
+    return DDL(statement).execute_if(dialect="postgresql")  # type: ignore[no-untyped-call]
+
+
+for statement in EXTENSIONS_DDL:
+    event.listen(Base.metadata, "before_create", postgresql_ddl(statement))
+
+for statement in EVENT_SEARCH_VECTOR_DDL:
+    event.listen(Base.metadata, "after_create", postgresql_ddl(statement))
+
+for statement in EVENT_REGISTRATION_COUNTS_DDL:
+    event.listen(Base.metadata, "after_create", postgresql_ddl(statement))
+
+for statement in EVENT_RELATED_VERSION_DDL:
+    event.listen(Base.metadata, "after_create", postgresql_ddl(statement))
@@ -1,8 +1,122 @@
+import secrets
+from collections.abc import AsyncGenerator
+from datetime import datetime
+from decimal import Decimal
 from logging import Logger, getLogger
+from typing import Annotated, Final
 
+from litestar import Request
+from litestar.datastructures import State
 from litestar.di import Provide
+from litestar.exceptions import ValidationException
+from litestar.params import Parameter
+from litestar.types import Scope
+from sqlalchemy.exc import InterfaceError, OperationalError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
-from src.infrastructure.repositories.event import provide_event_repo
+from src.domain.services.auth_service import AuthService
+from src.domain.services.password_service import PasswordHasher
+from src.domain.services.token_service import DenyList, TokenService
+from src.domain.services.user_service import UserService
+from src.domain.services.waitlist_service import WaitlistPromoter
+from src.infrastructure.cache.backends import create_cache_backend
+from src.infrastructure.cache.events import EventResponseCache
+from src.infrastructure.cache.lru import LRUCache
+from src.infrastructure.database.config import (
+    get_engine,
+    get_replica_router,
+    get_sqlalchemy_config,
+)
+from src.infrastructure.database.models.enums import EventFormat, EventStatus
+from src.infrastructure.database.replicas import READ_PRIMARY_OPT, reads_from_primary
+from src.infrastructure.database.settings import settings
+from src.infrastructure.repositories.autocomplete import provide_autocomplete_repo
+from src.infrastructure.repositories.event import EVENT_FIELD_COLUMNS, provide_event_repo
+from src.infrastructure.repositories.filters import EVENT_CARD_FIELDS, EventSearchFilters
+from src.infrastructure.repositories.registration import provide_registration_repo
+from src.infrastructure.repositories.user import UserRepository, provide_user_repo
+from src.interfaces.api.schemas import SuggestionSchema
+
+# Suggestions of recent autocomplete queries, keystrokes repeat the same prefixes.
+autocomplete_cache: LRUCache[tuple[str, int], list[SuggestionSchema]] = LRUCache(
+    maxsize=settings.AUTOCOMPLETE_CACHE_SIZE, ttl=settings.AUTOCOMPLETE_CACHE_TTL
+)
+
+# Encoded responses of the read-only event endpoints, invalidated by event writes.
+event_cache = EventResponseCache(
+    backend=create_cache_backend(
+        settings.CACHE_BACKEND,
+        maxsize=settings.EVENT_CACHE_SIZE,
+        ttl=settings.EVENT_CACHE_TTL,
+        redis_url=settings.REDIS_URL,
+    ),
+    ttl=settings.EVENT_CACHE_TTL,
+)
+
+# Route handler opt of the cached event endpoints: their misses read from the primary,
+# an entry filled from a lagging replica would outlive the invalidation of the write it
+# missed. Hits run no query, and without a cache reads stay on the replicas.
+EVENT_CACHE_OPT: Final[dict[str, bool]] = {READ_PRIMARY_OPT: settings.CACHE_BACKEND != "none"}
+
+# Hashes passwords off the event loop, shared by the auth handlers of the process.
+password_hasher = PasswordHasher(
+    rounds=settings.PASSWORD_BCRYPT_ROUNDS,
+    workers=settings.PASSWORD_HASH_WORKERS,
+    max_queue=settings.PASSWORD_HASH_MAX_QUEUE,
+    executor=settings.PASSWORD_HASH_EXECUTOR,
+)
+
+if not settings.JWT_SECRET:
+    getLogger("src.auth").warning(
+        "JWT_SECRET is not set, access tokens are signed with a random key of this process"
+    )
+
+# Issues and verifies access tokens, shared by the auth middleware and handlers.
+token_service = TokenService(
+    secret=settings.JWT_SECRET or secrets.token_urlsafe(32),
+    issuer=settings.JWT_ISSUER,
+    ttl=settings.JWT_ACCESS_TOKEN_TTL,
+    cache_size=settings.JWT_VERIFIED_CACHE_SIZE,
+)
+
+# Inactive users, whose tokens are refused without a database lookup per request.
+deny_list = DenyList(
+    session_maker=async_sessionmaker(get_engine(), expire_on_commit=False),
+    interval=settings.AUTH_DENY_LIST_SYNC_INTERVAL,
+)
+
+# Moves waitlisted registrations into seats freed by cancellations.
+waitlist_promoter = WaitlistPromoter(
+    session_maker=async_sessionmaker(get_engine(), expire_on_commit=False),
+    interval=settings.WAITLIST_PROMOTION_INTERVAL,
+    batch_size=settings.WAITLIST_PROMOTION_BATCH_SIZE,
+    cache=event_cache,
+)
+
+
+async def provide_db_session(
+    request: Request, state: State, scope: Scope
+) -> AsyncGenerator[AsyncSession, None]:
+    """Provide the database session of the request, on a read replica for safe requests.
+
+    Writes, reads pinned to the primary and reads without a healthy replica get
+    the session of the SQLAlchemy plugin, committed and closed by the plugin.
+
+    Yields:
+        AsyncSession: Session on the primary or a replica.
+
+    """
+    router = get_replica_router()
+    replica = None if reads_from_primary(request) else router.choose()
+    if replica is None:
+        yield get_sqlalchemy_config().provide_session(state, scope)
+        return
+    async with replica.session_maker() as session:
+        try:
+            yield session
+        except (InterfaceError, OperationalError, OSError):
+            router.mark_down(replica)
+            raise
 
 
 async def provide_event_logger() -> Logger:
@@ -15,4 +129,170 @@ async def provide_event_logger() -> Logger:
     return getLogger("src.events")
 
 
-event_dependencies = {"repo": Provide(provide_event_repo), "logger": Provide(provide_event_logger)}
+async def provide_event_search_filters(
+    category_id: int | None = None,
+    city: str | None = None,
+    country: str | None = None,
+    event_format: Annotated[EventFormat | None, Parameter(query="format")] = None,
+    status: EventStatus | None = None,
+    min_price: Decimal | None = None,
+    max_price: Decimal | None = None,
+    is_published: bool | None = None,
+    starts_after: datetime | None = None,
+    starts_before: datetime | None = None,
+) -> EventSearchFilters:
+    """Provide events search filters from the query parameters.
+
+    Returns:
+        EventSearchFilters: Filters of the events search.
+
+    Raises:
+        ValidationException: If a price or date range is empty.
+
+    """
+    if min_price is not None and max_price is not None and min_price > max_price:
+        raise ValidationException("min_price must not be greater than max_price.")
+    if starts_after is not None and starts_before is not None and starts_after >= starts_before:
+        raise ValidationException("starts_after must be before starts_before.")
+    return EventSearchFilters(
+        category_id=category_id,
+        city=city,
+        country=country,
+        format=event_format,
+        status=status,
+        min_price=min_price,
+        max_price=max_price,
+        is_published=is_published,
+        starts_after=starts_after,
+        starts_before=starts_before,
+    )
+
+
+async def provide_event_projection(fields: str | None = None) -> tuple[str, ...] | None:
+    """Provide the sparse fieldset of event listings from the fields query parameter.
+
+    "full" or no value selects whole events with their organizers, "card" the
+    fields of event cards, anything else is a comma separated list of fields.
+
+    Returns:
+        tuple[str, ...] | None: Fields in canonical order with id always included,
+            None for whole events.
+
+    Raises:
+        ValidationException: If a field is unknown.
+
+    """
+    if fields is None or fields == "full":
+        return None
+    requested = set(EVENT_CARD_FIELDS if fields == "card" else fields.replace(" ", "").split(","))
+    requested.discard("")
+    if unknown := requested - EVENT_FIELD_COLUMNS.keys():
+        raise ValidationException(f"Unknown fields: {', '.join(sorted(unknown))}.")
+    return tuple(field for field in EVENT_FIELD_COLUMNS if field in requested or field == "id")
+
+
+def provide_event_cache() -> EventResponseCache:
+    """Provide the response cache of the event endpoints.
+
+    Returns:
+        EventResponseCache: Cache shared by the event handlers and repository.
+
+    """
+    return event_cache
+
+
+def provide_autocomplete_cache() -> LRUCache[tuple[str, int], list[SuggestionSchema]]:
+    """Provide the process wide cache of autocomplete suggestions.
+
+    Returns:
+        LRUCache: Suggestions keyed by normalized query and limit.
+
+    """
+    return autocomplete_cache
+
+
+def provide_password_hasher() -> PasswordHasher:
+    """Provide the process wide password hasher.
+
+    Returns:
+        PasswordHasher: Hasher with the bcrypt cost of the settings.
+
+    """
+    return password_hasher
+
+
+def provide_token_service() -> TokenService:
+    """Provide the process wide token service.
+
+    Returns:
+        TokenService: Service signing with the key of the settings.
+
+    """
+    return token_service
+
+
+async def provide_auth_service(
+    user_repo: UserRepository, password_hasher: PasswordHasher
+) -> AuthService:
+    """Provide the authentication service.
+
+    Returns:
+        AuthService: Service checking credentials against the users.
+
+    """
+    return AuthService(user_repo=user_repo, password_hasher=password_hasher)
+
+
+async def provide_user_service(
+    user_repo: UserRepository, password_hasher: PasswordHasher
+) -> UserService:
+    """Provide the user service.
+
+    Returns:
+        UserService: Service registering users.
+
+    """
+    return UserService(user_repo=user_repo, password_hasher=password_hasher)
+
+
+def provide_waitlist_promoter() -> WaitlistPromoter:
+    """Provide the process wide waitlist promoter.
+
+    Returns:
+        WaitlistPromoter: Promoter to notify of freed seats.
+
+    """
+    return waitlist_promoter
+
+
+event_dependencies = {
+    "repo": Provide(provide_event_repo),
+    "cache": Provide(provide_event_cache, sync_to_thread=False),
+    "logger": Provide(provide_event_logger),
+    "filters": Provide(provide_event_search_filters),
+    "projection": Provide(provide_event_projection),
+}
+
+autocomplete_dependencies = {
+    "repo": Provide(provide_autocomplete_repo),
+    "cache": Provide(provide_autocomplete_cache, sync_to_thread=False),
+    "logger": Provide(provide_event_logger),
+}
+
+registration_dependencies = {
+    "repo": Provide(provide_registration_repo),
+    "cache": Provide(provide_event_cache, sync_to_thread=False),
+    "promoter": Provide(provide_waitlist_promoter, sync_to_thread=False),
+}
+
+system_dependencies = {
+    "password_hasher": Provide(provide_password_hasher, sync_to_thread=False),
+}
+
+auth_dependencies = {
+    "user_repo": Provide(provide_user_repo),
+    "password_hasher": Provide(provide_password_hasher, sync_to_thread=False),
+    "token_service": Provide(provide_token_service, sync_to_thread=False),
+    "auth_service": Provide(provide_auth_service),
+    "user_service": Provide(provide_user_service),
+}
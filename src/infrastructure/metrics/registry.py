@@ -0,0 +1,288 @@
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from collections.abc import Callable, Iterable
+from typing import Final, Literal
+
+# Content type of the Prometheus text exposition format, Litestar adds the charset.
+PROMETHEUS_CONTENT_TYPE: Final[str] = "text/plain; version=0.0.4"
+
+# Bucket bounds in seconds, from a fast cache hit to a slow request.
+LATENCY_BUCKETS: Final[tuple[float, ...]] = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+# Bucket bounds in bytes, from an empty body to a large page of events.
+SIZE_BUCKETS: Final[tuple[float, ...]] = (
+    100,
+    1_000,
+    10_000,
+    100_000,
+    1_000_000,
+    10_000_000,
+)
+
+Labels = tuple[str, ...]
+Sample = tuple[str, Labels, float]
+
+
+def _escape(value: str) -> str:
+    """Escape a label value of the text format."""
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_number(value: float) -> str:
+    """Format a sample value or bucket bound of the text format."""
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Metric(ABC):
+    """Metric family with its samples by label values.
+
+    Metrics are updated from the event loop thread only: updates are plain
+    dictionary and integer operations, without locks, and scrapes read the
+    current values.
+    """
+
+    kind: Literal["counter", "gauge", "histogram"]
+
+    def __init__(self, name: str, documentation: str, labelnames: Labels = ()) -> None:
+        """Initialize metric.
+
+        Args:
+            name: Name of the family, e.g. http_requests_total
+            documentation: HELP text
+            labelnames: Names of the labels, values are passed in this order
+
+        """
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+
+    @abstractmethod
+    def samples(self) -> Iterable[Sample]:
+        """Yield the samples of the family: name, label values and value."""
+
+
+class Counter(Metric):
+    """Monotonic counter, e.g. of requests or errors."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Labels = ()) -> None:
+        """Initialize counter, see Metric."""
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[Labels, float] = {}
+
+    def inc(self, labels: Labels = (), amount: float = 1) -> None:
+        """Add the amount to the counter of the label values."""
+        self._values[labels] = self._values.get(labels, 0) + amount
+
+    def samples(self) -> Iterable[Sample]:
+        """Yield the counter of every label values."""
+        for labels, value in self._values.items():
+            yield self.name, labels, value
+
+
+class Gauge(Metric):
+    """Value going up and down, e.g. requests in flight."""
+
+    kind = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: Labels = ()) -> None:
+        """Initialize gauge, see Metric."""
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[Labels, float] = {}
+
+    def inc(self, labels: Labels = (), amount: float = 1) -> None:
+        """Add the amount to the gauge of the label values."""
+        self._values[labels] = self._values.get(labels, 0) + amount
+
+    def dec(self, labels: Labels = (), amount: float = 1) -> None:
+        """Subtract the amount from the gauge of the label values."""
+        self._values[labels] = self._values.get(labels, 0) - amount
+
+    def set(self, value: float, labels: Labels = ()) -> None:
+        """Set the gauge of the label values."""
+        self._values[labels] = value
+
+    def samples(self) -> Iterable[Sample]:
+        """Yield the gauge of every label values."""
+        for labels, value in self._values.items():
+            yield self.name, labels, value
+
+
+class Histogram(Metric):
+    """Distribution of observed values over fixed buckets, e.g. of latencies.
+
+    An observation increments a single bucket found by bisection; the
+    cumulative counts of the text format are summed at scrape time.
+    """
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Labels = (),
+        buckets: tuple[float, ...] = LATENCY_BUCKETS,
+    ) -> None:
+        """Initialize histogram.
+
+        Args:
+            name: Name of the family, e.g. http_request_duration_seconds
+            documentation: HELP text
+            labelnames: Names of the labels, values are passed in this order
+            buckets: Sorted upper bounds of the buckets, +Inf is added
+
+        """
+        super().__init__(name, documentation, labelnames)
+        self.buckets = buckets
+        self._counts: dict[Labels, list[int]] = {}
+        self._sums: dict[Labels, float] = {}
+
+    def observe(self, value: float, labels: Labels = ()) -> None:
+        """Count the value in its bucket for the label values."""
+        counts = self._counts.get(labels)
+        if counts is None:
+            counts = self._counts[labels] = [0] * (len(self.buckets) + 1)
+            self._sums[labels] = 0.0
+        counts[bisect_left(self.buckets, value)] += 1
+        self._sums[labels] += value
+
+    def samples(self) -> Iterable[Sample]:
+        """Yield the cumulative buckets, sum and count of every label values."""
+        bounds = [_format_number(bound) for bound in (*self.buckets, float("inf"))]
+        for labels, counts in self._counts.items():
+            total = 0
+            for bound, count in zip(bounds, counts, strict=True):
+                total += count
+                yield f"{self.name}_bucket", (*labels, bound), total
+            yield f"{self.name}_sum", labels, self._sums[labels]
+            yield f"{self.name}_count", labels, total
+
+
+class CallbackMetric(Metric):
+    """Counter or gauge read at scrape time from state kept elsewhere, e.g. a pool."""
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        kind: Literal["counter", "gauge"],
+        callback: Callable[[], Iterable[tuple[Labels, float]]],
+        labelnames: Labels = (),
+    ) -> None:
+        """Initialize metric.
+
+        Args:
+            name: Name of the family
+            documentation: HELP text
+            kind: "counter" or "gauge"
+            callback: Returns the label values and value of every sample
+            labelnames: Names of the labels, values are passed in this order
+
+        """
+        super().__init__(name, documentation, labelnames)
+        self.kind = kind
+        self.callback = callback
+
+    def samples(self) -> Iterable[Sample]:
+        """Yield the samples returned by the callback."""
+        for labels, value in self.callback():
+            yield self.name, labels, value
+
+
+class MetricsRegistry:
+    """Metric families of the process, rendered in the Prometheus text format."""
+
+    def __init__(self) -> None:
+        """Initialize an empty registry."""
+        self._metrics: dict[str, Metric] = {}
+
+    def register(self, metric: Metric) -> Metric:
+        """Add the metric family.
+
+        Raises:
+            ValueError: If a family of the same name is registered
+
+        """
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name} is already registered.")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Labels = ()) -> Counter:
+        """Register a counter, see Counter."""
+        counter = Counter(name, documentation, labelnames)
+        self.register(counter)
+        return counter
+
+    def gauge(self, name: str, documentation: str, labelnames: Labels = ()) -> Gauge:
+        """Register a gauge, see Gauge."""
+        gauge = Gauge(name, documentation, labelnames)
+        self.register(gauge)
+        return gauge
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Labels = (),
+        buckets: tuple[float, ...] = LATENCY_BUCKETS,
+    ) -> Histogram:
+        """Register a histogram, see Histogram."""
+        histogram = Histogram(name, documentation, labelnames, buckets)
+        self.register(histogram)
+        return histogram
+
+    def callback(
+        self,
+        name: str,
+        documentation: str,
+        kind: Literal["counter", "gauge"],
+        callback: Callable[[], Iterable[tuple[Labels, float]]],
+        labelnames: Labels = (),
+    ) -> CallbackMetric:
+        """Register a metric read at scrape time, see CallbackMetric."""
+        metric = CallbackMetric(name, documentation, kind, callback, labelnames)
+        self.register(metric)
+        return metric
+
+    def render(self) -> bytes:
+        """Render all families in the Prometheus text exposition format."""
+        lines: list[str] = []
+        for metric in self._metrics.values():
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            labelnames = metric.labelnames
+            if metric.kind == "histogram":
+                labelnames = (*labelnames, "le")
+            for name, labels, value in metric.samples():
+                if labels:
+                    pairs = ",".join(
+                        f'{label}="{_escape(label_value)}"'
+                        for label, label_value in zip(labelnames, labels, strict=False)
+                    )
+                    lines.append(f"{name}{{{pairs}}} {_format_number(value)}")
+                else:
+                    lines.append(f"{name} {_format_number(value)}")
+        lines.append("")
+        return "\n".join(lines).encode("utf-8")
+
+
+# Metrics of the process, rendered by the metrics endpoint.
+registry = MetricsRegistry()
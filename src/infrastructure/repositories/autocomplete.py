@@ -0,0 +1,116 @@
+from collections.abc import Sequence
+
+from sqlalchemy import (
+    Integer,
+    Row,
+    Select,
+    SQLColumnExpression,
+    cast,
+    func,
+    literal,
+    null,
+    select,
+    union_all,
+)
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.infrastructure.database.models import Event, Location, Organizer
+from src.infrastructure.database.models.enums import SuggestionKind
+
+
+def escape_like(value: str) -> str:
+    """Escape LIKE wildcards of the value, slash is the escape character."""
+    return value.replace("/", "//").replace("%", "/%").replace("_", "/_")
+
+
+class AutocompleteRepository:
+    """Repository for the fuzzy autocomplete over events, locations and organizers.
+
+    Matches are served by pg_trgm GIN indexes: a label matches when it starts
+    with the text or contains a word similar to it, so typos still match.
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        """Initialize repository with database session."""
+        self.session = session
+
+    async def suggest(
+        self, text: str, limit: int
+    ) -> Sequence[Row[tuple[SuggestionKind, int | None, str, float]]]:
+        """Get the best matching labels across all suggestion sources.
+
+        Args:
+            text: Prefix or misspelled text typed by the user
+            limit: Maximal number of suggestions
+
+        Returns:
+            Rows of (kind, id, label, score), best matches first
+
+        """
+        sources = [
+            self._candidates(SuggestionKind.EVENT, Event.id, Event.name, text, limit),
+            self._candidates(SuggestionKind.LOCATION, Location.id, Location.name, text, limit),
+            self._candidates(SuggestionKind.ORGANIZER, Organizer.id, Organizer.name, text, limit),
+            self._city_candidates(text, limit),
+        ]
+        candidates = union_all(*sources).subquery()
+        statement = (
+            select(candidates).order_by(candidates.c.score.desc(), candidates.c.label).limit(limit)
+        )
+        return (await self.session.execute(statement)).all()
+
+    @staticmethod
+    def _matches(text: str, label: SQLColumnExpression[str]) -> SQLColumnExpression[bool]:
+        """Build the trigram index condition of a label column."""
+        prefix = label.ilike(f"{escape_like(text)}%", escape="/")
+        return prefix | literal(text).op("<%")(label)
+
+    def _candidates(
+        self,
+        kind: SuggestionKind,
+        id_column: SQLColumnExpression[int],
+        label: SQLColumnExpression[str],
+        text: str,
+        limit: int,
+    ) -> Select[tuple[str, int, str, float]]:
+        """Build the best matches query of a single suggestion source."""
+        score = func.word_similarity(text, label)
+        return (
+            select(
+                literal(kind.value).label("kind"),
+                id_column.label("id"),
+                label.label("label"),
+                score.label("score"),
+            )
+            .where(self._matches(text, label))
+            .order_by(score.desc())
+            .limit(limit)
+        )
+
+    def _city_candidates(self, text: str, limit: int) -> Select[tuple[str, int, str, float]]:
+        """Build the best matches query of cities, a city is suggested once."""
+        score = func.max(func.word_similarity(text, Location.city))
+        return (
+            select(
+                literal(SuggestionKind.CITY.value).label("kind"),
+                cast(null(), Integer).label("id"),
+                Location.city.label("label"),
+                score.label("score"),
+            )
+            .where(self._matches(text, Location.city))
+            .group_by(Location.city)
+            .order_by(score.desc())
+            .limit(limit)
+        )
+
+
+async def provide_autocomplete_repo(db_session: AsyncSession) -> AutocompleteRepository:
+    """Provide Autocomplete repository instance.
+
+    Args:
+       db_session: Async database session
+    Returns:
+       AutocompleteRepository instance
+
+    """
+    return AutocompleteRepository(session=db_session)
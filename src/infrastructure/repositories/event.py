@@ -1,26 +1,480 @@
-from typing import TYPE_CHECKING
+import re
+from collections.abc import Mapping, Sequence
+from datetime import datetime
+from decimal import Decimal
+from enum import Enum
+from typing import Any, Final
 
 from litestar.plugins.sqlalchemy import repository
+from sqlalchemy import (
+    ColumnElement,
+    Row,
+    Select,
+    SQLColumnExpression,
+    cast,
+    func,
+    literal,
+    select,
+    tuple_,
+)
+from sqlalchemy.dialects.postgresql import REGCONFIG
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute, joinedload, raiseload, selectinload
+from sqlalchemy.sql.base import ExecutableOption
 
-from src.infrastructure.database.models.event_model import Event
+from src.infrastructure.cache.events import EventResponseCache
+from src.infrastructure.database.models import Event, Location, Organizer
+from src.infrastructure.database.models.event_model import event_price_sort_key
+from src.infrastructure.database.triggers import TEXT_SEARCH_CONFIG
+from src.infrastructure.repositories.filters import EventSearchFilters, EventSortField
+from src.infrastructure.repositories.pagination import CursorPage, decode_cursor, encode_cursor
 
-if TYPE_CHECKING:
-    from sqlalchemy.ext.asyncio import AsyncSession
+# Words of a search query, underscores split words like in the tsquery parser.
+SEARCH_TERM_PATTERN: Final[re.Pattern[str]] = re.compile(r"[^\W_]+")
+# Upper bound of terms in a search query, every term is a prefix scan of the index.
+MAX_SEARCH_TERMS: Final[int] = 8
+SEARCH_HEADLINE_OPTIONS: Final[str] = (
+    "StartSel=<mark>, StopSel=</mark>, MaxWords=30, MinWords=10, MaxFragments=2"
+)
+
+
+def build_prefix_tsquery(text: str) -> str | None:
+    """Build a to_tsquery expression matching every word of the text as a prefix.
+
+    Args:
+        text: Raw search text
+    Returns:
+        tsquery expression, None if the text has no words
+
+    """
+    terms = SEARCH_TERM_PATTERN.findall(text.lower())[:MAX_SEARCH_TERMS]
+    if not terms:
+        return None
+    return " & ".join(f"{term}:*" for term in terms)
+
+
+class EventLoadProfile(str, Enum):
+    """Enum for relationship loading profiles of events.
+
+    Attributes:
+        LIST: Pages of events with their organizers
+        DETAIL: Single event with organizers, location and category
+        ADMIN: Single event with all relationships, for the admin panel
+
+    """
+
+    LIST = "list"
+    DETAIL = "detail"
+    ADMIN = "admin"
+
+
+# Loader options of every profile. Relationships default to lazy="raise", so each
+# profile names what it loads and anything else fails fast instead of issuing
+# a query per row.
+EVENT_LOADER_PROFILES: Final[dict[EventLoadProfile, tuple[ExecutableOption, ...]]] = {
+    EventLoadProfile.LIST: (
+        selectinload(Event.organizers)
+        .load_only(Organizer.id, Organizer.name, Organizer.logo_url, raiseload=True)
+        .raiseload("*"),
+        raiseload("*"),
+    ),
+    EventLoadProfile.DETAIL: (
+        selectinload(Event.organizers).raiseload("*"),
+        joinedload(Event.location).raiseload("*"),
+        joinedload(Event.category).raiseload("*"),
+        raiseload("*"),
+    ),
+    EventLoadProfile.ADMIN: (
+        selectinload(Event.organizers).joinedload(Organizer.user).raiseload("*"),
+        joinedload(Event.location).raiseload("*"),
+        joinedload(Event.category).raiseload("*"),
+        selectinload(Event.registered_profiles).raiseload("*"),
+        raiseload("*"),
+    ),
+}
+
+# Columns of the sparse fieldsets of event listings, by field name. Location
+# fields are outer joined, the others are columns of events.
+EVENT_FIELD_COLUMNS: Final[Mapping[str, SQLColumnExpression[Any]]] = {
+    column.key: column
+    for column in (
+        Event.id,
+        Event.name,
+        Event.description,
+        Event.event_start_date,
+        Event.event_end_date,
+        Event.registration_deadline,
+        Event.timezone,
+        Event.format,
+        Event.status,
+        Event.meeting_link,
+        Event.max_participants,
+        Event.current_participants,
+        Event.registered_count,
+        Event.confirmed_count,
+        Event.waitlisted_count,
+        Event.attended_count,
+        Event.price,
+        Event.currency,
+        Event.location_id,
+        Event.category_id,
+        Event.organizer_id,
+        Event.is_published,
+        Event.is_online,
+        Event.is_verify,
+        Event.pub_date,
+        Event.updated_at,
+    )
+} | {"city": Location.city, "country": Location.country}
+LOCATION_FIELDS: Final[frozenset[str]] = frozenset({"city", "country"})
 
 
 class EventRepository(repository.SQLAlchemyAsyncRepository[Event]):
-    """Repository for the Event model."""
+    """Repository for the Event model.
+
+    Writes invalidate the cached event responses, when a cache is given.
+    """
 
     model_type: type[Event] = Event
 
+    def __init__(self, *, cache: EventResponseCache | None = None, **kwargs: Any) -> None:  # noqa: ANN401
+        """Initialize repository.
+
+        Args:
+            cache: Response cache to invalidate on writes
+            kwargs: Arguments of SQLAlchemyAsyncRepository
+
+        """
+        super().__init__(**kwargs)
+        self.cache = cache
+
+    async def add(self, data: Event, **kwargs: Any) -> Event:  # noqa: ANN401
+        """Add event and invalidate cached responses."""
+        event = await super().add(data, **kwargs)
+        await self._invalidate([event])
+        return event
+
+    async def add_many(self, data: list[Event], **kwargs: Any) -> Sequence[Event]:  # noqa: ANN401
+        """Add events and invalidate cached responses."""
+        events = await super().add_many(data, **kwargs)
+        await self._invalidate(events)
+        return events
+
+    async def update(self, data: Event, **kwargs: Any) -> Event:  # noqa: ANN401
+        """Update event and invalidate cached responses."""
+        event = await super().update(data, **kwargs)
+        await self._invalidate([event])
+        return event
+
+    async def update_many(self, data: list[Event], **kwargs: Any) -> list[Event]:  # noqa: ANN401
+        """Update events and invalidate cached responses."""
+        events = await super().update_many(data, **kwargs)
+        await self._invalidate(events)
+        return events
+
+    async def upsert(self, data: Event, **kwargs: Any) -> Event:  # noqa: ANN401
+        """Update or create event and invalidate cached responses."""
+        event = await super().upsert(data, **kwargs)
+        await self._invalidate([event])
+        return event
+
+    async def upsert_many(self, data: list[Event], **kwargs: Any) -> list[Event]:  # noqa: ANN401
+        """Update or create events and invalidate cached responses."""
+        events = await super().upsert_many(data, **kwargs)
+        await self._invalidate(events)
+        return events
+
+    async def get_and_update(self, *filters: Any, **kwargs: Any) -> tuple[Event, bool]:  # noqa: ANN401
+        """Get and update event and invalidate cached responses when it changed."""
+        event, updated = await super().get_and_update(*filters, **kwargs)
+        if updated:
+            await self._invalidate([event])
+        return event, updated
+
+    async def get_or_upsert(self, *filters: Any, **kwargs: Any) -> tuple[Event, bool]:  # noqa: ANN401
+        """Get, update or create event and invalidate cached responses."""
+        event, created = await super().get_or_upsert(*filters, **kwargs)
+        await self._invalidate([event])
+        return event, created
+
+    async def delete(self, item_id: int, **kwargs: Any) -> Event:  # noqa: ANN401
+        """Delete event and invalidate cached responses."""
+        event = await super().delete(item_id, **kwargs)
+        await self._invalidate([event])
+        return event
+
+    async def delete_many(self, item_ids: list[int], **kwargs: Any) -> Sequence[Event]:  # noqa: ANN401
+        """Delete events and invalidate cached responses."""
+        events = await super().delete_many(item_ids, **kwargs)
+        await self._invalidate(events)
+        return events
+
+    async def delete_where(self, *filters: Any, **kwargs: Any) -> Sequence[Event]:  # noqa: ANN401
+        """Delete events matching the filters and invalidate cached responses."""
+        events = await super().delete_where(*filters, **kwargs)
+        await self._invalidate(events)
+        return events
+
+    @staticmethod
+    def profile_options(profile: EventLoadProfile) -> tuple[ExecutableOption, ...]:
+        """Get loader options of the profile.
+
+        Args:
+            profile: Loading profile
+        Returns:
+            Loader options to apply to a select of events
+
+        """
+        return EVENT_LOADER_PROFILES[profile]
+
+    async def get_detail(
+        self, event_id: int, profile: EventLoadProfile = EventLoadProfile.DETAIL
+    ) -> Event | None:
+        """Get event by id with relationships of the profile loaded.
+
+        Args:
+            event_id: Event id
+            profile: Loading profile
+
+        Returns:
+            Event or None if not found
+
+        """
+        return await self.get_one_or_none(id=event_id, load=list(self.profile_options(profile)))
+
+    async def get_version(self, event_id: int) -> datetime | None:
+        """Get last modification time of the event.
+
+        Args:
+            event_id: Event id
+        Returns:
+            updated_at of the event, None if not found
+
+        """
+        statement = select(Event.updated_at).where(Event.id == event_id)
+        updated_at: datetime | None = await self.session.scalar(statement)
+        return updated_at
+
+    async def list_version(self) -> tuple[datetime | None, int]:
+        """Get last modification time and number of all events.
+
+        Together they change on every insert, update and delete, so they
+        version any list of events. Max is served by the ix_events_updated_at index.
+
+        Returns:
+            Tuple of (max updated_at, count), max is None if there are no events
+
+        """
+        statement = select(func.max(Event.updated_at), func.count()).select_from(Event)
+        last_modified, count = (await self.session.execute(statement)).one()
+        return last_modified, count
+
+    async def list_page(
+        self,
+        limit: int,
+        cursor: str | None = None,
+        profile: EventLoadProfile = EventLoadProfile.LIST,
+        fields: Sequence[str] | None = None,
+    ) -> CursorPage[Event] | CursorPage[Row[Any]]:
+        """Get a page of events ordered by (event_start_date, id).
+
+        Uses keyset pagination backed by the ix_events_event_start_date_id index,
+        so the cost of a page does not grow with its position in the table.
+
+        Args:
+            limit: Maximal number of events in the page
+            cursor: Token of the page to fetch, None for the first page
+            profile: Loading profile
+            fields: Keys of EVENT_FIELD_COLUMNS to select, None for full events
+
+        Returns:
+            CursorPage with events, or rows of the fields, and the next page cursor
+
+        Raises:
+            InvalidCursorError: If the cursor is malformed
+
+        """
+        statement = self._select(profile, fields)
+        return await self._paginate(
+            statement, Event.event_start_date, datetime, limit=limit, cursor=cursor
+        )
+
+    async def search(
+        self,
+        filters: EventSearchFilters,
+        limit: int,
+        cursor: str | None = None,
+        sort: EventSortField = EventSortField.START_DATE,
+        descending: bool = False,
+        profile: EventLoadProfile = EventLoadProfile.LIST,
+        fields: Sequence[str] | None = None,
+    ) -> CursorPage[Event] | CursorPage[Row[Any]]:
+        """Get a page of events matching the filters.
+
+        Every filter combination is served by an index on events: equality filters
+        lead the composite (column, sort key, id) indexes, published and planned
+        events have partial indexes, and the rest is applied as a range on the
+        sort key or as a residual filter.
+
+        Args:
+            filters: Search filters
+            limit: Maximal number of events in the page
+            cursor: Token of the page to fetch, None for the first page
+            sort: Field to sort by
+            descending: Sort in descending order
+            profile: Loading profile
+            fields: Keys of EVENT_FIELD_COLUMNS to select, None for full events
+
+        Returns:
+            CursorPage with events, or rows of the fields, and the next page cursor
+
+        Raises:
+            InvalidCursorError: If the cursor is malformed
+
+        """
+        statement = self._select(profile, fields).where(*self._search_conditions(filters))
+        if sort is EventSortField.PRICE:
+            return await self._paginate(
+                statement, event_price_sort_key, Decimal, limit, cursor, descending
+            )
+        return await self._paginate(
+            statement, Event.event_start_date, datetime, limit, cursor, descending
+        )
+
+    async def text_search(
+        self, text: str, limit: int
+    ) -> Sequence[Row[tuple[int, str, datetime, float, str]]]:
+        """Get events matching the text, ranked by relevance.
+
+        Matches every word as a prefix against the GIN indexed search_vector.
+        Snippets are highlighted only for the returned rows, ts_headline is
+        the expensive part of the query.
+
+        Args:
+            text: Search text
+            limit: Maximal number of events
+
+        Returns:
+            Rows of (id, name, event_start_date, rank, snippet)
+
+        """
+        tsquery = build_prefix_tsquery(text)
+        if tsquery is None:
+            return []
+
+        config = cast(TEXT_SEARCH_CONFIG, REGCONFIG)
+        query = func.to_tsquery(config, tsquery)
+        rank = func.ts_rank_cd(Event.search_vector, query).label("rank")
+        hits = (
+            select(Event.id, Event.name, Event.description, Event.event_start_date, rank)
+            .where(Event.search_vector.op("@@")(query))
+            .order_by(rank.desc(), Event.id)
+            .limit(limit)
+            .subquery()
+        )
+        snippet = func.ts_headline(config, hits.c.description, query, SEARCH_HEADLINE_OPTIONS)
+        statement = select(
+            hits.c.id,
+            hits.c.name,
+            hits.c.event_start_date,
+            hits.c.rank,
+            snippet.label("snippet"),
+        ).order_by(hits.c.rank.desc(), hits.c.id)
+        return (await self.session.execute(statement)).all()
+
+    def _select(
+        self, profile: EventLoadProfile, fields: Sequence[str] | None
+    ) -> Select[tuple[Event]] | Select[tuple[Any, ...]]:
+        """Build the select of full events of the profile, or of the fields only."""
+        if fields is None:
+            return select(Event).options(*self.profile_options(profile))
+        statement = select(*(EVENT_FIELD_COLUMNS[field].label(field) for field in fields))
+        statement = statement.select_from(Event)
+        if LOCATION_FIELDS.intersection(fields):
+            statement = statement.outerjoin(Event.location)
+        return statement
+
+    @staticmethod
+    def _search_conditions(filters: EventSearchFilters) -> list[SQLColumnExpression[bool]]:
+        """Build WHERE conditions of the events search."""
+        conditions: list[SQLColumnExpression[bool]] = []
+        if filters.category_id is not None:
+            conditions.append(Event.category_id == filters.category_id)
+        if filters.format is not None:
+            conditions.append(Event.format == filters.format)
+        if filters.status is not None:
+            # Inlined, so the planner can match the partial indexes on status.
+            status = literal(filters.status, Event.status.type, literal_execute=True)
+            conditions.append(Event.status == status)
+        if filters.is_published is not None:
+            conditions.append(Event.is_published if filters.is_published else ~Event.is_published)
+        if filters.city is not None or filters.country is not None:
+            locations = select(Location.id)
+            if filters.city is not None:
+                locations = locations.where(Location.city == filters.city)
+            if filters.country is not None:
+                locations = locations.where(Location.country == filters.country)
+            conditions.append(Event.location_id.in_(locations))
+        if filters.min_price is not None:
+            conditions.append(event_price_sort_key >= filters.min_price)
+        if filters.max_price is not None:
+            conditions.append(event_price_sort_key <= filters.max_price)
+        if filters.starts_after is not None:
+            conditions.append(Event.event_start_date >= filters.starts_after)
+        if filters.starts_before is not None:
+            conditions.append(Event.event_start_date < filters.starts_before)
+        return conditions
+
+    async def _invalidate(self, events: Sequence[Event]) -> None:
+        """Invalidate cached responses of the written events."""
+        if self.cache is not None:
+            await self.cache.invalidate(event.id for event in events)
+
+    async def _paginate(
+        self,
+        statement: Select[tuple[Event]] | Select[tuple[Any, ...]],
+        sort_key: ColumnElement[Any] | InstrumentedAttribute[Any],
+        sort_key_type: type,
+        limit: int,
+        cursor: str | None = None,
+        descending: bool = False,
+    ) -> CursorPage[Event] | CursorPage[Row[Any]]:
+        """Apply keyset pagination over (sort_key, id) to the statement.
+
+        Fetches one extra row to find out whether there is a next page. Items are
+        events for a select of Event, rows otherwise.
+        """
+        if cursor is not None:
+            last_key, last_id = decode_cursor(cursor, tuple[sort_key_type, int])  # type: ignore[valid-type]
+            position = tuple_(sort_key, Event.id)
+            boundary = tuple_(literal(last_key, sort_key.type), literal(last_id))
+            statement = statement.where(position < boundary if descending else position > boundary)
+
+        order = (sort_key.desc(), Event.id.desc()) if descending else (sort_key, Event.id)
+        entities = statement.column_descriptions[0]["type"] is Event
+        statement = statement.add_columns(sort_key.label("sort_key")).order_by(*order)
+        rows = (await self.session.execute(statement.limit(limit + 1))).all()
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            last_item = rows[-1][0] if entities else rows[-1]
+            next_cursor = encode_cursor(rows[-1].sort_key, last_item.id)
+        if entities:
+            return CursorPage(items=[row[0] for row in rows], limit=limit, next_cursor=next_cursor)
+        return CursorPage(items=list(rows), limit=limit, next_cursor=next_cursor)
+
 
-async def provide_event_repo(db_session: AsyncSession) -> EventRepository:
+async def provide_event_repo(
+    db_session: AsyncSession, cache: EventResponseCache
+) -> EventRepository:
     """Provide Event repository instance.
 
     Args:
        db_session: Async database session
+       cache: Response cache of the event endpoints
     Returns:
        EventRepository instance
 
     """
-    return EventRepository(session=db_session)
+    return EventRepository(session=db_session, cache=cache)
@@ -0,0 +1,43 @@
+from dataclasses import dataclass
+from datetime import datetime
+from decimal import Decimal
+from enum import Enum
+from typing import Final
+
+from src.infrastructure.database.models.enums import EventFormat, EventStatus
+
+# Sparse fieldset of the event cards of list views.
+EVENT_CARD_FIELDS: Final[tuple[str, ...]] = ("id", "name", "event_start_date", "city", "price")
+
+
+class EventSortField(str, Enum):
+    """Enum for sortable event fields.
+
+    Attributes:
+        START_DATE: Sort by event start date
+        PRICE: Sort by price, free events first
+
+    """
+
+    START_DATE = "start_date"
+    PRICE = "price"
+
+
+@dataclass
+class EventSearchFilters:
+    """Filters of the events search.
+
+    Every filter is optional, None means the filter is not applied.
+    Date window is half-open: starts_after <= event_start_date < starts_before.
+    """
+
+    category_id: int | None = None
+    city: str | None = None
+    country: str | None = None
+    format: EventFormat | None = None
+    status: EventStatus | None = None
+    min_price: Decimal | None = None
+    max_price: Decimal | None = None
+    is_published: bool | None = None
+    starts_after: datetime | None = None
+    starts_before: datetime | None = None
@@ -0,0 +1,63 @@
+import base64
+import binascii
+from dataclasses import dataclass
+from typing import Generic, TypeVar
+
+import msgspec
+
+T = TypeVar("T")
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor cannot be decoded."""
+
+
+@dataclass
+class CursorPage(Generic[T]):
+    """Envelope for a single page of keyset paginated results.
+
+    Attributes:
+        items: Rows of the current page
+        limit: Maximal number of rows in the page
+        next_cursor: Opaque token of the next page, None on the last page
+
+    """
+
+    items: list[T]
+    limit: int
+    next_cursor: str | None = None
+
+
+def encode_cursor(*values: object) -> str:
+    """Encode keyset values of the last row into an opaque cursor token.
+
+    Args:
+        values: Values of the ordering columns, in ordering order
+    Returns:
+        URL-safe cursor token
+
+    """
+    raw = msgspec.json.encode(values)
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+
+def decode_cursor(token: str, value_type: type[T]) -> T:
+    """Decode a cursor token back into typed keyset values.
+
+    Args:
+        token: Cursor token produced by encode_cursor
+        value_type: Expected type of the decoded values, e.g. tuple[datetime, int]
+
+    Returns:
+        Decoded keyset values
+
+    Raises:
+        InvalidCursorError: If the token is malformed or holds unexpected values
+
+    """
+    padded = token + "=" * (-len(token) % 4)
+    try:
+        raw = base64.urlsafe_b64decode(padded.encode("ascii"))
+        return msgspec.json.decode(raw, type=value_type)
+    except (binascii.Error, UnicodeEncodeError, msgspec.DecodeError) as e:
+        raise InvalidCursorError("Malformed pagination cursor.") from e
@@ -0,0 +1,642 @@
+from collections.abc import Collection, Sequence
+from typing import Any, Final
+
+from advanced_alchemy.exceptions import DuplicateKeyError, NotFoundError, wrap_sqlalchemy_exception
+from litestar.plugins.sqlalchemy import repository
+from sqlalchemy import (
+    Boolean,
+    Integer,
+    Row,
+    String,
+    bindparam,
+    case,
+    cast,
+    exists,
+    func,
+    literal,
+    literal_column,
+    select,
+    tuple_,
+    update,
+)
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.infrastructure.cache.events import EventResponseCache
+from src.infrastructure.database.models import Event, EventRegistration, Organizer, Profile
+from src.infrastructure.database.models.associations_model import EventOrganizers
+from src.infrastructure.database.models.enums import ParticipantStatus
+from src.infrastructure.database.models.event_model import (
+    event_is_upcoming,
+    event_registration_open,
+)
+
+# Statuses of registrations holding a seat, counted in Event.current_participants.
+SEAT_STATUSES: Final[tuple[ParticipantStatus, ...]] = (
+    ParticipantStatus.REGISTERED,
+    ParticipantStatus.CONFIRMED,
+    ParticipantStatus.ATTENDED,
+    ParticipantStatus.NO_SHOW,
+)
+# Statuses of registrations the participant can still cancel.
+CANCELLABLE_STATUSES: Final[tuple[ParticipantStatus, ...]] = (
+    ParticipantStatus.REGISTERED,
+    ParticipantStatus.CONFIRMED,
+    ParticipantStatus.WAITLISTED,
+)
+# Statuses set by organizers in bulk: walk-in registrations and check-in at the door.
+BULK_STATUSES: Final[tuple[ParticipantStatus, ...]] = (
+    ParticipantStatus.REGISTERED,
+    ParticipantStatus.ATTENDED,
+    ParticipantStatus.NO_SHOW,
+)
+
+# Counters of events rebuilt from their registrations, by the statuses they count.
+EVENT_COUNTERS: Final[dict[str, tuple[ParticipantStatus, ...]]] = {
+    "registered_count": (ParticipantStatus.REGISTERED,),
+    "confirmed_count": (ParticipantStatus.CONFIRMED,),
+    "waitlisted_count": (ParticipantStatus.WAITLISTED,),
+    "attended_count": (ParticipantStatus.ATTENDED,),
+    "current_participants": SEAT_STATUSES,
+}
+
+is_waitlisted = EventRegistration.status == ParticipantStatus.WAITLISTED
+is_cancelled = EventRegistration.status == ParticipantStatus.CANCELLED
+
+
+class RegistrationClosedError(Exception):
+    """Raised when registering for an event that does not accept registrations."""
+
+
+class RegistrationRepository(repository.SQLAlchemyAsyncRepository[EventRegistration]):
+    """Repository for the registrations of profiles for events.
+
+    Writes change the counters of the events, and their updated_at, so they
+    invalidate the cached event responses, when a cache is given.
+    """
+
+    model_type: type[EventRegistration] = EventRegistration
+
+    def __init__(self, *, cache: EventResponseCache | None = None, **kwargs: Any) -> None:  # noqa: ANN401
+        """Initialize repository.
+
+        Args:
+            cache: Response cache of the events to invalidate on writes
+            kwargs: Arguments of SQLAlchemyAsyncRepository
+
+        """
+        super().__init__(**kwargs)
+        self.cache = cache
+
+    async def register(
+        self, profile_id: int, event_id: int, *, auto_commit: bool | None = None
+    ) -> EventRegistration:
+        """Register the profile for the event, on the waitlist when the event is full.
+
+        One statement takes a seat and inserts the registration: the seat is taken
+        by a conditional UPDATE of the participant counter, so concurrent
+        registrations queue on the event row only for that update and can never
+        oversell, and the registration is REGISTERED if it got a seat, WAITLISTED
+        otherwise. Seats freed while profiles wait go to the waitlist first. A
+        cancelled registration of the profile is revived and queued as a new one.
+        A profile already registered takes no seat, and if a concurrent
+        registration of the same profile took one, the error leaves it in the
+        transaction to roll back.
+
+        Args:
+            profile_id: Registering profile
+            event_id: Event to register for
+            auto_commit: Commit the registration before returning
+
+        Returns:
+            Created or revived registration, detached from the session
+
+        Raises:
+            NotFoundError: If the event does not exist
+            RegistrationClosedError: If the event does not accept registrations
+            DuplicateKeyError: If the profile is already registered for the event
+            ForeignKeyError: If the profile does not exist
+
+        """
+        seats_taken = func.coalesce(Event.current_participants, 0)
+        seat = (
+            update(Event)
+            .where(
+                Event.id == event_id,
+                event_registration_open,
+                Event.max_participants.is_(None) | (seats_taken < Event.max_participants),
+                ~exists().where(EventRegistration.event_id == Event.id, is_waitlisted),
+                ~exists().where(
+                    EventRegistration.event_id == Event.id,
+                    EventRegistration.profile_id == profile_id,
+                    ~is_cancelled,
+                ),
+            )
+            .values(current_participants=seats_taken + 1)
+            .returning(Event.id)
+            .cte("seat")
+        )
+        status_type = EventRegistration.__table__.c.status.type
+        status = case(
+            (exists(seat.select()), literal(ParticipantStatus.REGISTERED, status_type)),
+            else_=literal(ParticipantStatus.WAITLISTED, status_type),
+        )
+        insert_registration = pg_insert(EventRegistration).from_select(
+            ["profile_id", "event_id", "status"],
+            select(literal(profile_id), Event.id, status).where(
+                Event.id == event_id, event_registration_open
+            ),
+        )
+        statement = (
+            insert_registration.on_conflict_do_update(
+                index_elements=["profile_id", "event_id"],
+                # Revived registrations queue behind the waiting ones.
+                set_={"status": insert_registration.excluded.status, "created_at": func.now()},
+                where=is_cancelled,
+            )
+            .add_cte(seat)
+            .returning(EventRegistration)
+        )
+        error_messages = self._get_error_messages(default_messages=self.error_messages)
+        with wrap_sqlalchemy_exception(
+            error_messages=error_messages, dialect_name=self._dialect.name
+        ):
+            registration = (await self.session.scalars(statement)).one_or_none()
+            if registration is None:
+                found = await self.session.scalar(select(exists().where(Event.id == event_id)))
+                if not found:
+                    raise NotFoundError(f"Event {event_id} not found.")
+                registered = await self.session.scalar(
+                    select(
+                        exists().where(
+                            EventRegistration.profile_id == profile_id,
+                            EventRegistration.event_id == event_id,
+                            ~is_cancelled,
+                        )
+                    )
+                )
+                if registered:
+                    raise DuplicateKeyError(f"Already registered for event {event_id}.")
+                raise RegistrationClosedError(f"Event {event_id} does not accept registrations.")
+            # Detached, the registration keeps the returned values through the commit.
+            self.session.expunge(registration)
+            await self._flush_or_commit(auto_commit=auto_commit)
+        await self._invalidate([event_id])
+        return registration
+
+    async def cancel(
+        self, profile_id: int, event_id: int, *, auto_commit: bool | None = None
+    ) -> ParticipantStatus:
+        """Cancel the registration of the profile for the event, freeing its seat.
+
+        The registration is locked and cancelled, and the participant counter
+        decremented if it held a seat, in one statement.
+
+        Args:
+            profile_id: Registered profile
+            event_id: Event of the registration
+            auto_commit: Commit the cancellation before returning
+
+        Returns:
+            Status of the registration before the cancellation
+
+        Raises:
+            NotFoundError: If the profile has no cancellable registration for the event
+
+        """
+        previous = (
+            select(EventRegistration.id, EventRegistration.status)
+            .where(
+                EventRegistration.profile_id == profile_id,
+                EventRegistration.event_id == event_id,
+                EventRegistration.status.in_(CANCELLABLE_STATUSES),
+            )
+            .with_for_update()
+            .cte("previous")
+        )
+        cancelled = (
+            update(EventRegistration)
+            .where(EventRegistration.id == previous.c.id)
+            .values(status=ParticipantStatus.CANCELLED)
+            .returning(previous.c.status)
+            .cte("cancelled")
+        )
+        seat = (
+            update(Event)
+            .where(
+                Event.id == event_id,
+                exists().where(cancelled.c.status.in_(SEAT_STATUSES)),
+            )
+            .values(current_participants=Event.current_participants - 1)
+            .returning(Event.id)
+            .cte("seat")
+        )
+        statement = select(cancelled.c.status).add_cte(seat)
+        with wrap_sqlalchemy_exception():
+            status: ParticipantStatus | None = (
+                await self.session.execute(statement)
+            ).scalar_one_or_none()
+            if status is None:
+                raise NotFoundError(f"No registration to cancel for event {event_id}.")
+            await self._flush_or_commit(auto_commit=auto_commit)
+        await self._invalidate([event_id])
+        return status
+
+    async def promote_waitlisted(
+        self, batch_size: int, *, auto_commit: bool | None = None
+    ) -> Sequence[Row[tuple[int, int, int]]]:
+        """Promote waitlisted registrations of events with free seats, first come first served.
+
+        The events of the batch are locked with FOR UPDATE SKIP LOCKED, so
+        concurrent promoters, e.g. on other instances, take other events instead
+        of waiting. Their oldest waitlisted registrations fill the free seats and
+        the participant counters are incremented, in one statement.
+
+        Args:
+            batch_size: Events locked, and registrations promoted, at most
+            auto_commit: Commit the promotions before returning
+
+        Returns:
+            Ids, profile ids and event ids of the promoted registrations
+
+        """
+        free_seats = Event.max_participants - func.coalesce(Event.current_participants, 0)
+        events = (
+            select(Event.id, free_seats.label("free_seats"))
+            .where(
+                event_is_upcoming,
+                free_seats > 0,
+                exists().where(EventRegistration.event_id == Event.id, is_waitlisted),
+            )
+            .order_by(Event.id)
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+            .cte("locked_events")
+        )
+        position = func.row_number().over(
+            partition_by=EventRegistration.event_id,
+            order_by=(EventRegistration.created_at, EventRegistration.id),
+        )
+        queue = (
+            select(
+                EventRegistration.id,
+                EventRegistration.event_id,
+                position.label("position"),
+                events.c.free_seats,
+            )
+            .join(events, events.c.id == EventRegistration.event_id)
+            .where(is_waitlisted)
+            .subquery("queue")
+        )
+        chosen = (
+            select(queue.c.id)
+            .where(queue.c.position <= queue.c.free_seats)
+            .order_by(queue.c.event_id, queue.c.position)
+            .limit(batch_size)
+        )
+        promoted = (
+            update(EventRegistration)
+            # Registrations cancelled meanwhile are no longer waitlisted and skipped.
+            .where(EventRegistration.id.in_(chosen), is_waitlisted)
+            .values(status=ParticipantStatus.REGISTERED)
+            .returning(
+                EventRegistration.id, EventRegistration.profile_id, EventRegistration.event_id
+            )
+            .cte("promoted")
+        )
+        counts = (
+            select(promoted.c.event_id, func.count().label("promoted"))
+            .group_by(promoted.c.event_id)
+            .subquery("counts")
+        )
+        seats = (
+            update(Event)
+            .where(Event.id == counts.c.event_id)
+            .values(
+                current_participants=func.coalesce(Event.current_participants, 0)
+                + counts.c.promoted,
+            )
+            .returning(Event.id)
+            .cte("seats")
+        )
+        statement = select(promoted.c.id, promoted.c.profile_id, promoted.c.event_id).add_cte(seats)
+        with wrap_sqlalchemy_exception():
+            rows = (await self.session.execute(statement)).all()
+            await self._flush_or_commit(auto_commit=auto_commit)
+        await self._invalidate({row.event_id for row in rows})
+        return rows
+
+    async def bulk_upsert(
+        self,
+        items: Sequence[tuple[int, int, ParticipantStatus]],
+        organizer_user_id: int,
+        *,
+        auto_commit: bool | None = None,
+    ) -> Sequence[Row[tuple[int, int, ParticipantStatus, ParticipantStatus | None, bool]]]:
+        """Create or update registrations of events organized by the user, in one statement.
+
+        The items are sent as arrays and unnested by the database. Items of events
+        the user does not organize, or of unknown profiles, are skipped. The
+        others go through one INSERT ... ON CONFLICT DO UPDATE, and the participant
+        counters grow by the registrations that take a seat. Registrations
+        holding a seat only change status. The others get a seat as register
+        gives them: the events are locked, waitlisted registrations get the free
+        seats in the order of the waitlist, and new or cancelled ones, in the
+        order of the items, the seats the waitlist leaves. Items without a seat
+        are WAITLISTED, cancelled ones queue as new registrations. Previous
+        statuses are read from the snapshot of the statement, a registration
+        changed by a concurrent transaction in the meantime is counted by its
+        snapshot status.
+
+        Args:
+            items: Profile ids, event ids and statuses from BULK_STATUSES, one item
+                per registration
+            organizer_user_id: Id of the user organizing the events
+            auto_commit: Commit the registrations before returning
+
+        Returns:
+            Profile id, event id, status, status before the statement (None for
+            created registrations) and whether it was created, of applied items
+
+        """
+        status_type = EventRegistration.__table__.c.status.type
+        item = (
+            func.unnest(
+                bindparam("profile_ids", [i[0] for i in items], type_=ARRAY(Integer)),
+                bindparam("event_ids", [i[1] for i in items], type_=ARRAY(Integer)),
+                bindparam("statuses", [i[2].name for i in items], type_=ARRAY(String)),
+            )
+            .table_valued("profile_id", "event_id", "status", with_ordinality="position")
+            .render_derived(name="item")
+        )
+        organized_events = (
+            select(Event.id)
+            .join(Organizer, Organizer.id == Event.organizer_id)
+            .where(Organizer.user_id == organizer_user_id)
+            .union(
+                select(EventOrganizers.event_id)
+                .join(Organizer, Organizer.id == EventOrganizers.organizer_id)
+                .where(Organizer.user_id == organizer_user_id)
+            )
+        )
+        allowed = (
+            select(
+                item.c.profile_id,
+                item.c.event_id,
+                cast(item.c.status, status_type).label("status"),
+                item.c.position,
+            )
+            .where(
+                item.c.event_id.in_(organized_events),
+                exists().where(Profile.id == item.c.profile_id),
+            )
+            .cte("allowed")
+        )
+        # Locked like by the seat update of register, free seats are read after
+        # concurrent seat changes commit. NULL for events without a limit.
+        events = (
+            select(
+                Event.id,
+                (Event.max_participants - func.coalesce(Event.current_participants, 0)).label(
+                    "free_seats"
+                ),
+            )
+            .where(Event.id.in_(select(allowed.c.event_id)))
+            .with_for_update()
+            .cte("locked_events")
+        )
+        waitlisted_for_items = (
+            is_waitlisted,
+            EventRegistration.event_id.in_(select(allowed.c.event_id)),
+        )
+        waitlist = (
+            select(
+                EventRegistration.id,
+                func.row_number()
+                .over(
+                    partition_by=EventRegistration.event_id,
+                    order_by=(EventRegistration.created_at, EventRegistration.id),
+                )
+                .label("position"),
+            )
+            .where(*waitlisted_for_items)
+            .subquery("waitlist")
+        )
+        waiting = (
+            select(EventRegistration.event_id, func.count().label("waiting"))
+            .where(*waitlisted_for_items)
+            .group_by(EventRegistration.event_id)
+            .subquery("waiting")
+        )
+        previous_status = EventRegistration.status
+        is_newcomer = previous_status.is_(None) | (previous_status == ParticipantStatus.CANCELLED)
+        newcomer_position = func.row_number().over(
+            partition_by=(allowed.c.event_id, is_newcomer), order_by=allowed.c.position
+        )
+        gets_seat = (
+            previous_status.in_(SEAT_STATUSES)
+            | events.c.free_seats.is_(None)
+            | (
+                is_newcomer
+                & (newcomer_position <= events.c.free_seats - func.coalesce(waiting.c.waiting, 0))
+            )
+            | (
+                (previous_status == ParticipantStatus.WAITLISTED)
+                & (waitlist.c.position <= events.c.free_seats)
+            )
+        )
+        decided = (
+            select(
+                allowed.c.profile_id,
+                allowed.c.event_id,
+                case(
+                    (gets_seat, allowed.c.status),
+                    else_=literal(ParticipantStatus.WAITLISTED, status_type),
+                ).label("status"),
+                previous_status.label("previous_status"),
+            )
+            .select_from(allowed)
+            .join(events, events.c.id == allowed.c.event_id)
+            .outerjoin(
+                EventRegistration,
+                (EventRegistration.profile_id == allowed.c.profile_id)
+                & (EventRegistration.event_id == allowed.c.event_id),
+            )
+            .outerjoin(waitlist, waitlist.c.id == EventRegistration.id)
+            .outerjoin(waiting, waiting.c.event_id == allowed.c.event_id)
+            .cte("decided")
+        )
+        upsert = pg_insert(EventRegistration).from_select(
+            ["profile_id", "event_id", "status"],
+            select(decided.c.profile_id, decided.c.event_id, decided.c.status),
+        )
+        upserted = (
+            upsert.on_conflict_do_update(
+                index_elements=["profile_id", "event_id"],
+                set_={
+                    "status": upsert.excluded.status,
+                    # Revived registrations queue behind the waiting ones.
+                    "created_at": case(
+                        (is_cancelled, func.now()), else_=EventRegistration.created_at
+                    ),
+                },
+            )
+            .returning(
+                EventRegistration.profile_id,
+                EventRegistration.event_id,
+                EventRegistration.status,
+                # The row version of an inserted row was never deleted by an update.
+                literal_column("xmax = 0", Boolean).label("created"),
+            )
+            .cte("upserted")
+        )
+        items_with_previous = upserted.join(
+            decided,
+            (decided.c.profile_id == upserted.c.profile_id)
+            & (decided.c.event_id == upserted.c.event_id),
+        )
+        seated = (
+            select(upserted.c.event_id, func.count().label("seated"))
+            .select_from(items_with_previous)
+            .where(
+                upserted.c.status != ParticipantStatus.WAITLISTED,
+                decided.c.previous_status.is_(None)
+                | decided.c.previous_status.in_(
+                    (ParticipantStatus.WAITLISTED, ParticipantStatus.CANCELLED)
+                ),
+            )
+            .group_by(upserted.c.event_id)
+            .subquery("seated")
+        )
+        seats = (
+            update(Event)
+            .where(Event.id == seated.c.event_id)
+            .values(
+                current_participants=func.coalesce(Event.current_participants, 0) + seated.c.seated,
+            )
+            .returning(Event.id)
+            .cte("seats")
+        )
+        statement = (
+            select(
+                upserted.c.profile_id,
+                upserted.c.event_id,
+                upserted.c.status,
+                decided.c.previous_status,
+                upserted.c.created,
+            )
+            .select_from(items_with_previous)
+            .add_cte(seats)
+        )
+        with wrap_sqlalchemy_exception():
+            rows = (await self.session.execute(statement)).all()
+            await self._flush_or_commit(auto_commit=auto_commit)
+        await self._invalidate({row.event_id for row in rows})
+        return rows
+
+    async def reconcile_counts(
+        self, after_id: int, batch_size: int, *, auto_commit: bool | None = None
+    ) -> tuple[Sequence[int], Sequence[Row[Any]]]:
+        """Rebuild the counters of a batch of events from their registrations.
+
+        The events are locked first and counted by the next statement, whose
+        snapshot sees every committed change of their registrations, while
+        uncommitted ones still have to lock the event to apply their deltas.
+        Only the events whose counters drifted are updated, which bumps their
+        updated_at and drops their cached responses.
+
+        Args:
+            after_id: Id of the last event of the previous batch, 0 to start
+            batch_size: Events locked and counted
+            auto_commit: Commit the counters before returning
+
+        Returns:
+            Ids of the events of the batch, empty past the last event, and the
+            drifted events: id, then the stored and the counted value of each of
+            EVENT_COUNTERS as "stored_<counter>" and "<counter>"
+
+        """
+        locked = (
+            select(Event.id)
+            .where(Event.id > after_id)
+            .order_by(Event.id)
+            .limit(batch_size)
+            .with_for_update()
+        )
+        with wrap_sqlalchemy_exception():
+            event_ids = (await self.session.execute(locked)).scalars().all()
+        if not event_ids:
+            return event_ids, []
+        first_id, last_id = event_ids[0], event_ids[-1]
+
+        counted = (
+            select(
+                EventRegistration.event_id,
+                *(
+                    func.count().filter(EventRegistration.status.in_(statuses)).label(counter)
+                    for counter, statuses in EVENT_COUNTERS.items()
+                ),
+            )
+            .where(EventRegistration.event_id.between(first_id, last_id))
+            .group_by(EventRegistration.event_id)
+            .subquery("counted")
+        )
+        stored = [getattr(Event, counter) for counter in EVENT_COUNTERS]
+        actual = {counter: func.coalesce(counted.c[counter], 0) for counter in EVENT_COUNTERS}
+        drifted = (
+            select(
+                Event.id,
+                *(column.label(f"stored_{column.key}") for column in stored),
+                *(value.label(counter) for counter, value in actual.items()),
+            )
+            .outerjoin(counted, counted.c.event_id == Event.id)
+            .where(
+                Event.id.between(first_id, last_id),
+                tuple_(*stored).is_distinct_from(tuple_(*actual.values())),
+            )
+            .subquery("drifted")
+        )
+        statement = (
+            update(Event)
+            .where(Event.id == drifted.c.id)
+            .values({counter: drifted.c[counter] for counter in EVENT_COUNTERS})
+            .returning(*drifted.c)
+        )
+        with wrap_sqlalchemy_exception():
+            rows = (await self.session.execute(statement)).all()
+            await self._flush_or_commit(auto_commit=auto_commit)
+        await self._invalidate([row.id for row in rows])
+        return event_ids, rows
+
+    async def _invalidate(self, event_ids: Collection[int]) -> None:
+        """Invalidate cached responses of the events whose registrations were written."""
+        if self.cache is not None and event_ids:
+            await self.cache.invalidate(event_ids)
+
+    async def get_profile_id(self, user_id: int) -> int | None:
+        """Get the id of the profile of the user.
+
+        Args:
+            user_id: Id of the user
+        Returns:
+            Id of the profile, None if the user has no profile
+
+        """
+        statement = select(Profile.id).where(Profile.user_id == user_id)
+        return (await self.session.execute(statement)).scalar_one_or_none()
+
+
+async def provide_registration_repo(
+    db_session: AsyncSession, cache: EventResponseCache
+) -> RegistrationRepository:
+    """Provide Registration repository instance.
+
+    Args:
+       db_session: Async database session
+       cache: Response cache of the event endpoints
+    Returns:
+       RegistrationRepository instance
+
+    """
+    return RegistrationRepository(session=db_session, cache=cache)
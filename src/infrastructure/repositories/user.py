@@ -0,0 +1,43 @@
+from litestar.plugins.sqlalchemy import repository
+from sqlalchemy import case, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.infrastructure.database.models import User
+
+
+class UserRepository(repository.SQLAlchemyAsyncRepository[User]):
+    """Repository for users."""
+
+    model_type: type[User] = User
+
+    async def get_by_login(self, login: str) -> User | None:
+        """Get the user with the username or email.
+
+        The username wins when the login is the username of a user and the email
+        of another one.
+
+        Args:
+            login: Username or email
+        Returns:
+            User or None if there is none
+
+        """
+        statement = (
+            select(User)
+            .where(or_(User.username == login, User.email == login))
+            .order_by(case((User.username == login, 0), else_=1))
+            .limit(1)
+        )
+        return (await self.session.execute(statement)).scalars().first()
+
+
+async def provide_user_repo(db_session: AsyncSession) -> UserRepository:
+    """Provide User repository instance.
+
+    Args:
+       db_session: Async database session
+    Returns:
+       UserRepository instance
+
+    """
+    return UserRepository(session=db_session)
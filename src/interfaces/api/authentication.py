@@ -0,0 +1,42 @@
+from litestar.connection import ASGIConnection
+from litestar.exceptions import NotAuthorizedException
+from litestar.middleware import (
+    AbstractAuthenticationMiddleware,
+    AuthenticationResult,
+    DefineMiddleware,
+)
+
+from src.domain.services.token_service import TokenError
+from src.infrastructure.dependencies.dependencies import deny_list, token_service
+
+BEARER_PREFIX = "bearer "
+
+
+class JWTAuthenticationMiddleware(AbstractAuthenticationMiddleware):
+    """Authenticates requests by the bearer access token, without a database lookup.
+
+    The user of the request is the claims of the token, the auth the token.
+    Handlers with the exclude_from_auth opt are public.
+    """
+
+    async def authenticate_request(self, connection: ASGIConnection) -> AuthenticationResult:
+        """Verify the token of the Authorization header.
+
+        Raises:
+            NotAuthorizedException: If the token is missing, invalid or of an inactive user
+
+        """
+        authorization = connection.headers.get("authorization", "")
+        if authorization[: len(BEARER_PREFIX)].lower() != BEARER_PREFIX:
+            raise NotAuthorizedException("Missing bearer token.")
+        token = authorization[len(BEARER_PREFIX) :].strip()
+        try:
+            claims = token_service.verify(token)
+        except TokenError as e:
+            raise NotAuthorizedException(str(e)) from e
+        if claims.user_id in deny_list:
+            raise NotAuthorizedException("User is inactive.")
+        return AuthenticationResult(user=claims, auth=token)
+
+
+jwt_auth_middleware = DefineMiddleware(JWTAuthenticationMiddleware)
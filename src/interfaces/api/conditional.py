@@ -0,0 +1,103 @@
+import hashlib
+from datetime import UTC, datetime
+from email.utils import format_datetime, parsedate_to_datetime
+
+from litestar import MediaType, Request, Response
+from litestar.status_codes import HTTP_304_NOT_MODIFIED
+
+from src.infrastructure.cache.events import CachedResponse
+
+
+def make_etag(*parts: object) -> str:
+    """Build a weak entity tag from the values versioning a response.
+
+    Args:
+        parts: Values that change whenever the response changes, e.g. (id, updated_at)
+
+    Returns:
+        Weak entity tag, quoted
+
+    """
+    digest = hashlib.sha256(repr(parts).encode()).hexdigest()[:32]
+    return f'W/"{digest}"'
+
+
+def _as_utc(value: datetime) -> datetime:
+    """Return the datetime in UTC, naive values are UTC already."""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=UTC)
+    return value.astimezone(UTC)
+
+
+def is_conditional(request: Request) -> bool:
+    """Check whether the request carries validators of a cached response."""
+    return "if-none-match" in request.headers or "if-modified-since" in request.headers
+
+
+def is_not_modified(request: Request, etag: str, last_modified: datetime | None) -> bool:
+    """Evaluate If-None-Match, or If-Modified-Since in its absence, of a GET request.
+
+    Entity tags are compared weakly, as RFC 9110 requires for If-None-Match.
+    If-Modified-Since is ignored for responses without a modification time.
+
+    Args:
+        request: Current request
+        etag: Entity tag of the current response
+        last_modified: Last modification time of the current response, None if
+            it does not capture every change, e.g. deletes from a list
+
+    Returns:
+        True if the client copy is still valid and 304 may be sent
+
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        return "*" in tags or etag.removeprefix("W/") in tags
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since is None or last_modified is None:
+        return False
+    try:
+        since = _as_utc(parsedate_to_datetime(if_modified_since))
+    except (TypeError, ValueError):
+        return False
+    # HTTP dates have a resolution of one second.
+    return _as_utc(last_modified).replace(microsecond=0) <= since
+
+
+def validator_headers(etag: str, last_modified: datetime | None) -> dict[str, str]:
+    """Build the ETag, Last-Modified and Cache-Control headers of a response."""
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if last_modified is not None:
+        headers["Last-Modified"] = format_datetime(_as_utc(last_modified), usegmt=True)
+    return headers
+
+
+def not_modified_response(etag: str, last_modified: datetime | None) -> Response[bytes]:
+    """Build a 304 response with the validators of the unchanged response."""
+    return Response(
+        content=b"",
+        status_code=HTTP_304_NOT_MODIFIED,
+        headers=validator_headers(etag, last_modified),
+    )
+
+
+def conditional_response(request: Request, cached: CachedResponse) -> Response[bytes]:
+    """Build a 304 or a full JSON response of an encoded response body.
+
+    Args:
+        request: Current request
+        cached: Encoded response body with its validators
+
+    Returns:
+        304 response if the client copy is still valid, response with the body otherwise
+
+    """
+    if is_not_modified(request, cached.etag, cached.last_modified):
+        return not_modified_response(cached.etag, cached.last_modified)
+    return Response(
+        content=cached.body,
+        media_type=MediaType.JSON,
+        headers=validator_headers(cached.etag, cached.last_modified),
+    )
@@ -1,5 +1,64 @@
-from litestar import Controller
+from advanced_alchemy.exceptions import DuplicateKeyError
+from litestar import Controller, Request, Response, get, post
+from litestar.datastructures import State
+from litestar.exceptions import ClientException, NotAuthorizedException
+from litestar.status_codes import HTTP_409_CONFLICT, HTTP_503_SERVICE_UNAVAILABLE
+
+from src.domain.services.auth_service import AuthService
+from src.domain.services.password_service import PasswordHasherBusyError
+from src.domain.services.token_service import TokenClaims, TokenService
+from src.domain.services.user_service import UserService
+from src.infrastructure.dependencies.dependencies import auth_dependencies
+from src.interfaces.api.authentication import jwt_auth_middleware
+from src.interfaces.api.schemas import (
+    AuthenticatedUserSchema,
+    CreateUserSchema,
+    LoginSchema,
+    ReadUserSchema,
+    TokenSchema,
+)
+
+
+def password_hasher_busy_handler(_: Request, exc: PasswordHasherBusyError) -> Response:
+    """Ask the client to retry when the password hasher queue is full."""
+    return Response(
+        content={"status_code": HTTP_503_SERVICE_UNAVAILABLE, "detail": str(exc)},
+        status_code=HTTP_503_SERVICE_UNAVAILABLE,
+        headers={"Retry-After": "1"},
+    )
 
 
 class AuthController(Controller):
-    """Basic auth controller."""
+    """Registration, login and the user of the access token."""
+
+    path = "/auth"
+    dependencies = auth_dependencies
+    middleware = [jwt_auth_middleware]
+    exception_handlers = {PasswordHasherBusyError: password_hasher_busy_handler}
+
+    @post("/register", exclude_from_auth=True)
+    async def register(self, data: CreateUserSchema, user_service: UserService) -> ReadUserSchema:
+        """Register a user."""
+        try:
+            user = await user_service.register(data.username, data.email, data.password)
+        except DuplicateKeyError as e:
+            raise ClientException(
+                "Username or email already taken.", status_code=HTTP_409_CONFLICT
+            ) from e
+        return ReadUserSchema.model_validate(user)
+
+    @post("/login", exclude_from_auth=True)
+    async def login(
+        self, data: LoginSchema, auth_service: AuthService, token_service: TokenService
+    ) -> TokenSchema:
+        """Exchange the credentials of a user for an access token."""
+        user = await auth_service.authenticate(data.login, data.password)
+        if user is None:
+            raise NotAuthorizedException("Invalid credentials.")
+        return TokenSchema(access_token=token_service.issue(user), expires_in=token_service.ttl)
+
+    @get("/me")
+    async def me(self, request: Request[TokenClaims, str, State]) -> AuthenticatedUserSchema:
+        """Get the user of the access token, from its claims."""
+        claims = request.user
+        return AuthenticatedUserSchema(id=claims.user_id, username=claims.username)
@@ -0,0 +1,43 @@
+from logging import Logger
+from typing import Annotated
+
+from litestar import Controller, get
+from litestar.params import Parameter
+
+from src.infrastructure.cache.lru import LRUCache
+from src.infrastructure.database.constants import (
+    DEFAULT_SUGGESTIONS,
+    MAX_BASIC_LENGTH,
+    MAX_SUGGESTIONS,
+    MIN_BASIC_LENGTH,
+)
+from src.infrastructure.dependencies.dependencies import autocomplete_dependencies
+from src.infrastructure.repositories.autocomplete import AutocompleteRepository
+from src.interfaces.api.schemas import SuggestionSchema
+
+
+class AutocompleteController(Controller):
+    """Autocomplete controller of the search box."""
+
+    path = "/autocomplete"
+    dependencies = autocomplete_dependencies
+
+    @get()
+    async def autocomplete(
+        self,
+        repo: AutocompleteRepository,
+        cache: LRUCache[tuple[str, int], list[SuggestionSchema]],
+        logger: Logger,
+        q: Annotated[str, Parameter(min_length=MIN_BASIC_LENGTH, max_length=MAX_BASIC_LENGTH)],
+        limit: Annotated[int, Parameter(ge=1, le=MAX_SUGGESTIONS)] = DEFAULT_SUGGESTIONS,
+    ) -> list[SuggestionSchema]:
+        """Suggest events, locations, cities and organizers for a typed text."""
+        key = (" ".join(q.lower().split()), limit)
+        if (suggestions := cache.get(key)) is not None:
+            return suggestions
+
+        logger.debug(f"Autocomplete {q!r}")
+        rows = await repo.suggest(key[0], limit=limit)
+        suggestions = [SuggestionSchema.model_validate(row) for row in rows]
+        cache.set(key, suggestions)
+        return suggestions
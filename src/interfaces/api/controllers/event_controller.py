@@ -1,11 +1,31 @@
 from logging import Logger
+from typing import Annotated
 
-from litestar import Controller, get
+from litestar import Controller, MediaType, Request, Response, get
+from litestar.exceptions import NotFoundException, ValidationException
+from litestar.params import Parameter
 
-from src.infrastructure.dependencies.dependencies import event_dependencies
+from src.infrastructure.cache.events import CachedResponse, EventResponseCache
+from src.infrastructure.database.constants import (
+    DEFAULT_PAGE_SIZE,
+    MAX_BASIC_LENGTH,
+    MAX_PAGE_SIZE,
+    MIN_BASIC_LENGTH,
+)
+from src.infrastructure.dependencies.dependencies import EVENT_CACHE_OPT, event_dependencies
 from src.infrastructure.repositories.event import EventRepository
-from src.interfaces.api.dto import ReadEventDTO
-from src.interfaces.api.schemas import ReadEventSchema
+from src.infrastructure.repositories.filters import EventSearchFilters, EventSortField
+from src.infrastructure.repositories.pagination import InvalidCursorError
+from src.interfaces.api.conditional import (
+    conditional_response,
+    is_conditional,
+    is_not_modified,
+    make_etag,
+    not_modified_response,
+)
+from src.interfaces.api.metrics import encode_json
+from src.interfaces.api.schemas import EventCacheStatsSchema, EventSearchResultSchema
+from src.interfaces.api.structs import to_event_detail, to_event_page
 
 
 class EventController(Controller):
@@ -14,20 +34,119 @@ class EventController(Controller):
     path = "/events"
     dependencies = event_dependencies
 
-    @get(dto=ReadEventDTO)
-    async def get_all_events(self, repo: EventRepository, logger: Logger) -> list[ReadEventSchema]:
-        """Get all events."""
+    @get(opt=EVENT_CACHE_OPT)
+    async def get_all_events(
+        self,
+        request: Request,
+        repo: EventRepository,
+        cache: EventResponseCache,
+        logger: Logger,
+        projection: tuple[str, ...] | None,
+        cursor: str | None = None,
+        limit: Annotated[int, Parameter(ge=1, le=MAX_PAGE_SIZE)] = DEFAULT_PAGE_SIZE,
+    ) -> Response[bytes]:
+        """Get a page of events ordered by start date, as CursorPage[EventStruct].
+
+        fields=card|full|<field>,... selects the fields of the events, only those are
+        queried and encoded. Supports conditional requests, 304 is sent before the
+        page is loaded.
+        """
         logger.info("Get all events")
-        events: list[ReadEventSchema] = await repo.list()
-        return events
+        signature = f"all:limit={limit}:cursor={cursor}:fields={projection}"
+        key = await cache.list_key(signature)
+        if (cached := await cache.get(key)) is None:
+            last_modified, count = await repo.list_version()
+            # Deletes only change the count, lists are validated by their ETag alone.
+            etag = make_etag(signature, last_modified, count)
+            if is_not_modified(request, etag, None):
+                return not_modified_response(etag, None)
+            try:
+                page = await repo.list_page(limit=limit, cursor=cursor, fields=projection)
+            except InvalidCursorError as e:
+                raise ValidationException(str(e)) from e
+            body = encode_json(to_event_page(page, projection))
+            cached = CachedResponse(body=body, etag=etag)
+            await cache.set(key, cached)
+        return conditional_response(request, cached)
+
+    @get("/search")
+    async def search_events(
+        self,
+        repo: EventRepository,
+        logger: Logger,
+        filters: EventSearchFilters,
+        projection: tuple[str, ...] | None,
+        sort: EventSortField = EventSortField.START_DATE,
+        descending: bool = False,
+        cursor: str | None = None,
+        limit: Annotated[int, Parameter(ge=1, le=MAX_PAGE_SIZE)] = DEFAULT_PAGE_SIZE,
+    ) -> Response[bytes]:
+        """Search events by filters, sorted by start date or price, as CursorPage[EventStruct].
+
+        fields=card|full|<field>,... selects the fields of the events, as in the events
+        list: the items then only have these fields.
+        """
+        logger.info(f"Search events with {filters}")
+        try:
+            page = await repo.search(
+                filters,
+                limit=limit,
+                cursor=cursor,
+                sort=sort,
+                descending=descending,
+                fields=projection,
+            )
+        except InvalidCursorError as e:
+            raise ValidationException(str(e)) from e
+        return Response(
+            content=encode_json(to_event_page(page, projection)), media_type=MediaType.JSON
+        )
 
-    @get("/{event_id:int}", dto=ReadEventDTO)
+    @get("/search/text")
+    async def text_search_events(
+        self,
+        repo: EventRepository,
+        logger: Logger,
+        q: Annotated[str, Parameter(min_length=MIN_BASIC_LENGTH, max_length=MAX_BASIC_LENGTH)],
+        limit: Annotated[int, Parameter(ge=1, le=MAX_PAGE_SIZE)] = DEFAULT_PAGE_SIZE,
+    ) -> list[EventSearchResultSchema]:
+        """Full-text search of events, ranked by relevance with highlighted snippets."""
+        logger.info(f"Text search events with {q!r}")
+        rows = await repo.text_search(q, limit=limit)
+        return [EventSearchResultSchema.model_validate(row) for row in rows]
+
+    @get("/cache/stats")
+    async def get_cache_stats(self, cache: EventResponseCache) -> EventCacheStatsSchema:
+        """Get hit and miss counters of the event response cache of this process."""
+        return EventCacheStatsSchema.model_validate(cache.stats)
+
+    @get("/{event_id:int}", opt=EVENT_CACHE_OPT)
     async def get_event_by_pk(
-        self, event_id: int, repo: EventRepository, logger: Logger
-    ) -> ReadEventSchema:
-        """Get event by_pk."""
+        self,
+        request: Request,
+        event_id: int,
+        repo: EventRepository,
+        cache: EventResponseCache,
+        logger: Logger,
+    ) -> Response[bytes]:
+        """Get event by_pk, as EventDetailStruct.
+
+        Supports conditional requests, 304 is sent before the event is loaded.
+        """
         logger.info(f"Getting event with id {event_id}")
-        event: ReadEventSchema = await repo.get_one_or_none(id=event_id)
-        return event
+        key = cache.detail_key(event_id)
+        if (cached := await cache.get(key)) is None:
+            if is_conditional(request) and (updated_at := await repo.get_version(event_id)):
+                etag = make_etag(event_id, updated_at)
+                if is_not_modified(request, etag, updated_at):
+                    return not_modified_response(etag, updated_at)
+            event = await repo.get_detail(event_id)
+            if event is None:
+                raise NotFoundException(f"Event with id {event_id} not found.")
+            body = encode_json(to_event_detail(event))
+            etag = make_etag(event.id, event.updated_at)
+            cached = CachedResponse(body=body, etag=etag, last_modified=event.updated_at)
+            await cache.set(key, cached)
+        return conditional_response(request, cached)
 
-    # register_for_event, search_events
+    # register_for_event
@@ -0,0 +1,17 @@
+from litestar import Controller, Response, get
+
+from src.infrastructure.metrics.registry import PROMETHEUS_CONTENT_TYPE, registry
+
+
+class MetricsController(Controller):
+    """Metrics of the process for Prometheus."""
+
+    path = "/metrics"
+
+    @get(include_in_schema=False, sync_to_thread=False)
+    def get_metrics(self) -> Response[bytes]:
+        """Get the metrics of this process in the Prometheus text format.
+
+        Every worker process serves its own metrics.
+        """
+        return Response(registry.render(), media_type=PROMETHEUS_CONTENT_TYPE)
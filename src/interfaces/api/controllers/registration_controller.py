@@ -0,0 +1,126 @@
+from advanced_alchemy.exceptions import DuplicateKeyError, NotFoundError
+from litestar import Controller, Request, delete, post
+from litestar.datastructures import State
+from litestar.exceptions import ClientException, NotFoundException
+from litestar.status_codes import HTTP_200_OK, HTTP_409_CONFLICT
+
+from src.domain.services.token_service import TokenClaims
+from src.domain.services.waitlist_service import WaitlistPromoter
+from src.infrastructure.database.models.enums import ParticipantStatus
+from src.infrastructure.dependencies.dependencies import registration_dependencies
+from src.infrastructure.repositories.registration import (
+    SEAT_STATUSES,
+    RegistrationClosedError,
+    RegistrationRepository,
+)
+from src.interfaces.api.authentication import jwt_auth_middleware
+from src.interfaces.api.schemas import (
+    BulkRegistrationResultSchema,
+    BulkRegistrationSchema,
+    ReadRegistrationSchema,
+)
+from src.interfaces.api.schemas.events.registration_schema import BulkRegistrationResult
+
+
+class RegistrationController(Controller):
+    """Registrations of the authenticated user for events."""
+
+    path = "/events/{event_id:int}/registrations"
+    dependencies = registration_dependencies
+    middleware = [jwt_auth_middleware]
+
+    @post()
+    async def register(
+        self,
+        event_id: int,
+        request: Request[TokenClaims, str, State],
+        repo: RegistrationRepository,
+    ) -> ReadRegistrationSchema:
+        """Register the profile of the user for the event, on the waitlist when it is full."""
+        profile_id = await repo.get_profile_id(request.user.user_id)
+        if profile_id is None:
+            raise NotFoundException("User has no profile.")
+        try:
+            registration = await repo.register(profile_id, event_id, auto_commit=True)
+        except NotFoundError as e:
+            raise NotFoundException(str(e)) from e
+        except RegistrationClosedError as e:
+            raise ClientException(str(e), status_code=HTTP_409_CONFLICT) from e
+        except DuplicateKeyError as e:
+            raise ClientException(
+                "Already registered for the event.", status_code=HTTP_409_CONFLICT
+            ) from e
+        return ReadRegistrationSchema.model_validate(registration)
+
+    @delete()
+    async def cancel(
+        self,
+        event_id: int,
+        request: Request[TokenClaims, str, State],
+        repo: RegistrationRepository,
+        promoter: WaitlistPromoter,
+    ) -> None:
+        """Cancel the registration of the user for the event, its seat goes to the waitlist."""
+        profile_id = await repo.get_profile_id(request.user.user_id)
+        if profile_id is None:
+            raise NotFoundException("User has no profile.")
+        try:
+            status = await repo.cancel(profile_id, event_id, auto_commit=True)
+        except NotFoundError as e:
+            raise NotFoundException(str(e)) from e
+        if status in SEAT_STATUSES:
+            promoter.notify()
+
+
+class BulkRegistrationController(Controller):
+    """Registrations and check-in in bulk, by the organizers of the events."""
+
+    path = "/registrations"
+    dependencies = registration_dependencies
+    middleware = [jwt_auth_middleware]
+
+    @post("/bulk", status_code=HTTP_200_OK)
+    async def bulk_register(
+        self,
+        data: BulkRegistrationSchema,
+        request: Request[TokenClaims, str, State],
+        repo: RegistrationRepository,
+    ) -> list[BulkRegistrationResultSchema]:
+        """Register profiles or mark them attended or no-show, in one round-trip.
+
+        Items are applied in order, the last one wins for a repeated profile and
+        event. Results come in the order of the items.
+        """
+        # One row per registration, ON CONFLICT DO UPDATE cannot update a row twice.
+        statuses = {
+            (item.profile_id, item.event_id): ParticipantStatus(item.status) for item in data.items
+        }
+        rows = await repo.bulk_upsert(
+            [(profile_id, event_id, status) for (profile_id, event_id), status in statuses.items()],
+            organizer_user_id=request.user.user_id,
+            auto_commit=True,
+        )
+        applied = {(row.profile_id, row.event_id): row for row in rows}
+
+        results = []
+        for item in data.items:
+            row = applied.get((item.profile_id, item.event_id))
+            result: BulkRegistrationResult
+            if row is None:
+                result = "rejected"
+            elif row.created:
+                result = "created"
+            elif row.previous_status == row.status:
+                result = "unchanged"
+            else:
+                result = "updated"
+            results.append(
+                BulkRegistrationResultSchema(
+                    profile_id=item.profile_id,
+                    event_id=item.event_id,
+                    status=item.status if row is None else row.status,
+                    result=result,
+                    previous_status=None if row is None else row.previous_status,
+                )
+            )
+        return results
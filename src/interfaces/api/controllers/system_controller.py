@@ -0,0 +1,51 @@
+from litestar import Controller, get
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import QueuePool
+
+from src.domain.services.password_service import PasswordHasher
+from src.infrastructure.database.pool import pool_metrics
+from src.infrastructure.dependencies.dependencies import system_dependencies
+from src.interfaces.api.schemas import PasswordHashStatsSchema, PoolStatsSchema
+
+
+class SystemController(Controller):
+    """Operational state of the service."""
+
+    path = "/system"
+    dependencies = system_dependencies
+
+    @get("/pool")
+    async def get_pool_stats(self, db_engine: AsyncEngine) -> PoolStatsSchema:
+        """Get state and checkout metrics of the database connection pool of this process."""
+        pool = db_engine.pool
+        stats = PoolStatsSchema(size=0, checked_out=0, overflow=0)
+        if isinstance(pool, QueuePool):
+            stats = PoolStatsSchema(
+                size=pool.size(), checked_out=pool.checkedout(), overflow=max(pool.overflow(), 0)
+            )
+        if (metrics := pool_metrics(pool)) is not None:
+            stats.checkouts = metrics.checkouts
+            stats.timeouts = metrics.timeouts
+            stats.wait_seconds_avg = metrics.wait_seconds_avg
+            stats.wait_seconds_max = metrics.wait_seconds_max
+        return stats
+
+    @get("/passwords")
+    async def get_password_hash_stats(
+        self, password_hasher: PasswordHasher
+    ) -> PasswordHashStatsSchema:
+        """Get counters and queue depth of the password hasher of this process."""
+        stats = password_hasher.stats
+        return PasswordHashStatsSchema(
+            rounds=password_hasher.rounds,
+            workers=password_hasher.workers,
+            max_queue=password_hasher.max_queue,
+            hashes=stats.hashes,
+            verifications=stats.verifications,
+            rehashes=stats.rehashes,
+            rejected=stats.rejected,
+            in_flight=stats.in_flight,
+            waiting=stats.waiting,
+            max_waiting=stats.max_waiting,
+            seconds_avg=stats.seconds_avg,
+        )
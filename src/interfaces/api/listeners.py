@@ -0,0 +1,20 @@
+from logging import getLogger
+
+from litestar.events import listener
+
+from src.domain.services.waitlist_service import REGISTRATION_PROMOTED
+
+logger = getLogger("src.events")
+
+
+@listener(REGISTRATION_PROMOTED)
+async def notify_registration_promoted(
+    registration_id: int, profile_id: int, event_id: int
+) -> None:
+    """Notify a participant that a seat freed up and the registration left the waitlist."""
+    logger.info(
+        "Registration %d of profile %d for event %d promoted from the waitlist",
+        registration_id,
+        profile_id,
+        event_id,
+    )
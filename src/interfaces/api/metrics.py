@@ -0,0 +1,244 @@
+import time
+from collections.abc import Iterable
+from contextvars import ContextVar
+from typing import Any, cast
+
+import msgspec
+from litestar import Response
+from litestar.enums import ScopeType
+from litestar.middleware import AbstractMiddleware
+from litestar.serialization import default_serializer
+from litestar.types import HTTPScope, Message, Receive, Scope, Send, Serializer
+from sqlalchemy.pool import Pool, QueuePool
+
+from src.infrastructure.database.config import get_engine, get_replica_router
+from src.infrastructure.database.pool import pool_metrics
+from src.infrastructure.dependencies.dependencies import (
+    autocomplete_cache,
+    deny_list,
+    event_cache,
+    password_hasher,
+    token_service,
+    waitlist_promoter,
+)
+from src.infrastructure.metrics.registry import SIZE_BUCKETS, Labels, registry
+
+HANDLER_LABELS: Labels = ("handler", "method", "status")
+
+http_requests_in_flight = registry.gauge(
+    "http_requests_in_flight", "Requests being handled by this process."
+)
+http_request_duration = registry.histogram(
+    "http_request_duration_seconds",
+    "Time from the request to the end of the response body, by route handler.",
+    HANDLER_LABELS,
+)
+http_response_size = registry.histogram(
+    "http_response_size_bytes",
+    "Size of the response bodies, by route handler.",
+    HANDLER_LABELS,
+    buckets=SIZE_BUCKETS,
+)
+serialization_duration = registry.histogram(
+    "http_serialization_duration_seconds",
+    "Time spent encoding the data returned by route handlers.",
+    ("handler",),
+)
+
+# Route handler of the current request, label of the serialization time.
+current_handler: ContextVar[str] = ContextVar("current_handler", default="")
+
+
+class MetricsMiddleware(AbstractMiddleware):
+    """Records the latency, response size and concurrency of requests per route handler.
+
+    Requests matching no route handler never reach the middleware.
+    """
+
+    scopes = {ScopeType.HTTP}
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Run the request, observing it once its body is sent."""
+        handler = scope["route_handler"].handler_name
+        token = current_handler.set(handler)
+        started = time.perf_counter()
+        status = "500"
+        size = 0
+
+        async def send_with_metrics(message: Message) -> None:
+            nonlocal status, size
+            if message["type"] == "http.response.start":
+                status = str(message["status"])
+            elif message["type"] == "http.response.body":
+                size += len(message.get("body", b""))
+            await send(message)
+
+        http_requests_in_flight.inc()
+        try:
+            await self.app(scope, receive, send_with_metrics)
+        finally:
+            http_requests_in_flight.dec()
+            current_handler.reset(token)
+            labels = (handler, cast("HTTPScope", scope)["method"], status)
+            http_request_duration.observe(time.perf_counter() - started, labels)
+            http_response_size.observe(size, labels)
+
+
+class TimedResponse(Response[Any]):
+    """Response timing the encoding of its content, for the serialization metrics."""
+
+    def render(
+        self,
+        content: Any,  # noqa: ANN401
+        media_type: str,
+        enc_hook: Serializer = default_serializer,
+    ) -> bytes:
+        """Encode the content, see Response.render."""
+        started = time.perf_counter()
+        try:
+            return super().render(content, media_type, enc_hook)
+        finally:
+            serialization_duration.observe(time.perf_counter() - started, (current_handler.get(),))
+
+
+def encode_json(value: Any) -> bytes:  # noqa: ANN401
+    """Encode a value to JSON with msgspec, timed for the serialization metrics.
+
+    For handlers encoding their body themselves, e.g. to cache it, which bypass
+    the response class.
+    """
+    started = time.perf_counter()
+    try:
+        return msgspec.json.encode(value)
+    finally:
+        serialization_duration.observe(time.perf_counter() - started, (current_handler.get(),))
+
+
+def _pools() -> Iterable[tuple[str, Pool]]:
+    """Yield the pools of the primary and of the read replicas, by name."""
+    yield "primary", get_engine().pool
+    for replica in get_replica_router().replicas:
+        yield replica.name, replica.engine.pool
+
+
+def _pool_gauges() -> Iterable[tuple[Labels, float]]:
+    """Yield the connections of every pool by state."""
+    for name, pool in _pools():
+        if isinstance(pool, QueuePool):
+            yield (name, "size"), pool.size()
+            yield (name, "checked_out"), pool.checkedout()
+            yield (name, "overflow"), max(pool.overflow(), 0)
+
+
+def _pool_metric(attribute: str) -> Iterable[tuple[Labels, float]]:
+    """Yield a checkout metric of every instrumented pool."""
+    for name, pool in _pools():
+        if (metrics := pool_metrics(pool)) is not None:
+            yield (name,), getattr(metrics, attribute)
+
+
+registry.callback(
+    "db_pool_connections",
+    "Connections of the pool by state: pool size, checked out, overflow beyond the size.",
+    "gauge",
+    _pool_gauges,
+    ("pool", "state"),
+)
+registry.callback(
+    "db_pool_checkouts_total",
+    "Connections handed out by the pool.",
+    "counter",
+    lambda: _pool_metric("checkouts"),
+    ("pool",),
+)
+registry.callback(
+    "db_pool_checkout_timeouts_total",
+    "Checkouts that gave up after the pool timeout.",
+    "counter",
+    lambda: _pool_metric("timeouts"),
+    ("pool",),
+)
+registry.callback(
+    "db_pool_wait_seconds_total",
+    "Time spent waiting for a connection, divide by the checkouts for the average wait.",
+    "counter",
+    lambda: _pool_metric("wait_seconds_total"),
+    ("pool",),
+)
+registry.callback(
+    "db_pool_wait_seconds_max",
+    "Longest wait for a connection since the start of the process.",
+    "gauge",
+    lambda: _pool_metric("wait_seconds_max"),
+    ("pool",),
+)
+
+registry.callback(
+    "cache_hits_total",
+    "Lookups served from the cache.",
+    "counter",
+    lambda: [(("events",), event_cache.stats.hits), (("tokens",), token_service.stats.hits)],
+    ("cache",),
+)
+registry.callback(
+    "cache_misses_total",
+    "Lookups that fell through to the database or the signature check.",
+    "counter",
+    lambda: [(("events",), event_cache.stats.misses), (("tokens",), token_service.stats.misses)],
+    ("cache",),
+)
+registry.callback(
+    "cache_invalidations_total",
+    "Writes that invalidated cached event responses.",
+    "counter",
+    lambda: [(("events",), event_cache.stats.invalidations)],
+    ("cache",),
+)
+registry.callback(
+    "cache_entries",
+    "Entries held by the in-process caches.",
+    "gauge",
+    lambda: [(("autocomplete",), len(autocomplete_cache))],
+    ("cache",),
+)
+
+registry.callback(
+    "password_hash_operations_total",
+    "Passwords hashed, checked and rehashed, and requests rejected by the full queue.",
+    "counter",
+    lambda: [
+        (("hash",), password_hasher.stats.hashes),
+        (("verify",), password_hasher.stats.verifications),
+        (("rehash",), password_hasher.stats.rehashes),
+        (("rejected",), password_hasher.stats.rejected),
+    ],
+    ("operation",),
+)
+registry.callback(
+    "password_hash_queue",
+    "Password hashing requests being computed and waiting for a worker.",
+    "gauge",
+    lambda: [
+        (("in_flight",), password_hasher.stats.in_flight),
+        (("waiting",), password_hasher.stats.waiting),
+    ],
+    ("state",),
+)
+registry.callback(
+    "password_hash_seconds_total",
+    "Time spent by the password hashing workers.",
+    "counter",
+    lambda: [((), password_hasher.stats.seconds_total)],
+)
+registry.callback(
+    "auth_denied_users",
+    "Inactive users on the deny-list of this process.",
+    "gauge",
+    lambda: [((), len(deny_list))],
+)
+registry.callback(
+    "waitlist_promoted_total",
+    "Waitlisted registrations promoted by this process.",
+    "counter",
+    lambda: [((), waitlist_promoter.promoted)],
+)
@@ -0,0 +1,105 @@
+import asyncio
+import time
+from logging import getLogger
+from typing import cast
+
+from litestar.datastructures import MutableScopeHeaders
+from litestar.enums import ScopeType
+from litestar.middleware import AbstractMiddleware
+from litestar.types import HTTPScope, Message, Receive, Scope, Send
+
+from src.infrastructure.database.profiling import QueryStats, explain, query_stats
+from src.infrastructure.database.settings import settings
+
+logger = getLogger("src.queries")
+
+# Running EXPLAIN tasks, referenced until they finish.
+_explain_tasks: set[asyncio.Task[None]] = set()
+
+
+def server_timing(stats: QueryStats, total_seconds: float) -> str:
+    """Format the Server-Timing header of a request, durations in milliseconds."""
+    return (
+        f'db;dur={stats.seconds_total * 1000:.2f};desc="{stats.count} queries", '
+        f"db-slowest;dur={stats.slowest_seconds * 1000:.2f}, "
+        f"total;dur={total_seconds * 1000:.2f}"
+    )
+
+
+async def log_slow_query(stats: QueryStats, method: str, path: str) -> None:
+    """Log the slowest statement of a request with its plan, when it has one.
+
+    Parameters are used for the plan but not logged, they may hold personal data.
+    """
+    plan = None
+    if settings.DB_EXPLAIN_SLOW_QUERIES and stats.slowest_engine is not None:
+        try:
+            plan = await explain(
+                stats.slowest_engine, stats.slowest_statement or "", stats.slowest_parameters
+            )
+        except Exception:  # noqa: BLE001
+            logger.debug("Could not explain the slow query of %s %s", method, path, exc_info=True)
+    logger.warning(
+        "Slow query of %s %s took %.1fms:\n%s%s",
+        method,
+        path,
+        stats.slowest_seconds * 1000,
+        stats.slowest_statement,
+        f"\n{plan}" if plan else "",
+        extra={
+            "http_method": method,
+            "http_path": path,
+            "db_slowest_ms": round(stats.slowest_seconds * 1000, 2),
+            "db_plan": plan,
+        },
+    )
+
+
+class QueryTimingMiddleware(AbstractMiddleware):
+    """Counts and times the SQL statements of every request.
+
+    The number of statements, their total time and the slowest one are sent in
+    the Server-Timing header and logged at info level as fields of the request,
+    every statement is logged at debug level. The slowest
+    statement of a request taking DB_SLOW_QUERY_SECONDS or more is logged with
+    its EXPLAIN plan, computed after the response on a separate connection.
+    """
+
+    scopes = {ScopeType.HTTP}
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Run the request with its own query stats."""
+        stats = QueryStats()
+        token = query_stats.set(stats)
+        started = time.perf_counter()
+
+        async def send_with_timing(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableScopeHeaders.from_message(message).add(
+                    "server-timing", server_timing(stats, time.perf_counter() - started)
+                )
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            query_stats.reset(token)
+            method, path = cast("HTTPScope", scope)["method"], scope["path"]
+            logger.info(
+                "%s %s ran %d queries in %.1fms",
+                method,
+                path,
+                stats.count,
+                stats.seconds_total * 1000,
+                extra={
+                    "http_method": method,
+                    "http_path": path,
+                    "db_queries": stats.count,
+                    "db_ms": round(stats.seconds_total * 1000, 2),
+                    "db_slowest_ms": round(stats.slowest_seconds * 1000, 2),
+                },
+            )
+            if stats.count and stats.slowest_seconds >= settings.DB_SLOW_QUERY_SECONDS:
+                task = asyncio.create_task(log_slow_query(stats, method, path))
+                _explain_tasks.add(task)
+                task.add_done_callback(_explain_tasks.discard)
@@ -1,5 +1,26 @@
 from litestar import Router
+from litestar.di import Provide
 
+from src.infrastructure.dependencies.dependencies import provide_db_session
+from src.interfaces.api.controllers.auth_controller import AuthController
+from src.interfaces.api.controllers.autocomplete_controller import AutocompleteController
 from src.interfaces.api.controllers.event_controller import EventController
+from src.interfaces.api.controllers.registration_controller import (
+    BulkRegistrationController,
+    RegistrationController,
+)
+from src.interfaces.api.controllers.system_controller import SystemController
 
-event_router = Router(path="/api/v1", route_handlers=[EventController])
+# Overrides the session of the SQLAlchemy plugin to route reads to the replicas.
+event_router = Router(
+    path="/api/v1",
+    route_handlers=[
+        EventController,
+        AutocompleteController,
+        SystemController,
+        AuthController,
+        RegistrationController,
+        BulkRegistrationController,
+    ],
+    dependencies={"db_session": Provide(provide_db_session)},
+)
@@ -5,7 +5,10 @@ from src.interfaces.api.schemas.events.category_schema import (
 )
 from src.interfaces.api.schemas.events.event_schema import (
     CreateEventSchema,
+    EventCacheStatsSchema,
     EventSchema,
+    EventSearchResultSchema,
+    ReadEventDetailSchema,
     ReadEventSchema,
     UpdateEventSchema,
 )
@@ -13,7 +16,22 @@ from src.interfaces.api.schemas.events.location_schema import (
     LocationSchema,
     ReadLocationSchema,
 )
+from src.interfaces.api.schemas.events.registration_schema import (
+    BulkRegistrationItemSchema,
+    BulkRegistrationResultSchema,
+    BulkRegistrationSchema,
+    ReadRegistrationSchema,
+)
+from src.interfaces.api.schemas.search.suggestion_schema import SuggestionSchema
+from src.interfaces.api.schemas.system.password_schema import PasswordHashStatsSchema
+from src.interfaces.api.schemas.system.pool_schema import PoolStatsSchema
+from src.interfaces.api.schemas.users.auth_schema import (
+    AuthenticatedUserSchema,
+    LoginSchema,
+    TokenSchema,
+)
 from src.interfaces.api.schemas.users.organizer_schema import (
+    EventOrganizerSchema,
     OrganizerSchema,
     ReadOrganizerSchema,
 )
@@ -28,20 +46,34 @@ from src.interfaces.api.schemas.users.users_schema import (
 )
 
 __all__ = [
+    "BulkRegistrationItemSchema",
+    "BulkRegistrationResultSchema",
+    "BulkRegistrationSchema",
+    "AuthenticatedUserSchema",
     "CreateCategorySchema",
     "ReadCategorySchema",
     "CategorySchema",
     "EventSchema",
+    "EventCacheStatsSchema",
+    "EventSearchResultSchema",
     "CreateEventSchema",
     "UpdateEventSchema",
     "ReadEventSchema",
+    "ReadEventDetailSchema",
     "LocationSchema",
+    "LoginSchema",
     "ReadLocationSchema",
     "OrganizerSchema",
+    "EventOrganizerSchema",
     "ReadOrganizerSchema",
+    "PasswordHashStatsSchema",
+    "PoolStatsSchema",
     "ProfileSchema",
     "CreateUserSchema",
     "ReadProfileSchema",
+    "ReadRegistrationSchema",
     "ReadUserSchema",
+    "SuggestionSchema",
+    "TokenSchema",
     "UpdateUserSchema",
 ]
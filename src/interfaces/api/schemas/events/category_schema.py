@@ -43,7 +43,8 @@ class CreateCategorySchema(CategorySchema):
     """
 
     @field_validator("slug")
-    def validate_slug(self, value: str) -> str:
+    @classmethod
+    def validate_slug(cls, value: str) -> str:
         """Validate and transform slug to lowercase.
 
         Args:
@@ -6,6 +6,9 @@ from pydantic import HttpUrl, ValidationInfo, field_validator
 from src.infrastructure.database.models.enums import Currency, EventFormat, EventStatus
 from src.interfaces.api.schemas.base_dto import BasePydanticModel
 from src.interfaces.api.schemas.custom_types import BasicString, DescriptionField
+from src.interfaces.api.schemas.events.category_schema import ReadCategorySchema
+from src.interfaces.api.schemas.events.location_schema import ReadLocationSchema
+from src.interfaces.api.schemas.users.organizer_schema import EventOrganizerSchema
 
 
 class EventSchema(BasePydanticModel):
@@ -44,7 +47,8 @@ class EventSchema(BasePydanticModel):
     currency: Currency = Currency.USD
 
     @field_validator("event_end_date")
-    def validate_end_date(self, end_date: datetime, info: ValidationInfo) -> datetime:
+    @classmethod
+    def validate_end_date(cls, end_date: datetime, info: ValidationInfo) -> datetime:
         """Validate that event end date is after start date.
 
         Args:
@@ -65,7 +69,8 @@ class EventSchema(BasePydanticModel):
         return end_date
 
     @field_validator("registration_deadline")
-    def deadline_before_start(self, deadline: datetime, info: ValidationInfo) -> datetime:
+    @classmethod
+    def deadline_before_start(cls, deadline: datetime, info: ValidationInfo) -> datetime:
         """Validate that registration deadline is before event start.
 
         Args:
@@ -86,7 +91,8 @@ class EventSchema(BasePydanticModel):
         return deadline
 
     @field_validator("current_participants")
-    def validate_number_of_participants(self, current: int, info: ValidationInfo) -> int:
+    @classmethod
+    def validate_number_of_participants(cls, current: int, info: ValidationInfo) -> int:
         """Validate that current participants don't exceed maximum.
 
         Args:
@@ -107,9 +113,8 @@ class EventSchema(BasePydanticModel):
         return current
 
     @field_validator("price")
-    def validate_price_currency(
-        self, price: Decimal | None, info: ValidationInfo
-    ) -> Decimal | None:
+    @classmethod
+    def validate_price_currency(cls, price: Decimal | None, info: ValidationInfo) -> Decimal | None:
         """Validate price and currency relationship.
 
         Args:
@@ -146,6 +151,12 @@ class ReadEventSchema(EventSchema):
     category_id: int
     organizer_id: int
 
+    # Registrations by status
+    registered_count: int = 0
+    confirmed_count: int = 0
+    waitlisted_count: int = 0
+    attended_count: int = 0
+
     # Status flags
     is_published: bool
     is_online: bool
@@ -153,6 +164,39 @@ class ReadEventSchema(EventSchema):
 
     # Publication information
     pub_date: datetime
+    updated_at: datetime
+
+    # Relationships
+    organizers: list[EventOrganizerSchema] = []
+
+
+class ReadEventDetailSchema(ReadEventSchema):
+    """Schema for reading a single event with its location and category."""
+
+    location: ReadLocationSchema | None = None
+    category: ReadCategorySchema
+
+
+class EventSearchResultSchema(BasePydanticModel):
+    """Schema for a full-text search hit.
+
+    Snippet is a fragment of the description with matches wrapped in <mark> tags.
+    """
+
+    id: int
+    name: str
+    event_start_date: datetime
+    rank: float
+    snippet: str
+
+
+class EventCacheStatsSchema(BasePydanticModel):
+    """Schema for hit and miss counters of the event response cache."""
+
+    hits: int
+    misses: int
+    invalidations: int
+    hit_ratio: float
 
 
 class CreateEventSchema(EventSchema):
@@ -0,0 +1,66 @@
+from datetime import datetime
+from typing import Literal
+
+from pydantic import Field, field_validator
+
+from src.infrastructure.database.constants import MAX_BULK_REGISTRATIONS
+from src.infrastructure.database.models.enums import ParticipantStatus
+from src.infrastructure.repositories.registration import BULK_STATUSES
+from src.interfaces.api.schemas.base_dto import BasePydanticModel
+
+BulkRegistrationResult = Literal["created", "updated", "unchanged", "rejected"]
+
+
+class ReadRegistrationSchema(BasePydanticModel):
+    """Schema for reading the registration of a profile for an event."""
+
+    id: int
+    profile_id: int
+    event_id: int
+    status: ParticipantStatus
+    created_at: datetime
+
+
+class BulkRegistrationItemSchema(BasePydanticModel):
+    """Schema for one registration of a bulk registration or check-in."""
+
+    profile_id: int
+    event_id: int
+    status: ParticipantStatus
+
+    @field_validator("status")
+    @classmethod
+    def validate_status(cls, value: ParticipantStatus) -> ParticipantStatus:
+        """Validate that organizers may set the status in bulk.
+
+        Args:
+            value: status
+        Returns:
+            status if validated
+
+        """
+        if value not in BULK_STATUSES:
+            allowed = ", ".join(status.value for status in BULK_STATUSES)
+            raise ValueError(f"Status must be one of {allowed}.")
+        return value
+
+
+class BulkRegistrationSchema(BasePydanticModel):
+    """Schema for a bulk registration or check-in, applied in one statement."""
+
+    items: list[BulkRegistrationItemSchema] = Field(min_length=1, max_length=MAX_BULK_REGISTRATIONS)
+
+
+class BulkRegistrationResultSchema(BasePydanticModel):
+    """Schema for the result of one item of a bulk registration or check-in.
+
+    Items of events the user does not organize, or of unknown profiles and
+    events, are rejected. Items that did not get a seat have the WAITLISTED
+    status instead of the requested one.
+    """
+
+    profile_id: int
+    event_id: int
+    status: ParticipantStatus
+    result: BulkRegistrationResult
+    previous_status: ParticipantStatus | None = None
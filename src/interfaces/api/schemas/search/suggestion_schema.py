@@ -0,0 +1,14 @@
+from src.infrastructure.database.models.enums import SuggestionKind
+from src.interfaces.api.schemas.base_dto import BasePydanticModel
+
+
+class SuggestionSchema(BasePydanticModel):
+    """Schema for an autocomplete suggestion.
+
+    Id is None for suggestions not bound to a single row, like cities.
+    """
+
+    kind: SuggestionKind
+    id: int | None
+    label: str
+    score: float
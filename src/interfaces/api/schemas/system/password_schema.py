@@ -0,0 +1,17 @@
+from src.interfaces.api.schemas.base_dto import BasePydanticModel
+
+
+class PasswordHashStatsSchema(BasePydanticModel):
+    """Schema for the counters and queue depth of the password hasher."""
+
+    rounds: int
+    workers: int
+    max_queue: int
+    hashes: int
+    verifications: int
+    rehashes: int
+    rejected: int
+    in_flight: int
+    waiting: int
+    max_waiting: int
+    seconds_avg: float
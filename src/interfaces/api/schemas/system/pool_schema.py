@@ -0,0 +1,16 @@
+from src.interfaces.api.schemas.base_dto import BasePydanticModel
+
+
+class PoolStatsSchema(BasePydanticModel):
+    """Schema for the state and checkout metrics of the database connection pool.
+
+    Checkout metrics are None when the pool is not instrumented.
+    """
+
+    size: int
+    checked_out: int
+    overflow: int
+    checkouts: int | None = None
+    timeouts: int | None = None
+    wait_seconds_avg: float | None = None
+    wait_seconds_max: float | None = None
@@ -0,0 +1,24 @@
+from src.interfaces.api.schemas.base_dto import BasePydanticModel
+from src.interfaces.api.schemas.custom_types import BasicString, PasswordString
+
+
+class LoginSchema(BasePydanticModel):
+    """Schema for the credentials of a login."""
+
+    login: BasicString
+    password: PasswordString
+
+
+class TokenSchema(BasePydanticModel):
+    """Schema for an issued access token."""
+
+    access_token: str
+    token_type: str = "bearer"  # noqa: S105
+    expires_in: int
+
+
+class AuthenticatedUserSchema(BasePydanticModel):
+    """Schema for the user of an access token."""
+
+    id: int
+    username: str
@@ -25,6 +25,14 @@ class OrganizerSchema(BasePydanticModel):
     logo_url: AnyUrl | None = None
 
 
+class EventOrganizerSchema(BasePydanticModel):
+    """Schema for an organizer nested into event data."""
+
+    id: int
+    name: BasicString
+    logo_url: AnyUrl | None = None
+
+
 class ReadOrganizerSchema(OrganizerSchema):
     """Schema for reading organizer data."""
 
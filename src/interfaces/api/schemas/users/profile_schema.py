@@ -33,7 +33,8 @@ class ProfileSchema(BasePydanticModel):
     gender: BasicString | None
 
     @field_validator("birth_date")
-    def validate_birth_date(self, value: date) -> date:
+    @classmethod
+    def validate_birth_date(cls, value: date) -> date:
         """Validate that password and password_confirm match.
 
         Args:
@@ -44,7 +44,8 @@ class CreateUserSchema(UserSchema):
     password_confirm: PasswordString
 
     @field_validator("password_confirm")
-    def passwords_match(self, value: str, info: ValidationInfo) -> str:
+    @classmethod
+    def passwords_match(cls, value: str, info: ValidationInfo) -> str:
         """Validate that password and password_confirm match.
 
         Args:
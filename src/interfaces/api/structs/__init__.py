@@ -0,0 +1,19 @@
+from src.interfaces.api.structs.events.event_struct import (
+    EventCategoryStruct,
+    EventDetailStruct,
+    EventLocationStruct,
+    EventOrganizerStruct,
+    EventStruct,
+    to_event_detail,
+    to_event_page,
+)
+
+__all__ = [
+    "EventCategoryStruct",
+    "EventDetailStruct",
+    "EventLocationStruct",
+    "EventOrganizerStruct",
+    "EventStruct",
+    "to_event_detail",
+    "to_event_page",
+]
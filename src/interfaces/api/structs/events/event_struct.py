@@ -0,0 +1,135 @@
+from datetime import datetime
+from decimal import Decimal
+from functools import lru_cache
+from typing import Any, Final
+
+import msgspec
+from sqlalchemy import Row
+
+from src.infrastructure.database.models import Event
+from src.infrastructure.database.models.enums import Currency, EventFormat, EventStatus
+from src.infrastructure.repositories.pagination import CursorPage
+
+
+class EventOrganizerStruct(msgspec.Struct):
+    """Read model of an organizer nested in an event."""
+
+    id: int
+    name: str
+    logo_url: str | None
+
+
+class EventLocationStruct(msgspec.Struct):
+    """Read model of the location of an event."""
+
+    name: str
+    address: str
+    city: str
+    country: str
+    id: int
+    created_at: datetime
+
+
+class EventCategoryStruct(msgspec.Struct):
+    """Read model of the category of an event."""
+
+    name: str
+    slug: str
+    description: str
+    id: int
+    created_at: datetime
+
+
+class EventStruct(msgspec.Struct):
+    """Read model of an event, same shape as ReadEventSchema.
+
+    Built straight from ORM rows without validation, database output is trusted.
+    """
+
+    name: str
+    description: str
+    event_start_date: datetime
+    event_end_date: datetime
+    registration_deadline: datetime | None
+    timezone: str
+    format: EventFormat
+    status: EventStatus
+    meeting_link: str | None
+    max_participants: int | None
+    current_participants: int | None
+    registered_count: int
+    confirmed_count: int
+    waitlisted_count: int
+    attended_count: int
+    price: Decimal | None
+    currency: Currency
+    id: int
+    location_id: int | None
+    category_id: int
+    organizer_id: int
+    is_published: bool
+    is_online: bool
+    is_verify: bool
+    pub_date: datetime
+    updated_at: datetime
+    organizers: list[EventOrganizerStruct]
+
+
+class EventDetailStruct(EventStruct):
+    """Read model of an event with location and category, same shape as ReadEventDetailSchema."""
+
+    location: EventLocationStruct | None
+    category: EventCategoryStruct
+
+
+# Types of the sparse fieldsets fields, location fields are joined by the repository.
+EVENT_FIELD_TYPES: Final[dict[str, Any]] = {
+    field.name: field.type
+    for field in msgspec.structs.fields(EventStruct)
+    if field.name != "organizers"
+} | {"city": str | None, "country": str | None}
+
+
+@lru_cache(maxsize=256)
+def event_fields_struct(fields: tuple[str, ...]) -> type[msgspec.Struct]:
+    """Build the read model of a sparse fieldset, so only its fields are encoded.
+
+    Args:
+        fields: Keys of EVENT_FIELD_TYPES
+    Returns:
+        Struct type with the fields, in the given order
+
+    """
+    return msgspec.defstruct(
+        "EventFieldsStruct", [(field, EVENT_FIELD_TYPES[field]) for field in fields]
+    )
+
+
+def to_event_page(
+    page: CursorPage[Event] | CursorPage[Row[Any]], fields: tuple[str, ...] | None = None
+) -> CursorPage[Any]:
+    """Convert a page of ORM events, or of rows of a sparse fieldset, to read models.
+
+    Args:
+        page: Page of events with the LIST profile relationships loaded, or rows of the fields
+        fields: Fields of the rows, None for full events
+
+    Returns:
+        Page of EventStruct, or of the fieldset read model
+
+    """
+    item_type = EventStruct if fields is None else event_fields_struct(fields)
+    items = msgspec.convert(page.items, list[item_type], from_attributes=True)  # type: ignore[valid-type]
+    return CursorPage(items=items, limit=page.limit, next_cursor=page.next_cursor)
+
+
+def to_event_detail(event: Event) -> EventDetailStruct:
+    """Convert an ORM event to the detail read model.
+
+    Args:
+        event: Event with the DETAIL profile relationships loaded
+    Returns:
+        EventDetailStruct
+
+    """
+    return msgspec.convert(event, EventDetailStruct, from_attributes=True)
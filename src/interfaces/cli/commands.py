@@ -1,10 +1,38 @@
 import asyncio
+import json
+from datetime import datetime
+from pathlib import Path
 
 import click
 from click import Group
 from litestar.plugins import CLIPluginProtocol
 
+from src.infrastructure.database.reconcile import RECONCILE_BATCH_SIZE
+from src.infrastructure.database.reconcile import run as run_reconcile
+from src.infrastructure.database.seeders.base_seeder import SeedOptions
+from src.infrastructure.database.seeders.constants import BATCH_SIZE, SEED_NOW, SEED_PASSWORD
 from src.infrastructure.database.seeders.run_seeder import run
+from src.interfaces.cli import load_generator
+from src.interfaces.cli.load_generator import DEFAULT_MIX, WORKLOADS, StageResult
+
+
+def parse_mix(ctx: click.Context, param: click.Parameter, value: str | None) -> dict[str, float]:
+    """Parse workload weights like browse=40,search=25 into the weights of all workloads."""
+    if not value:
+        return dict(DEFAULT_MIX)
+    mix = dict.fromkeys(WORKLOADS, 0.0)
+    for item in value.split(","):
+        workload, _, weight = item.partition("=")
+        workload = workload.strip()
+        if workload not in mix:
+            raise click.BadParameter(f"Unknown workload {workload!r}, expected one of {WORKLOADS}.")
+        try:
+            mix[workload] = float(weight)
+        except ValueError as e:
+            raise click.BadParameter(f"Weight of {workload} is not a number: {weight!r}.") from e
+    if sum(mix.values()) <= 0:
+        raise click.BadParameter("At least one workload needs a positive weight.")
+    return mix
 
 
 class CLIPlugin(CLIPluginProtocol):
@@ -14,6 +42,213 @@ class CLIPlugin(CLIPluginProtocol):
         """Run seeders in async mode."""
 
         @cli.command()
-        def run_seeders() -> None:
-            asyncio.run(run())
+        @click.option(
+            "--scale",
+            type=click.FloatRange(min=0, min_open=True),
+            default=1.0,
+            show_default=True,
+            help="Scale factor of the data, 1 is 1k users and 10k events, 100 is 1M events.",
+        )
+        @click.option(
+            "--batch-size",
+            type=click.IntRange(min=1),
+            default=BATCH_SIZE,
+            show_default=True,
+            help="Rows generated and loaded at once.",
+        )
+        @click.option(
+            "--workers",
+            type=click.IntRange(min=1),
+            default=1,
+            show_default=True,
+            help="Processes generating the rows, 1 generates them in the loading process.",
+        )
+        @click.option(
+            "--seed",
+            type=int,
+            default=None,
+            help="Seed of the data, the same seed and batch size give the same rows.",
+        )
+        @click.option(
+            "--now",
+            type=click.DateTime(),
+            default=None,
+            help="Reference time of the generated dates in UTC, defaults to "
+            f"{SEED_NOW:%Y-%m-%d} with --seed, else to the current time.",
+        )
+        def run_seeders(
+            scale: float, batch_size: int, workers: int, seed: int | None, now: datetime | None
+        ) -> None:
+            options = SeedOptions(scale=scale, batch_size=batch_size, seed=seed, now=now)
+            results = asyncio.run(run(options, workers=workers))
+            for result in results:
+                click.echo(
+                    f"{result.table}: {result.rows} rows in {result.elapsed:.2f}s "
+                    f"({result.rows_per_second:,.0f} rows/s)"
+                )
             click.echo("Seeders executed successfully!")
+
+        @cli.command()
+        @click.option(
+            "--batch-size",
+            type=click.IntRange(min=1),
+            default=RECONCILE_BATCH_SIZE,
+            show_default=True,
+            help="Events locked and counted per transaction.",
+        )
+        def reconcile_counters(batch_size: int) -> None:
+            """Rebuild the registration counters of the events and report their drift.
+
+            Exits with 1 when counters had drifted.
+            """
+            report = asyncio.run(run_reconcile(batch_size))
+            click.echo(
+                f"{report.events} events checked in {report.elapsed:.2f}s, {report.drifted} drifted"
+            )
+            for counter, drift in report.drift.items():
+                click.echo(f"{counter}: {drift}")
+            if report.drifted:
+                raise SystemExit(1)
+
+        @cli.command(name="load-test")
+        @click.option(
+            "--url",
+            default="http://localhost:8000",
+            show_default=True,
+            help="URL of the running server.",
+        )
+        @click.option(
+            "--rps",
+            type=click.FloatRange(min=0, min_open=True),
+            default=50.0,
+            show_default=True,
+            help="Requests per second of the first stage.",
+        )
+        @click.option(
+            "--step",
+            type=click.FloatRange(min=0),
+            default=0.0,
+            show_default=True,
+            help="Requests per second added at every stage, 0 runs a single stage.",
+        )
+        @click.option(
+            "--stages",
+            type=click.IntRange(min=1),
+            default=10,
+            show_default=True,
+            help="Stages at most when stepping, the test stops at the first saturated one.",
+        )
+        @click.option(
+            "--duration",
+            type=click.FloatRange(min=0, min_open=True),
+            default=30.0,
+            show_default=True,
+            help="Seconds of every stage.",
+        )
+        @click.option(
+            "--mix",
+            callback=parse_mix,
+            help="Weights of the workloads, e.g. browse=40,search=25,detail=25,register=5,cancel=5",
+        )
+        @click.option(
+            "--max-p99-ms",
+            type=click.FloatRange(min=0, min_open=True),
+            default=500.0,
+            show_default=True,
+            help="p99 response time beyond which a stage is saturated.",
+        )
+        @click.option(
+            "--users",
+            type=click.IntRange(min=1),
+            default=20,
+            show_default=True,
+            help="Seeded users logged in to register and cancel.",
+        )
+        @click.option(
+            "--password",
+            default=SEED_PASSWORD,
+            show_default=True,
+            help="Password of these users.",
+        )
+        @click.option(
+            "--max-in-flight",
+            type=click.IntRange(min=1),
+            default=512,
+            show_default=True,
+            help="Requests awaiting a response at once, later ones wait for a slot.",
+        )
+        @click.option(
+            "--timeout",
+            type=click.FloatRange(min=0, min_open=True),
+            default=10.0,
+            show_default=True,
+            help="Seconds before a request fails.",
+        )
+        @click.option("--seed", type=int, default=None, help="Seed of the drawn requests.")
+        @click.option(
+            "--output", type=click.Path(dir_okay=False, path_type=Path), help="JSON results file."
+        )
+        def load_test_server(
+            url: str,
+            rps: float,
+            step: float,
+            stages: int,
+            duration: float,
+            mix: dict[str, float],
+            max_p99_ms: float,
+            users: int,
+            password: str,
+            max_in_flight: int,
+            timeout: float,
+            seed: int | None,
+            output: Path | None,
+        ) -> None:
+            """Replay a weighted mix of traffic against a running server at a target rate.
+
+            Requests are sent open-loop on a fixed schedule and latencies are measured
+            from their scheduled time, so they are free of coordinated omission. With
+            --step the rate grows stage by stage until a stage falls behind its rate,
+            exceeds --max-p99-ms or gets server errors: the last healthy stage is the
+            saturation point of the server.
+            """
+            targets = [rps + step * stage for stage in range(stages if step else 1)]
+            max_p99 = max_p99_ms / 1000
+
+            def report(result: StageResult) -> bool:
+                summary = result.summary()
+                response, service = summary["response_ms"], summary["service_ms"]
+                saturated = result.saturated(max_p99)
+                click.echo(
+                    f"{result.target_rps:>8.1f} rps -> {result.achieved_rps:>8.1f} rps  "
+                    f"response p50 {response['p50']:>8.2f} p99 {response['p99']:>8.2f} "
+                    f"p99.9 {response['p99.9']:>8.2f} ms  service p99 {service['p99']:>8.2f} ms  "
+                    f"errors {result.errors}" + ("  SATURATED" if saturated else "")
+                )
+                return not saturated
+
+            click.echo(f"Load test of {url}, {duration:g}s per stage, mix {mix}")
+            try:
+                results = asyncio.run(
+                    load_generator.run(
+                        url,
+                        targets,
+                        duration,
+                        mix,
+                        users=users,
+                        password=password,
+                        max_in_flight=max_in_flight,
+                        timeout=timeout,
+                        seed=seed,
+                        on_stage=report,
+                    )
+                )
+            except ValueError as e:
+                raise click.ClickException(str(e)) from e
+
+            healthy = [result for result in results if not result.saturated(max_p99)]
+            if step and healthy:
+                click.echo(f"Saturation point: {healthy[-1].target_rps:g} rps")
+            if output is not None:
+                output.write_text(
+                    json.dumps([result.summary() for result in results], indent=2) + "\n"
+                )
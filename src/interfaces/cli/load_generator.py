@@ -0,0 +1,404 @@
+import asyncio
+import random
+import time
+from collections import Counter
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any, Final
+
+import httpx
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.infrastructure.database.config import get_sqlalchemy_config
+from src.infrastructure.database.models import Category, Event, Location, Profile, User
+from src.infrastructure.database.models.event_model import event_registration_open
+
+API: Final[str] = "/api/v1"
+WORKLOADS: Final[tuple[str, ...]] = ("browse", "search", "detail", "register", "cancel")
+DEFAULT_MIX: Final[dict[str, float]] = {
+    "browse": 40,
+    "search": 25,
+    "detail": 25,
+    "register": 5,
+    "cancel": 5,
+}
+PERCENTILES: Final[tuple[float, ...]] = (50, 90, 99, 99.9)
+# Share of the target rate a stage must reach not to be saturated.
+MIN_ACHIEVED_RATIO: Final[float] = 0.95
+# Browsing starts again from the first page once in this many pages.
+BROWSE_RESTART_PAGES: Final[int] = 5
+
+
+@dataclass
+class LoadTestData:
+    """Ids and filters the requests are drawn from, read from the database of the server.
+
+    Attributes:
+        event_ids: Ids of all events, for details
+        open_event_ids: Ids of the events open for registration
+        cities: Cities of the locations, for search
+        category_ids: Ids of the categories, for search
+        usernames: Active users with a profile, logged in to register and cancel
+
+    """
+
+    event_ids: list[int]
+    open_event_ids: list[int]
+    cities: list[str]
+    category_ids: list[int]
+    usernames: list[str]
+
+
+async def read_load_test_data(session: AsyncSession, users: int) -> LoadTestData:
+    """Read the ids and filters of the requests.
+
+    Args:
+        session: Session of the database of the server
+        users: Users logged in to register and cancel
+
+    Returns:
+        Ids and filters of the requests
+
+    Raises:
+        ValueError: If the database has no events
+
+    """
+    event_ids = list(await session.scalars(select(Event.id).order_by(Event.id)))
+    if not event_ids:
+        raise ValueError("The database has no events, seed it first.")
+    return LoadTestData(
+        event_ids=event_ids,
+        open_event_ids=list(
+            await session.scalars(
+                select(Event.id).where(event_registration_open).order_by(Event.id)
+            )
+        ),
+        cities=list(
+            await session.scalars(select(Location.city).distinct().order_by(Location.city))
+        ),
+        category_ids=list(await session.scalars(select(Category.id).order_by(Category.id))),
+        usernames=list(
+            await session.scalars(
+                select(User.username)
+                .join(Profile, Profile.user_id == User.id)
+                .where(User.is_active)
+                .order_by(User.id)
+                .limit(users)
+            )
+        ),
+    )
+
+
+def percentile(values: list[float], rank: float) -> float:
+    """Return the nearest-rank percentile of sorted values, 0 when empty."""
+    if not values:
+        return 0.0
+    index = max(int(len(values) * rank / 100 + 0.5) - 1, 0)
+    return values[min(index, len(values) - 1)]
+
+
+@dataclass
+class StageResult:
+    """Outcome of a stage of the load test at a constant target rate.
+
+    Response times are measured from the time the request was scheduled to be
+    sent, so a server or client falling behind the schedule shows in the
+    latency instead of silently lowering the rate (coordinated omission).
+    Service times are measured from the time the request was actually sent.
+
+    Attributes:
+        target_rps: Requests per second scheduled
+        duration: Seconds of scheduled requests
+        sent: Requests scheduled
+        achieved_rps: Completed requests per second, until the last completion
+        response_times: Sorted response times in seconds
+        service_times: Sorted service times in seconds
+        outcomes: Completed requests by workload and status code, 'error' for transport errors
+        max_lag: Longest delay of the dispatcher behind the schedule, in seconds
+
+    """
+
+    target_rps: float
+    duration: float
+    sent: int = 0
+    achieved_rps: float = 0.0
+    response_times: list[float] = field(default_factory=list)
+    service_times: list[float] = field(default_factory=list)
+    outcomes: Counter[tuple[str, str]] = field(default_factory=Counter)
+    max_lag: float = 0.0
+
+    @property
+    def errors(self) -> int:
+        """Requests answered with a server error or failed in transport."""
+        return sum(
+            count
+            for (_, status), count in self.outcomes.items()
+            if status == "error" or status.startswith("5")
+        )
+
+    def saturated(self, max_p99: float) -> bool:
+        """Tell if the stage fell behind its target rate, exceeded the p99 or got server errors."""
+        return (
+            self.achieved_rps < self.target_rps * MIN_ACHIEVED_RATIO
+            or percentile(self.response_times, 99) > max_p99
+            or self.errors > 0
+        )
+
+    def summary(self) -> dict[str, Any]:
+        """Return the result in a JSON friendly form, latencies in milliseconds."""
+        return {
+            "target_rps": self.target_rps,
+            "achieved_rps": round(self.achieved_rps, 1),
+            "sent": self.sent,
+            "errors": self.errors,
+            "max_lag_ms": round(self.max_lag * 1000, 2),
+            "response_ms": {
+                f"p{rank:g}": round(percentile(self.response_times, rank) * 1000, 2)
+                for rank in PERCENTILES
+            }
+            | {"max": round(max(self.response_times, default=0) * 1000, 2)},
+            "service_ms": {
+                f"p{rank:g}": round(percentile(self.service_times, rank) * 1000, 2)
+                for rank in PERCENTILES
+            },
+            "outcomes": {
+                f"{workload} {status}": count
+                for (workload, status), count in sorted(self.outcomes.items())
+            },
+        }
+
+
+class LoadGenerator:
+    """Open-loop generator of a weighted mix of API traffic against a running server.
+
+    Requests are sent on a fixed schedule whatever the response times, up to
+    max_in_flight at once; requests over the limit wait for a slot and their
+    wait counts in their response time.
+    """
+
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        data: LoadTestData,
+        mix: dict[str, float],
+        rng: random.Random,
+        max_in_flight: int,
+    ) -> None:
+        """Initialize generator.
+
+        Args:
+            client: Client of the server, with its base URL
+            data: Ids and filters of the requests
+            mix: Weights of the workloads
+            rng: Source of the drawn workloads, ids and filters
+            max_in_flight: Requests awaiting a response at once
+
+        """
+        self.client = client
+        self.data = data
+        self.rng = rng
+        self.workloads = [workload for workload, weight in mix.items() if weight > 0]
+        self.weights = [mix[workload] for workload in self.workloads]
+        self.max_in_flight = max_in_flight
+        self.tokens: list[str] = []
+        self._next_cursor: str | None = None
+        self._pages = 0
+        # Registrations made by the run, cancelled by the cancel workload.
+        self._registrations: list[tuple[str, int]] = []
+        self._requests: dict[str, Callable[[], httpx.Request]] = {
+            "browse": self._browse,
+            "search": self._search,
+            "detail": self._detail,
+            "register": self._register,
+            "cancel": self._cancel,
+        }
+
+    async def login(self, password: str) -> None:
+        """Log the users in, their tokens are used to register and cancel.
+
+        Raises:
+            ValueError: If the mix registers or cancels and no user could log in
+
+        """
+        for username in self.data.usernames:
+            response = await self.client.post(
+                f"{API}/auth/login", json={"login": username, "password": password}
+            )
+            if response.is_success:
+                self.tokens.append(response.json()["access_token"])
+        needs_users = {"register", "cancel"} & set(self.workloads)
+        if needs_users and not (self.tokens and self.data.open_event_ids):
+            raise ValueError(
+                "No user could log in or no event is open: the mix can not register or cancel."
+            )
+
+    def _browse(self) -> httpx.Request:
+        """Build the request of the next page of the events list, or of the first one."""
+        self._pages += 1
+        if self._next_cursor is None or self._pages % BROWSE_RESTART_PAGES == 0:
+            return self.client.build_request("GET", f"{API}/events", params={"limit": 20})
+        return self.client.build_request(
+            "GET", f"{API}/events", params={"limit": 20, "cursor": self._next_cursor}
+        )
+
+    def _search(self) -> httpx.Request:
+        """Build a search request by city, category or price range."""
+        params: dict[str, str | int] = self.rng.choice(
+            [
+                {"city": self.rng.choice(self.data.cities)} if self.data.cities else {},
+                {"category_id": self.rng.choice(self.data.category_ids)}
+                if self.data.category_ids
+                else {},
+                {"min_price": 10, "max_price": self.rng.randrange(20, 200)},
+            ]
+        )
+        params |= {"sort": self.rng.choice(["start_date", "price"]), "limit": 20}
+        return self.client.build_request("GET", f"{API}/events/search", params=params)
+
+    def _detail(self) -> httpx.Request:
+        """Build the request of the details of a random event."""
+        return self.client.build_request(
+            "GET", f"{API}/events/{self.rng.choice(self.data.event_ids)}"
+        )
+
+    def _register(self) -> httpx.Request:
+        """Build a registration of a random user for a random open event."""
+        token = self.rng.choice(self.tokens)
+        event_id = self.rng.choice(self.data.open_event_ids)
+        request = self.client.build_request(
+            "POST",
+            f"{API}/events/{event_id}/registrations",
+            headers={"Authorization": f"Bearer {token}"},
+        )
+        request.extensions["registration"] = (token, event_id)
+        return request
+
+    def _cancel(self) -> httpx.Request:
+        """Build the cancellation of a registration of the run, a registration if there is none."""
+        if not self._registrations:
+            return self._register()
+        index = self.rng.randrange(len(self._registrations))
+        self._registrations[index], self._registrations[-1] = (
+            self._registrations[-1],
+            self._registrations[index],
+        )
+        token, event_id = self._registrations.pop()
+        return self.client.build_request(
+            "DELETE",
+            f"{API}/events/{event_id}/registrations",
+            headers={"Authorization": f"Bearer {token}"},
+        )
+
+    async def _send(
+        self,
+        workload: str,
+        request: httpx.Request,
+        scheduled: float,
+        slots: asyncio.Semaphore,
+        result: StageResult,
+    ) -> float:
+        """Send a request and record its response and service times.
+
+        Returns:
+            Completion time, time.perf_counter value
+
+        """
+        async with slots:
+            started = time.perf_counter()
+            try:
+                response = await self.client.send(request)
+            except httpx.HTTPError:
+                status = "error"
+            else:
+                status = str(response.status_code)
+                if workload == "browse" and response.status_code == httpx.codes.OK:
+                    self._next_cursor = response.json().get("next_cursor")
+                elif response.status_code == httpx.codes.CREATED:
+                    self._registrations.append(request.extensions["registration"])
+            completed = time.perf_counter()
+        result.response_times.append(completed - scheduled)
+        result.service_times.append(completed - started)
+        result.outcomes[workload, status] += 1
+        return completed
+
+    async def run_stage(self, rps: float, duration: float) -> StageResult:
+        """Send requests at a constant rate for the duration, then wait for their responses.
+
+        Args:
+            rps: Requests per second
+            duration: Seconds of scheduled requests
+
+        Returns:
+            Response and service times and outcomes of the requests
+
+        """
+        result = StageResult(target_rps=rps, duration=duration, sent=int(rps * duration))
+        slots = asyncio.Semaphore(self.max_in_flight)
+        tasks: list[asyncio.Task[float]] = []
+        started = time.perf_counter()
+        for n in range(result.sent):
+            scheduled = started + n / rps
+            if (delay := scheduled - time.perf_counter()) > 0:
+                await asyncio.sleep(delay)
+            else:
+                result.max_lag = max(result.max_lag, -delay)
+            workload = self.rng.choices(self.workloads, self.weights)[0]
+            request = self._requests[workload]()
+            if request.method == "POST" and workload == "cancel":
+                workload = "register"
+            tasks.append(
+                asyncio.create_task(self._send(workload, request, scheduled, slots, result))
+            )
+        completed = await asyncio.gather(*tasks)
+        elapsed = max(completed, default=started) - started
+        result.achieved_rps = len(completed) / elapsed if elapsed else 0.0
+        result.response_times.sort()
+        result.service_times.sort()
+        return result
+
+
+async def run(
+    base_url: str,
+    stages: list[float],
+    duration: float,
+    mix: dict[str, float],
+    *,
+    users: int,
+    password: str,
+    max_in_flight: int,
+    timeout: float,
+    seed: int | None = None,
+    on_stage: Callable[[StageResult], bool] | None = None,
+) -> list[StageResult]:
+    """Run the stages of a load test against a running server.
+
+    Args:
+        base_url: URL of the server, e.g. http://localhost:8000
+        stages: Target requests per second of the stages, in order
+        duration: Seconds of every stage
+        mix: Weights of the workloads
+        users: Users logged in to register and cancel
+        password: Password of these users
+        max_in_flight: Requests awaiting a response at once
+        timeout: Seconds before a request fails
+        seed: Seed of the drawn requests, None for random ones
+        on_stage: Called with the result of every stage, the test stops when it returns False
+
+    Returns:
+        Results of the stages that ran
+
+    """
+    async with get_sqlalchemy_config().create_session_maker()() as session:
+        data = await read_load_test_data(session, users)
+    limits = httpx.Limits(max_connections=max_in_flight, max_keepalive_connections=max_in_flight)
+    results = []
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=timeout) as client:
+        generator = LoadGenerator(client, data, mix, random.Random(seed), max_in_flight)  # noqa: S311
+        await generator.login(password)
+        for rps in stages:
+            result = await generator.run_stage(rps, duration)
+            results.append(result)
+            if on_stage is not None and not on_stage(result):
+                break
+    return results
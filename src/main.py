@@ -4,9 +4,29 @@ from litestar.config.cors import CORSConfig
 from litestar.logging import LoggingConfig
 from sqladmin import ModelView
 from sqladmin_litestar_plugin import SQLAdminPlugin
+from sqlalchemy import Select
+from starlette.requests import Request
 
-from src.infrastructure.database.config import get_sqlalchemy_config, get_sqlalchemy_plugin
+from src.infrastructure.database.config import (
+    get_engine,
+    get_replica_router,
+    get_sqlalchemy_plugin,
+    warm_up_pools,
+)
 from src.infrastructure.database.models.event_model import Event
+from src.infrastructure.database.replicas import primary_pin_handler_maker
+from src.infrastructure.database.settings import settings
+from src.infrastructure.dependencies.dependencies import (
+    deny_list,
+    event_cache,
+    password_hasher,
+    waitlist_promoter,
+)
+from src.infrastructure.repositories.event import EventLoadProfile, EventRepository
+from src.interfaces.api.controllers.metrics_controller import MetricsController
+from src.interfaces.api.listeners import notify_registration_promoted
+from src.interfaces.api.metrics import MetricsMiddleware, TimedResponse
+from src.interfaces.api.query_timing import QueryTimingMiddleware
 from src.interfaces.api.routes.base_routes import event_router
 from src.interfaces.cli.commands import CLIPlugin
 
@@ -24,6 +44,7 @@ logging_config = LoggingConfig(
         "src.events": {"level": "DEBUG", "propagate": True},
         "src.users": {"level": "INFO", "propagate": True},
         "src.auth": {"level": "WARNING", "propagate": True},
+        "src.queries": {"level": "INFO", "propagate": True},
     },
     log_exceptions="always",
 )
@@ -32,17 +53,35 @@ logging_config = LoggingConfig(
 class EventAdmin(ModelView, model=Event):  # type: ignore
     column_list = [Event.name, Event.price, Event.description]
 
+    def details_query(self, request: Request) -> Select:
+        """Load the event relationships shown on the details page."""
+        options = EventRepository.profile_options(EventLoadProfile.ADMIN)
+        return super().details_query(request).options(*options)
+
 
 sqlalchemy_plugin = get_sqlalchemy_plugin()
-sqlalchemy_config = get_sqlalchemy_config()
-admin = SQLAdminPlugin(engine=sqlalchemy_config.get_engine(), base_url="/admin", views=[EventAdmin])
+replica_router = get_replica_router()
+admin = SQLAdminPlugin(engine=get_engine(), base_url="/admin", views=[EventAdmin])
 app = Litestar(
-    route_handlers=[event_router],
+    route_handlers=[event_router, MetricsController],
     plugins=[sqlalchemy_plugin, admin, CLIPlugin()],
-    debug=True,
+    debug=settings.DEBUG,
     cors_config=cors_config,
     logging_config=logging_config,
+    middleware=[MetricsMiddleware, QueryTimingMiddleware],
+    response_class=TimedResponse,
+    before_send=[primary_pin_handler_maker(settings.DB_PRIMARY_PIN_SECONDS)],
+    listeners=[notify_registration_promoted],
+    on_startup=[warm_up_pools, replica_router.start, deny_list.start, waitlist_promoter.start],
+    on_shutdown=[
+        replica_router.stop,
+        deny_list.stop,
+        waitlist_promoter.stop,
+        event_cache.backend.close,
+        password_hasher.close,
+    ],
 )
 
 if __name__ == "__main__":
+    # Development server, see src/server.py for production.
     uvicorn.run(app, host="127.0.0.1", port=8000, reload=True)
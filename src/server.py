@@ -0,0 +1,87 @@
+import logging
+import os
+import secrets
+from importlib.util import find_spec
+
+import uvicorn
+from uvicorn.config import HTTPProtocolType, LoopSetupType
+
+from src.infrastructure.database.settings import settings
+
+logger = logging.getLogger("src.server")
+
+
+def worker_count() -> int:
+    """Return SERVER_WORKERS, or the CPUs available to the process when it is 0."""
+    if settings.SERVER_WORKERS > 0:
+        return settings.SERVER_WORKERS
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+def event_loop() -> LoopSetupType:
+    """Return the event loop of the settings, uvloop for auto when it is installed."""
+    if settings.SERVER_LOOP == "auto":
+        return "uvloop" if find_spec("uvloop") else "asyncio"
+    return settings.SERVER_LOOP
+
+
+def http_protocol() -> HTTPProtocolType:
+    """Return the HTTP parser of the settings, httptools for auto when it is installed."""
+    if settings.SERVER_HTTP == "auto":
+        return "httptools" if find_spec("httptools") else "h11"
+    return settings.SERVER_HTTP
+
+
+def run() -> None:
+    """Serve the app with the worker processes of the settings, without reloading.
+
+    With several workers the response cache needs the redis backend, the
+    per process one is switched off. Every worker warms up its database pools
+    before it accepts connections. On
+    SIGTERM or SIGINT the workers stop accepting connections, close idle
+    keep-alive connections, give in-flight requests SERVER_GRACEFUL_SHUTDOWN
+    seconds to finish, then close their pools.
+    """
+    workers, loop, http = worker_count(), event_loop(), http_protocol()
+    if not settings.JWT_SECRET and workers > 1:
+        # Workers inherit the environment, tokens issued by one are accepted by all.
+        logger.warning("JWT_SECRET is not set, tokens are signed with a random key of this server")
+        os.environ["JWT_SECRET"] = secrets.token_urlsafe(32)
+    if settings.CACHE_BACKEND == "memory" and workers > 1:
+        # A write only drops the entries of the worker serving it, the others would
+        # keep serving stale bodies and 304s until their entries expire.
+        logger.warning("Response cache is off, several workers require CACHE_BACKEND=redis")
+        os.environ["CACHE_BACKEND"] = "none"
+    logger.info(
+        "Starting %d workers on %s:%d, %s loop, %s parser",
+        workers,
+        settings.SERVER_HOST,
+        settings.SERVER_PORT,
+        loop,
+        http,
+    )
+    uvicorn.run(
+        # Workers import the app themselves, it is passed by name.
+        f"{__package__}.main:app",
+        host=settings.SERVER_HOST,
+        port=settings.SERVER_PORT,
+        workers=workers,
+        loop=loop,
+        http=http,
+        backlog=settings.SERVER_BACKLOG,
+        timeout_keep_alive=settings.SERVER_KEEP_ALIVE,
+        timeout_graceful_shutdown=settings.SERVER_GRACEFUL_SHUTDOWN,
+        limit_concurrency=settings.SERVER_LIMIT_CONCURRENCY,
+        proxy_headers=True,
+        forwarded_allow_ips=settings.SERVER_FORWARDED_ALLOW_IPS,
+        # Requests are logged by the app, see QueryTimingMiddleware.
+        access_log=False,
+    )
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(message)s")
+    run()
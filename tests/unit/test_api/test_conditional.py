@@ -0,0 +1,101 @@
+from datetime import UTC, datetime, timedelta, timezone
+
+import pytest
+from litestar import Request
+from litestar.status_codes import HTTP_304_NOT_MODIFIED
+from litestar.testing import RequestFactory
+
+from src.infrastructure.cache.events import CachedResponse
+from src.interfaces.api.conditional import (
+    conditional_response,
+    is_conditional,
+    is_not_modified,
+    make_etag,
+    validator_headers,
+)
+
+# Naive UTC, as updated_at is stored.
+UPDATED_AT = datetime(2025, 3, 1, 18, 30, 15, 500_000)
+ETAG = make_etag(1, UPDATED_AT)
+
+
+def get(if_none_match: str | None = None, if_modified_since: str | None = None) -> Request:
+    """Build a GET request with the conditional headers given."""
+    headers = {"If-None-Match": if_none_match, "If-Modified-Since": if_modified_since}
+    return RequestFactory().get(
+        "/events/1", headers={name: value for name, value in headers.items() if value is not None}
+    )
+
+
+def test_etag_is_weak_and_follows_its_parts() -> None:
+    """Entity tags are stable for the same parts and change with any of them."""
+    assert ETAG.startswith('W/"')
+    assert make_etag(1, UPDATED_AT) == ETAG
+    assert make_etag(1, UPDATED_AT + timedelta(microseconds=1)) != ETAG
+    assert make_etag("all", UPDATED_AT, 10) != make_etag("all", UPDATED_AT, 9)
+
+
+@pytest.mark.parametrize(
+    "if_none_match",
+    [ETAG, ETAG.removeprefix("W/"), f'"other", {ETAG}', "*"],
+)
+def test_matching_if_none_match_is_not_modified(if_none_match: str) -> None:
+    """Entity tags are compared weakly, in lists too."""
+    assert is_not_modified(get(if_none_match=if_none_match), ETAG, UPDATED_AT)
+
+
+def test_if_none_match_wins_over_if_modified_since() -> None:
+    """A stale entity tag gets the body even with a fresh modification date."""
+    request = get(if_none_match='W/"stale"', if_modified_since="Sat, 01 Mar 2099 00:00:00 GMT")
+
+    assert not is_not_modified(request, ETAG, UPDATED_AT)
+
+
+@pytest.mark.parametrize(
+    ("if_modified_since", "expected"),
+    [
+        ("Sat, 01 Mar 2025 18:30:15 GMT", True),
+        ("Sat, 01 Mar 2025 18:30:14 GMT", False),
+        ("Sat, 01 Mar 2025 19:30:15 +0100", True),
+        ("yesterday", False),
+    ],
+)
+def test_if_modified_since_compares_whole_seconds(if_modified_since: str, expected: bool) -> None:
+    """HTTP dates have no fraction of a second, and any offset is converted to UTC."""
+    assert is_not_modified(get(if_modified_since=if_modified_since), ETAG, UPDATED_AT) is expected
+
+
+def test_if_modified_since_is_ignored_without_a_modification_time() -> None:
+    """Lists are validated by their entity tag alone."""
+    request = get(if_modified_since="Sat, 01 Mar 2099 00:00:00 GMT")
+
+    assert is_conditional(request)
+    assert not is_not_modified(request, ETAG, None)
+    assert not is_conditional(get())
+
+
+def test_validator_headers_send_last_modified_in_gmt() -> None:
+    """Naive times are UTC, aware ones are converted."""
+    aware = UPDATED_AT.replace(tzinfo=UTC).astimezone(timezone(timedelta(hours=3)))
+
+    headers = validator_headers(ETAG, UPDATED_AT)
+    assert headers == {
+        "ETag": ETAG,
+        "Cache-Control": "no-cache",
+        "Last-Modified": "Sat, 01 Mar 2025 18:30:15 GMT",
+    }
+    assert validator_headers(ETAG, aware) == headers
+    assert "Last-Modified" not in validator_headers(ETAG, None)
+
+
+def test_conditional_response_sends_the_body_or_an_empty_304() -> None:
+    """The cached body is sent unless the client copy is still valid."""
+    cached = CachedResponse(body=b'{"id":1}', etag=ETAG, last_modified=UPDATED_AT)
+
+    full = conditional_response(get(), cached)
+    not_modified = conditional_response(get(if_none_match=ETAG), cached)
+
+    # The status of a full response is the default one of the route.
+    assert (full.status_code, full.content) == (None, b'{"id":1}')
+    assert (not_modified.status_code, not_modified.content) == (HTTP_304_NOT_MODIFIED, b"")
+    assert not_modified.headers["ETag"] == ETAG
@@ -0,0 +1,82 @@
+import pytest
+
+from src.infrastructure.cache.lru import LRUCache
+
+
+class Clock:
+    """Monotonic clock moved by hand."""
+
+    def __init__(self) -> None:
+        """Start at zero."""
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        """Return the current time."""
+        return self.now
+
+
+@pytest.fixture
+def clock() -> Clock:
+    """Clock to inject in the caches under test."""
+    return Clock()
+
+
+def test_least_recently_used_entry_is_evicted_first() -> None:
+    """Reading an entry protects it from the next eviction."""
+    cache: LRUCache[str, int] = LRUCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert (cache.get("a"), cache.get("c")) == (1, 3)
+    assert len(cache) == 2
+
+
+def test_setting_a_key_again_replaces_it_without_eviction() -> None:
+    """Updating an entry keeps the other entries."""
+    cache: LRUCache[str, int] = LRUCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.set("a", 10)
+
+    assert (cache.get("a"), cache.get("b")) == (10, 2)
+
+
+def test_entries_expire_after_their_ttl(clock: Clock) -> None:
+    """The cache ttl applies by default, a ttl per entry overrides it."""
+    cache: LRUCache[str, int] = LRUCache(maxsize=10, ttl=10, clock=clock)
+    cache.set("default", 1)
+    cache.set("short", 2, ttl=1)
+    cache.set("long", 3, ttl=100)
+
+    clock.now = 5
+    assert (cache.get("default"), cache.get("short"), cache.get("long")) == (1, None, 3)
+    clock.now = 10
+    assert (cache.get("default"), cache.get("long")) == (None, 3)
+    # Expired entries are dropped when read.
+    assert len(cache) == 1
+
+
+def test_entries_without_ttl_never_expire(clock: Clock) -> None:
+    """A cache without ttl keeps entries until they are evicted."""
+    cache: LRUCache[str, int] = LRUCache(maxsize=10, clock=clock)
+    cache.set("a", 1)
+
+    clock.now = 10**9
+    assert cache.get("a") == 1
+
+
+def test_delete_and_clear() -> None:
+    """Deleting a missing key is not an error."""
+    cache: LRUCache[str, int] = LRUCache(maxsize=10)
+    cache.set("a", 1)
+    cache.set("b", 2)
+
+    cache.delete("a")
+    cache.delete("missing")
+    assert (cache.get("a"), cache.get("b")) == (None, 2)
+    cache.clear()
+    assert len(cache) == 0
@@ -0,0 +1,81 @@
+import pytest
+
+from src.infrastructure.metrics.registry import MetricsRegistry
+
+
+def render(registry: MetricsRegistry) -> list[str]:
+    """Render the registry as lines of the text format."""
+    return registry.render().decode("utf-8").splitlines()
+
+
+def test_counter_and_gauge_samples_by_labels() -> None:
+    """Samples are rendered per label values, after the HELP and TYPE of the family."""
+    registry = MetricsRegistry()
+    requests = registry.counter("requests_total", "Requests.", ("method",))
+    in_flight = registry.gauge("in_flight", "Requests in flight.")
+    requests.inc(("GET",))
+    requests.inc(("GET",))
+    requests.inc(("POST",), amount=0.5)
+    in_flight.inc()
+    in_flight.inc()
+    in_flight.dec()
+
+    assert render(registry) == [
+        "# HELP requests_total Requests.",
+        "# TYPE requests_total counter",
+        'requests_total{method="GET"} 2',
+        'requests_total{method="POST"} 0.5',
+        "# HELP in_flight Requests in flight.",
+        "# TYPE in_flight gauge",
+        "in_flight 1",
+    ]
+
+
+def test_histogram_buckets_are_cumulative() -> None:
+    """Each observation lands in one bucket, the rendered buckets add up to +Inf."""
+    registry = MetricsRegistry()
+    latency = registry.histogram("latency_seconds", "Latency.", ("handler",), buckets=(0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 2.0):
+        latency.observe(value, ("list",))
+
+    assert render(registry)[2:] == [
+        'latency_seconds_bucket{handler="list",le="0.1"} 2',
+        'latency_seconds_bucket{handler="list",le="1.0"} 3',
+        'latency_seconds_bucket{handler="list",le="+Inf"} 4',
+        'latency_seconds_sum{handler="list"} 2.65',
+        'latency_seconds_count{handler="list"} 4',
+    ]
+
+
+def test_callback_metric_is_read_at_scrape_time() -> None:
+    """Callback metrics report the state at every render."""
+    registry = MetricsRegistry()
+    state = {"idle": 3}
+    registry.callback(
+        "pool_connections",
+        "Connections.",
+        "gauge",
+        lambda: [(("idle",), state["idle"])],
+        ("state",),
+    )
+
+    assert render(registry)[2] == 'pool_connections{state="idle"} 3'
+    state["idle"] = 1
+    assert render(registry)[2] == 'pool_connections{state="idle"} 1'
+
+
+def test_label_values_are_escaped() -> None:
+    """Backslashes, quotes and newlines cannot break the text format."""
+    registry = MetricsRegistry()
+    registry.counter("paths_total", "Paths.", ("path",)).inc(('a\\b"c\nd',))
+
+    assert render(registry)[2] == 'paths_total{path="a\\\\b\\"c\\nd"} 1'
+
+
+def test_family_names_are_unique() -> None:
+    """Registering a name twice is a programming error."""
+    registry = MetricsRegistry()
+    registry.counter("requests_total", "Requests.")
+
+    with pytest.raises(ValueError, match="already registered"):
+        registry.gauge("requests_total", "Requests.")
@@ -0,0 +1,45 @@
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+
+from src.infrastructure.repositories.pagination import (
+    InvalidCursorError,
+    decode_cursor,
+    encode_cursor,
+)
+
+
+def test_cursor_round_trips_typed_keyset_values() -> None:
+    """Decoding a cursor gives back the values of the last row with their types."""
+    started = datetime(2025, 3, 1, 18, 30, 15, 250)
+
+    by_date = decode_cursor(encode_cursor(started, 42), tuple[datetime, int])
+    by_price = decode_cursor(encode_cursor(Decimal("19.90"), 7), tuple[Decimal, int])
+
+    assert by_date == (started, 42)
+    assert by_price == (Decimal("19.90"), 7)
+
+
+def test_cursor_is_url_safe_without_padding() -> None:
+    """Cursors go in query strings as they are."""
+    cursor = encode_cursor("ÿÿÿ?>", 1)
+
+    assert "=" not in cursor
+    assert set(cursor) <= set("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-_")
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "not base64 ä",
+        "%%%",
+        encode_cursor("2025-03-01T18:30:00", "x"),
+        encode_cursor(1, 2, 3),
+        encode_cursor(2025, 1)[:-2],
+    ],
+)
+def test_malformed_cursor_is_refused(cursor: str) -> None:
+    """Tampered, truncated or foreign tokens raise InvalidCursorError, never a 500."""
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(cursor, tuple[datetime, int])
@@ -0,0 +1,91 @@
+import asyncio
+from collections.abc import Iterator
+
+import bcrypt
+import pytest
+
+from src.domain.services.password_service import (
+    BCRYPT_MAX_PASSWORD_BYTES,
+    PasswordHasher,
+    PasswordHasherBusyError,
+    hash_rounds,
+)
+
+# Lowest cost bcrypt accepts, keeps the tests fast.
+ROUNDS = 4
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+def anyio_backend() -> str:
+    """Run the tests on asyncio, like the app."""
+    return "asyncio"
+
+
+@pytest.fixture
+def hasher() -> Iterator[PasswordHasher]:
+    """Hasher with two thread workers and a queue of two."""
+    hasher = PasswordHasher(rounds=ROUNDS, workers=2, max_queue=2)
+    yield hasher
+    hasher.close()
+
+
+async def test_hash_verifies_with_bcrypt(hasher: PasswordHasher) -> None:
+    """Hashes are plain bcrypt hashes of the current cost."""
+    hashed = await hasher.hash("s3cret")
+
+    assert bcrypt.checkpw(b"s3cret", hashed.encode())
+    assert hash_rounds(hashed) == ROUNDS
+    assert await hasher.verify("s3cret", hashed)
+    assert not await hasher.verify("wrong", hashed)
+    assert (hasher.stats.hashes, hasher.stats.verifications) == (1, 2)
+
+
+async def test_long_password_is_cut_like_bcrypt_does(hasher: PasswordHasher) -> None:
+    """Passwords longer than bcrypt reads are hashed instead of rejected."""
+    password = "é" * BCRYPT_MAX_PASSWORD_BYTES
+    hashed = await hasher.hash(password)
+
+    assert await hasher.verify(password, hashed)
+    assert await hasher.verify(password + "tail", hashed)
+
+
+async def test_malformed_hash_does_not_verify(hasher: PasswordHasher) -> None:
+    """A stored value that is not a bcrypt hash fails the check instead of raising."""
+    assert not await hasher.verify("s3cret", "plain-text")
+    assert hash_rounds("plain-text") is None
+    assert hash_rounds("$2b$xx$abc") is None
+
+
+async def test_hash_of_another_cost_is_replaced(hasher: PasswordHasher) -> None:
+    """A valid password with a hash of an old cost gets a new hash."""
+    old_hash = bcrypt.hashpw(b"s3cret", bcrypt.gensalt(ROUNDS + 1)).decode()
+
+    valid, new_hash = await hasher.verify_and_update("s3cret", old_hash)
+    assert valid
+    assert new_hash is not None
+    assert hash_rounds(new_hash) == ROUNDS
+    assert await hasher.verify_and_update("s3cret", new_hash) == (True, None)
+    assert await hasher.verify_and_update("wrong", old_hash) == (False, None)
+    assert hasher.stats.rehashes == 1
+
+
+async def test_dummy_check_always_fails(hasher: PasswordHasher) -> None:
+    """Unknown users are checked against a dummy hash that nothing matches."""
+    assert not await hasher.verify_dummy("")
+    assert not await hasher.verify_dummy("s3cret")
+
+
+async def test_requests_beyond_the_queue_fail_fast(hasher: PasswordHasher) -> None:
+    """With every worker busy and the queue full, the next request is rejected."""
+    results = await asyncio.gather(
+        *(hasher.hash("s3cret") for _ in range(5)), return_exceptions=True
+    )
+
+    rejected = [result for result in results if isinstance(result, PasswordHasherBusyError)]
+    # Two requests take the workers, two wait in the queue.
+    assert len(rejected) == 1
+    assert hasher.stats.rejected == 1
+    assert hasher.stats.max_waiting == 2
+    assert (hasher.stats.waiting, hasher.stats.in_flight) == (0, 0)
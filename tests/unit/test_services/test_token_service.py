@@ -0,0 +1,123 @@
+import base64
+import hashlib
+import hmac
+import json
+import time
+
+import pytest
+
+from src.domain.services.token_service import MAX_TOKEN_LENGTH, TokenError, TokenService
+from src.infrastructure.database.models import User
+
+KEY = "test-key"
+ISSUER = "devevents-test"
+HEADER = {"alg": "HS256", "typ": "JWT"}
+
+
+def b64url(data: bytes) -> str:
+    """Encode unpadded base64url, as JWT segments are."""
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
+
+
+def unb64url(segment: str) -> bytes:
+    """Decode an unpadded base64url segment."""
+    return base64.urlsafe_b64decode(segment + "=" * (-len(segment) % 4))
+
+
+def sign(claims: dict[str, object], header: dict[str, str] = HEADER, key: str = KEY) -> str:
+    """Build an HS256 token like a JWT library serializing compact JSON."""
+    segments = [
+        b64url(json.dumps(part, separators=(",", ":")).encode()) for part in (header, claims)
+    ]
+    signing_input = ".".join(segments)
+    signature = hmac.new(key.encode(), signing_input.encode(), hashlib.sha256).digest()
+    return f"{signing_input}.{b64url(signature)}"
+
+
+def claims(**overrides: object) -> dict[str, object]:
+    """Claims of a valid token of user 3, with overrides."""
+    now = int(time.time())
+    return {"sub": "3", "username": "bob", "iss": ISSUER, "iat": now, "exp": now + 60} | overrides
+
+
+@pytest.fixture
+def service() -> TokenService:
+    """Token service with a small cache of verified tokens."""
+    return TokenService(secret=KEY, issuer=ISSUER, ttl=60, cache_size=8)
+
+
+def test_issued_token_is_a_standard_hs256_jwt(service: TokenService) -> None:
+    """The signature is a plain HMAC-SHA256 of the first two segments."""
+    header, payload, signature = service.issue(User(id=7, username="alice")).split(".")
+
+    expected = hmac.new(KEY.encode(), f"{header}.{payload}".encode(), hashlib.sha256).digest()
+    assert unb64url(signature) == expected
+    assert json.loads(unb64url(header)) == HEADER
+    issued = json.loads(unb64url(payload))
+    assert (issued["sub"], issued["username"], issued["iss"]) == ("7", "alice", ISSUER)
+    assert issued["exp"] - issued["iat"] == 60
+
+
+def test_token_signed_elsewhere_with_the_key_verifies(service: TokenService) -> None:
+    """Tokens are interoperable with other HS256 implementations."""
+    verified = service.verify(sign(claims()))
+
+    assert (verified.user_id, verified.username) == (3, "bob")
+
+
+@pytest.mark.parametrize(
+    "token",
+    [
+        sign(claims(), key="other-key"),
+        sign(claims(iss="someone-else")),
+        sign(claims(exp=int(time.time()) - 1)),
+        sign(claims(), header={"alg": "none", "typ": "JWT"}),
+        sign(claims(sub=3)),
+        "not-a-token",
+        "a.b.c.d",
+        "é.b.c",
+    ],
+    ids=["key", "issuer", "expired", "alg", "claims", "segments", "extra", "non-ascii"],
+)
+def test_invalid_token_is_refused(service: TokenService, token: str) -> None:
+    """Forged, foreign, expired and malformed tokens raise TokenError."""
+    with pytest.raises(TokenError):
+        service.verify(token)
+
+
+def test_tampered_payload_is_refused(service: TokenService) -> None:
+    """Changing the claims of a signed token breaks its signature."""
+    header, _, signature = sign(claims()).split(".")
+    payload = b64url(json.dumps(claims(sub="1"), separators=(",", ":")).encode())
+
+    with pytest.raises(TokenError, match="signature"):
+        service.verify(f"{header}.{payload}.{signature}")
+
+
+def test_other_spellings_of_a_signature_are_refused(service: TokenService) -> None:
+    """Characters outside the alphabet or unused bits cannot make a second valid token."""
+    token = sign(claims())
+    head, last = token[:-1], token[-1]
+    # The last character of a 32 byte signature carries 2 unused bits.
+    alphabet = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-_"
+    same_bits = alphabet[alphabet.index(last) ^ 1]
+
+    service.verify(token)
+    for spelling in (token + "!", token + "=", f"{head}{same_bits}", token.replace(".", ".\n", 2)):
+        with pytest.raises(TokenError):
+            service.verify(spelling)
+
+
+def test_too_long_token_is_refused_before_decoding(service: TokenService) -> None:
+    """Oversized tokens are refused without a signature check."""
+    with pytest.raises(TokenError, match="too long"):
+        service.verify("a" * (MAX_TOKEN_LENGTH + 1))
+    assert service.stats.misses == 0
+
+
+def test_verified_token_is_served_from_the_cache(service: TokenService) -> None:
+    """A token sent again skips the signature check."""
+    token = sign(claims())
+
+    assert service.verify(token) == service.verify(token)
+    assert (service.stats.hits, service.stats.misses) == (1, 1)